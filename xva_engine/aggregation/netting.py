@@ -0,0 +1,156 @@
+from typing import Dict, List, Mapping, Optional, Sequence
+import numpy as np
+from scipy import sparse
+from ..core.cube import ExposureCube, allocate_cube_array
+
+
+def _membership_matrix(keys: Sequence[str], mapping: Mapping[str, str], groups: List[str]) -> sparse.csr_matrix:
+    """0/1 matrix of shape ``(len(keys), len(groups))`` with ``M[i, j] = 1`` if ``mapping[keys[i]] == groups[j]``."""
+    position = {g: j for j, g in enumerate(groups)}
+    try:
+        cols = np.array([position[mapping[k]] for k in keys], dtype=np.intp)
+    except KeyError as exc:
+        raise KeyError(f"{exc.args[0]} has no entry in the netting mapping") from exc
+    rows = np.arange(len(keys), dtype=np.intp)
+    return sparse.csr_matrix(
+        (np.ones(len(keys)), (rows, cols)), shape=(len(keys), len(groups))
+    )
+
+
+class NettingSetAggregator:
+    """
+    Net trade-level exposures into netting sets and counterparties.
+
+    Parameters
+    ----------
+    trade_to_netting_set : mapping
+        Trade id -> netting set id.
+    netting_set_to_counterparty : mapping, optional
+        Netting set id -> counterparty id. Required for
+        :meth:`counterparty_profiles`.
+
+    Notes
+    -----
+    Trade values are additive inside a netting set, so netting is a sum of
+    trade columns. It is done as a sparse ``(n_trades, n_netting_sets)``
+    0/1 matrix product per scenario block: the trade-level cube is only
+    read, never copied, and the netting-set cube (``trades`` axis holding
+    netting set ids) is what collateral and XVA run on. Exposures of
+    different netting sets are not netted against each other, so
+    counterparty profiles are sums of netting-set profiles (positive parts
+    taken first).
+    """
+
+    def __init__(
+        self,
+        trade_to_netting_set: Mapping[str, str],
+        netting_set_to_counterparty: Optional[Mapping[str, str]] = None,
+    ):
+        self.trade_to_netting_set = dict(trade_to_netting_set)
+        self.netting_set_to_counterparty = (
+            dict(netting_set_to_counterparty) if netting_set_to_counterparty is not None else None
+        )
+        # preserve first-appearance order of ids
+        self.netting_sets: List[str] = list(dict.fromkeys(self.trade_to_netting_set.values()))
+        self.counterparties: List[str] = (
+            list(dict.fromkeys(self.netting_set_to_counterparty[ns] for ns in self.netting_sets))
+            if self.netting_set_to_counterparty is not None
+            else []
+        )
+        self._trade_matrices: Dict[tuple, sparse.csr_matrix] = {}
+
+    def trade_matrix(self, trades: Sequence[str]) -> sparse.csr_matrix:
+        """
+        Sparse trade -> netting set matrix for a given trade column order.
+
+        Returns
+        -------
+        scipy.sparse.csr_matrix
+            Shape ``(n_trades, n_netting_sets)``.
+        """
+        key = tuple(trades)
+        matrix = self._trade_matrices.get(key)
+        if matrix is None:
+            matrix = _membership_matrix(trades, self.trade_to_netting_set, self.netting_sets)
+            self._trade_matrices[key] = matrix
+        return matrix
+
+    def counterparty_matrix(self) -> sparse.csr_matrix:
+        """
+        Sparse netting set -> counterparty matrix.
+
+        Returns
+        -------
+        scipy.sparse.csr_matrix
+            Shape ``(n_netting_sets, n_counterparties)``.
+        """
+        if self.netting_set_to_counterparty is None:
+            raise ValueError("No netting set -> counterparty mapping was given.")
+        return _membership_matrix(self.netting_sets, self.netting_set_to_counterparty, self.counterparties)
+
+    def aggregate(
+        self,
+        cube: ExposureCube,
+        block_size: Optional[int] = None,
+        out_path: Optional[str] = None,
+    ) -> ExposureCube:
+        """
+        Reduce a trade-level cube to a netting-set-level cube.
+
+        Parameters
+        ----------
+        cube : ExposureCube
+            Trade values, shape ``(n_scenarios, n_times, n_trades)``.
+        block_size : int, optional
+            Number of scenarios reduced at a time.
+        out_path : str, optional
+            If given, the netting-set cube is written to a memory-mapped
+            ``.npy`` file at this path.
+
+        Returns
+        -------
+        ExposureCube
+            Netting-set values of shape
+            ``(n_scenarios, n_times, n_netting_sets)``; its ``trades`` are
+            the netting set ids.
+        """
+        n_scenarios, n_times, n_trades = cube.data.shape
+        # transpose once so the product is (n_ns, n_trades) @ (n_trades, n)
+        reduce = self.trade_matrix(cube.trades).T.tocsr()
+        n_sets = reduce.shape[0]
+
+        data = allocate_cube_array((n_scenarios, n_times, n_sets), dtype=cube.data.dtype, path=out_path)
+        for sl, block in cube.iter_blocks(axis="scenario", size=block_size):
+            flat = np.reshape(block, (-1, n_trades))
+            data[sl] = (reduce @ flat.T).T.reshape(-1, n_times, n_sets)
+
+        return ExposureCube(
+            data=data,
+            scenarios=cube.scenarios,
+            time_grid=cube.time_grid,
+            trades=list(self.netting_sets),
+        )
+
+    def counterparty_profiles(self, profile: np.ndarray) -> np.ndarray:
+        """
+        Sum netting-set profiles per counterparty.
+
+        Parameters
+        ----------
+        profile : numpy.ndarray
+            Netting-set profile (e.g. EE) of shape
+            ``(n_times, n_netting_sets)``, as returned by
+            `ExposureMetrics.compute_EE` on an aggregated cube.
+
+        Returns
+        -------
+        numpy.ndarray
+            Counterparty profiles of shape ``(n_counterparties, n_times)``,
+            the layout expected by `XVAEngine.compute_CVA_batch`.
+        """
+        profile = np.asarray(profile, dtype=float)
+        if profile.ndim != 2 or profile.shape[1] != len(self.netting_sets):
+            raise ValueError(
+                f"profile must have shape (n_times, {len(self.netting_sets)}); got {profile.shape}"
+            )
+        return np.asarray(self.counterparty_matrix().T @ profile.T)
@@ -3,7 +3,21 @@ from dataclasses import dataclass
 
 @dataclass
 class CSA:
-    """CSA terms for collateralisation."""
+    """
+    CSA terms for collateralisation.
+
+    Parameters
+    ----------
+    threshold_bank, threshold_counterparty : float
+        Unsecured exposure each party may run before it has to post.
+    mta_bank, mta_counterparty : float
+        Minimum transfer amount for deliveries by each party.
+    rounding_bank, rounding_counterparty : float
+        Transfers by each party are rounded to a multiple of this unit,
+        up for deliveries and down for returns (``0`` for no rounding).
+    mpor_days : int
+        Margin period of risk in calendar days.
+    """
     threshold_bank: float
     threshold_counterparty: float
     mta_bank: float
@@ -1,6 +1,7 @@
+from typing import Optional, Sequence, Union
 import numpy as np
 from .csa import CSA
-from ..core.cube import ExposureCube
+from ..core.cube import ExposureCube, allocate_cube_array
 
 
 class CollateralEngine:
@@ -10,34 +11,107 @@ class CollateralEngine:
 
     Notes
     -----
-    The implementation here is a simplified example for demonstration:
-    - Zero thresholds
-    - Zero MTA
-    - Margining at each time step
-    - Collateral posted by the counterparty is equal to the negative
-      exposure (fully collateralised against negative exposure).
+    Variation margin only. Each cube column is treated as a netting set
+    with its own CSA (or all columns share one). Values are from the
+    bank's point of view and collateral balances are positive when the
+    bank holds collateral posted by the counterparty.
+
+    On every margin date the required balance is the value in excess of
+    the threshold of the posting party,
+    ``max(V - TH_cpty, 0) + min(V + TH_bank, 0)``. A transfer to reach it
+    is made only if it is at least the MTA of the delivering party, and
+    the transferred amount is rounded to that party's rounding unit: up
+    for a delivery of collateral, down for a return of collateral.
+    The collateral available at time ``t`` is the balance agreed on the
+    last margin date on or before ``t - MPOR`` (the margin period of
+    risk, ``mpor_days / 365`` years). Before the first such margin date
+    no collateral has been exchanged and the exposure is uncollateralised.
     """
 
-    def apply_csa(self, exposure: ExposureCube, csa: CSA) -> ExposureCube:
+    def apply_csa(
+        self,
+        exposure: ExposureCube,
+        csa: Union[CSA, Sequence[CSA]],
+        block_size: Optional[int] = None,
+        out_path: Optional[str] = None,
+        margin_times: Optional[Sequence[float]] = None,
+        time_tolerance: float = 1e-9,
+    ) -> ExposureCube:
         """
-        Apply a simplified CSA to the given exposure cube.
+        Apply CSA variation margining to the given exposure cube.
 
         Parameters
         ----------
         exposure : ExposureCube
-            Uncollateralised trade/portfolio values.
-        csa : CSA
-            CSA terms. Only used for documentation in this toy implementation.
+            Uncollateralised netting-set values, shape
+            ``(n_scenarios, n_times, n_cols)``.
+        csa : CSA or sequence of CSA
+            CSA terms, shared by all columns or one per column.
+        block_size : int, optional
+            Number of scenarios processed at a time. ``None`` processes
+            the whole cube in one block.
+        out_path : str, optional
+            If given, the collateralised cube is written to a
+            memory-mapped ``.npy`` file at this path.
+        margin_times : sequence of float, optional
+            Margin call dates, a subset of the exposure time grid. Defaults
+            to every grid time.
+        time_tolerance : float
+            Tolerance for matching margin dates to grid times.
 
         Returns
         -------
         ExposureCube
-            Collateralised exposure cube.
+            Collateralised values ``V(t) - C(t)``, same shape as the input.
+
+        Notes
+        -----
+        The collateral balance is path dependent; it is computed as a
+        recurrence over margin dates only, with each step updating all
+        scenarios of the block and all netting sets at once.
         """
-        data = exposure.data.copy()
-        # Collateral from the bank POV: if exposure < 0, we hold collateral from cpty
-        # so effective exposure = max(exposure, 0).
-        data_collateralised = np.maximum(data, 0.0)
+        n_scenarios, n_times, n_cols = exposure.data.shape
+        times = exposure.time_grid.as_array()
+
+        csas = [csa] * n_cols if isinstance(csa, CSA) else list(csa)
+        if len(csas) != n_cols:
+            raise ValueError(f"Got {len(csas)} CSAs for {n_cols} netting sets.")
+        terms = {
+            name: np.array([getattr(c, name) for c in csas], dtype=float)
+            for name in (
+                "threshold_bank", "threshold_counterparty",
+                "mta_bank", "mta_counterparty",
+                "rounding_bank", "rounding_counterparty",
+                "mpor_days",
+            )
+        }
+
+        if margin_times is None:
+            margin_idx = np.arange(n_times)
+        else:
+            mt = np.asarray(margin_times, dtype=float)
+            margin_idx = np.clip(np.searchsorted(times, mt - time_tolerance), 0, n_times - 1)
+            off_grid = np.abs(times[margin_idx] - mt) > time_tolerance
+            if np.any(off_grid):
+                raise ValueError(f"Margin time {mt[off_grid][0]} not found in time grid.")
+            if np.any(np.diff(margin_idx) <= 0):
+                raise ValueError("margin_times must be strictly increasing.")
+        margin_grid = times[margin_idx]
+
+        # index of the margin date whose balance is available at each time
+        lagged = times[:, None] - terms["mpor_days"][None, :] / 365.0  # (n_times, n_cols)
+        lag_idx = np.searchsorted(margin_grid, lagged.ravel() + time_tolerance, side="right") - 1
+        lag_idx = lag_idx.reshape(n_times, n_cols)
+        # no margin call settled yet: zero balance rather than a future call's
+        settled = lag_idx >= 0
+        lag_idx = np.maximum(lag_idx, 0)
+
+        data_collateralised = allocate_cube_array(exposure.data.shape, dtype=exposure.data.dtype, path=out_path)
+        for sl, block in exposure.iter_blocks(axis="scenario", size=block_size):
+            balance = self._margin_balances(np.asarray(block[:, margin_idx, :], dtype=float), terms)
+            collateral = np.take_along_axis(balance, lag_idx[None, :, :], axis=1)
+            collateral *= settled
+            np.subtract(block, collateral, out=data_collateralised[sl])
 
         return ExposureCube(
             data=data_collateralised,
@@ -45,3 +119,46 @@ class CollateralEngine:
             time_grid=exposure.time_grid,
             trades=exposure.trades,
         )
+
+    @staticmethod
+    def _margin_balances(values: np.ndarray, terms: dict) -> np.ndarray:
+        """
+        Collateral balance after each margin call.
+
+        Parameters
+        ----------
+        values : numpy.ndarray
+            Netting-set values on margin dates, shape
+            ``(n_block, n_margin, n_cols)``.
+        terms : dict
+            CSA terms as arrays of shape ``(n_cols,)``.
+
+        Returns
+        -------
+        numpy.ndarray
+            Balances of shape ``(n_block, n_margin, n_cols)``.
+        """
+        th_b, th_c = terms["threshold_bank"], terms["threshold_counterparty"]
+        mta_b, mta_c = terms["mta_bank"], terms["mta_counterparty"]
+        rnd_b, rnd_c = terms["rounding_bank"], terms["rounding_counterparty"]
+
+        balances = np.empty_like(values)
+        held = np.zeros((values.shape[0], values.shape[2]))
+        for k in range(values.shape[1]):
+            v = values[:, k, :]
+            required = np.maximum(v - th_c, 0.0) + np.minimum(v + th_b, 0.0)
+            delta = required - held
+
+            # counterparty delivers when delta > 0, bank delivers otherwise
+            cpty_delivers = delta > 0.0
+            mta = np.where(cpty_delivers, mta_c, mta_b)
+            rounding = np.where(cpty_delivers, rnd_c, rnd_b)
+            # deliveries (towards the required side) round up, returns round down,
+            # so an unchanged value does not flip the balance between two units
+            units = np.abs(delta) / np.where(rounding > 0.0, rounding, 1.0)
+            units = np.where(delta * required > 0.0, np.ceil(units), np.floor(units))
+            amount = np.where(rounding > 0.0, units * rounding, np.abs(delta))
+            transfer = (np.abs(delta) >= mta) & (delta != 0.0)
+            held = held + np.where(transfer, np.sign(delta) * amount, 0.0)
+            balances[:, k, :] = held
+        return balances
@@ -16,6 +16,7 @@ class SimulationConfig:
     n_steps: int
     models: List[Dict[str, Any]]  # list of model configs
     correlation: Dict[str, Any]
+    dtype: str = "float64"  # storage type of the simulated cube, e.g. "float32"
 
 
 @dataclass
@@ -1,9 +1,68 @@
-from dataclasses import dataclass
-from typing import List, Any
+from dataclasses import dataclass, replace
+from typing import List, Any, Iterator, Optional, Tuple, Union
+import json
+import os
 import numpy as np
 from .time_grid import TimeGrid
 
 
+_BLOCK_AXES = {"scenario": 0, "time": 1}
+
+
+def allocate_cube_array(
+    shape: Tuple[int, ...],
+    dtype: Any = float,
+    path: Optional[str] = None,
+) -> np.ndarray:
+    """
+    Allocate a zero-initialised backing array for a scenario cube.
+
+    Parameters
+    ----------
+    shape : tuple of int
+        Cube shape, typically ``(n_scenarios, n_times, n_columns)``.
+    dtype : data-type, optional
+        Element type of the array. Defaults to ``float64``.
+    path : str, optional
+        If given, the array is stored on disk as a ``.npy`` file and
+        returned as a writable ``numpy.memmap``. Otherwise a regular
+        in-memory array is returned.
+
+    Returns
+    -------
+    numpy.ndarray
+        Array of the requested shape. With C ordering, each scenario
+        block ``data[i:j]`` is a contiguous region of the file, so
+        scenario-block streaming only pages in the block being read.
+
+    Notes
+    -----
+    The on-disk layout is a plain ``.npy`` file and can be reopened with
+    ``numpy.load(path, mmap_mode="r")``.
+    """
+    if path is None:
+        return np.zeros(shape, dtype=dtype)
+    return np.lib.format.open_memmap(path, mode="w+", dtype=dtype, shape=tuple(shape))
+
+
+def _iter_blocks(data: np.ndarray, axis: str, size: Optional[int]) -> Iterator[Tuple[slice, np.ndarray]]:
+    if axis not in _BLOCK_AXES:
+        raise ValueError(f"axis must be one of {sorted(_BLOCK_AXES)}; got {axis!r}")
+    ax = _BLOCK_AXES[axis]
+    n = data.shape[ax]
+    if size is None:
+        size = max(n, 1)
+    if size <= 0:
+        raise ValueError("Block size must be a positive integer.")
+
+    for start in range(0, n, size):
+        sl = slice(start, min(start + size, n))
+        if ax == 0:
+            yield sl, data[sl]
+        else:
+            yield sl, data[:, sl]
+
+
 @dataclass
 class RiskFactorCube:
     """
@@ -13,7 +72,8 @@ class RiskFactorCube:
     ----------
     data : numpy.ndarray
         Array of shape ``(n_scenarios, n_times, n_factors)`` containing
-        the simulated risk factor values.
+        the simulated risk factor values. May be a ``numpy.memmap``
+        (see :func:`allocate_cube_array`) for cubes that do not fit in RAM.
     scenarios : list
         Scenario identifiers. Typically integers ``0 .. n_scenarios-1``.
     time_grid : TimeGrid
@@ -32,6 +92,51 @@ class RiskFactorCube:
     time_grid: TimeGrid
     factors: List[str]
 
+    def iter_blocks(
+        self,
+        axis: str = "scenario",
+        size: Optional[int] = None,
+    ) -> Iterator[Tuple[slice, np.ndarray]]:
+        """
+        Iterate over the cube in blocks along one axis.
+
+        Parameters
+        ----------
+        axis : {"scenario", "time"}
+            Axis along which blocks are cut.
+        size : int, optional
+            Number of scenarios (or times) per block. ``None`` yields the
+            whole cube as a single block.
+
+        Yields
+        ------
+        (slice, numpy.ndarray)
+            The slice along ``axis`` and the corresponding view of ``data``.
+            No copy is made; for memory-mapped cubes only the block is read.
+        """
+        return _iter_blocks(self.data, axis, size)
+
+    @property
+    def dtype(self) -> np.dtype:
+        """Element type of ``data`` (float64, or float32 for compact cubes)."""
+        return self.data.dtype
+
+    def scenario_block(self, sl: slice) -> "RiskFactorCube":
+        """
+        Return a view of the cube restricted to a block of scenarios.
+
+        Parameters
+        ----------
+        sl : slice
+            Scenario slice, as yielded by :meth:`iter_blocks`.
+
+        Returns
+        -------
+        RiskFactorCube
+            Cube sharing ``data`` with ``self`` (no copy).
+        """
+        return replace(self, data=self.data[sl], scenarios=self.scenarios[sl])
+
 
 @dataclass
 class ExposureCube:
@@ -43,6 +148,7 @@ class ExposureCube:
     data : numpy.ndarray
         Array of shape ``(n_scenarios, n_times, n_trades)`` containing
         the discounted value of each trade along each scenario and time.
+        May be a ``numpy.memmap`` (see :func:`allocate_cube_array`).
     scenarios : list
         Scenario identifiers.
     time_grid : TimeGrid
@@ -59,3 +165,90 @@ class ExposureCube:
     scenarios: List[Any]
     time_grid: TimeGrid
     trades: List[str]
+
+    def iter_blocks(
+        self,
+        axis: str = "scenario",
+        size: Optional[int] = None,
+    ) -> Iterator[Tuple[slice, np.ndarray]]:
+        """
+        Iterate over the cube in blocks along one axis.
+
+        See :meth:`RiskFactorCube.iter_blocks`.
+        """
+        return _iter_blocks(self.data, axis, size)
+
+    @property
+    def dtype(self) -> np.dtype:
+        """Element type of ``data`` (float64, or float32 for compact cubes)."""
+        return self.data.dtype
+
+
+_CUBE_DATA_FILE = "data.npy"
+_CUBE_META_FILE = "meta.json"
+
+
+def save_cube(cube: Union[RiskFactorCube, ExposureCube], path: str) -> None:
+    """
+    Persist a cube to a directory.
+
+    Parameters
+    ----------
+    cube : RiskFactorCube or ExposureCube
+        Cube to save.
+    path : str
+        Target directory, created if needed. It receives ``data.npy``
+        (the raw array) and ``meta.json`` (cube type, scenarios, time
+        grid and column labels).
+
+    Notes
+    -----
+    Scenario identifiers and column labels must be JSON serialisable.
+    """
+    os.makedirs(path, exist_ok=True)
+    if isinstance(cube, RiskFactorCube):
+        kind, columns = "risk_factor", list(cube.factors)
+    elif isinstance(cube, ExposureCube):
+        kind, columns = "exposure", list(cube.trades)
+    else:
+        raise TypeError(f"Unsupported cube type: {type(cube).__name__}")
+
+    np.save(os.path.join(path, _CUBE_DATA_FILE), cube.data)
+    scenarios = cube.scenarios.tolist() if isinstance(cube.scenarios, np.ndarray) else list(cube.scenarios)
+    meta = {
+        "kind": kind,
+        "scenarios": scenarios,
+        "times": [float(t) for t in cube.time_grid.times],
+        "columns": columns,
+    }
+    with open(os.path.join(path, _CUBE_META_FILE), "w", encoding="utf-8") as f:
+        json.dump(meta, f)
+
+
+def load_cube(path: str, mmap_mode: Optional[str] = "r") -> Union[RiskFactorCube, ExposureCube]:
+    """
+    Load a cube written by :func:`save_cube`.
+
+    Parameters
+    ----------
+    path : str
+        Directory passed to :func:`save_cube`.
+    mmap_mode : {"r", "r+", "c", None}
+        Memory-map mode for the data array (see ``numpy.load``). Use
+        ``"r+"`` to update the cube on disk in place, ``None`` to read it
+        fully into memory.
+
+    Returns
+    -------
+    RiskFactorCube or ExposureCube
+        Cube of the type that was saved.
+    """
+    with open(os.path.join(path, _CUBE_META_FILE), "r", encoding="utf-8") as f:
+        meta = json.load(f)
+    data = np.load(os.path.join(path, _CUBE_DATA_FILE), mmap_mode=mmap_mode)
+    time_grid = TimeGrid(meta["times"])
+    if meta["kind"] == "risk_factor":
+        return RiskFactorCube(data=data, scenarios=meta["scenarios"], time_grid=time_grid, factors=meta["columns"])
+    if meta["kind"] == "exposure":
+        return ExposureCube(data=data, scenarios=meta["scenarios"], time_grid=time_grid, trades=meta["columns"])
+    raise ValueError(f"Unknown cube kind {meta['kind']!r} in {path}")
@@ -11,3 +11,30 @@ class Instrument(ABC):
     def get_cashflows(self):
         """Return a representation of cashflows (to be defined)."""
         raise NotImplementedError
+
+    def path_cashflows(self, cube):
+        """
+        Cashflows paid on each simulated path.
+
+        Parameters
+        ----------
+        cube : RiskFactorCube
+            Simulated risk factors.
+
+        Returns
+        -------
+        numpy.ndarray
+            Undiscounted amounts of shape ``(n_scenarios, n_times)``;
+            entry ``[s, i]`` is paid at ``cube.time_grid`` date ``i`` on
+            path ``s``. Needed by path-based engines such as LSMC.
+        """
+        raise NotImplementedError
+
+    def exercise_values(self, cube):
+        """
+        Undiscounted amounts received on early exercise, shape
+        ``(n_scenarios, n_times)``, NaN where exercise is not allowed;
+        ``None`` (default) for trades without exercise rights. Exercising
+        replaces all cashflows from that date on.
+        """
+        return None
@@ -1,7 +1,34 @@
 from dataclasses import dataclass
+from typing import Sequence
+import numpy as np
 from .base import Instrument
 
 
+_TIME_TOLERANCE = 1e-6
+
+
+def _factor_paths(cube, name: str) -> np.ndarray:
+    """Paths of factor ``name``, shape ``(n_scenarios, n_times)``."""
+    try:
+        idx = cube.factors.index(name)
+    except ValueError as exc:
+        raise KeyError(f"Factor {name} not in cube.factors") from exc
+    return np.asarray(cube.data[:, :, idx], dtype=float)
+
+
+def _time_index(times: np.ndarray, t: float) -> int:
+    """Index of the grid date ``t`` (within ``_TIME_TOLERANCE``)."""
+    i = int(np.searchsorted(times, t - _TIME_TOLERANCE, side="left"))
+    if i >= times.size or abs(times[i] - t) > _TIME_TOLERANCE:
+        raise ValueError(f"Time {t} not found in time grid (tolerance={_TIME_TOLERANCE}).")
+    return i
+
+
+def _intrinsic(spot: np.ndarray, strike: float, option_type: str) -> np.ndarray:
+    sign = 1.0 if option_type.lower() == "call" else -1.0
+    return np.maximum(sign * (spot - strike), 0.0)
+
+
 @dataclass
 class EuropeanOption(Instrument):
     """
@@ -43,3 +70,116 @@ class EuropeanOption(Instrument):
             "maturity": self.maturity,
             "option_type": self.option_type,
         }
+
+    def path_cashflows(self, cube) -> np.ndarray:
+        """Payoff at the maturity date (which must be on the cube grid)."""
+        spot = _factor_paths(cube, self.underlying)
+        out = np.zeros_like(spot)
+        i = _time_index(cube.time_grid.as_array(), self.maturity)
+        out[:, i] = _intrinsic(spot[:, i], self.strike, self.option_type)
+        return out
+
+
+@dataclass
+class AsianOption(Instrument):
+    """
+    Arithmetic-average option, paid at maturity.
+
+    Parameters
+    ----------
+    id : str
+        Trade identifier.
+    underlying : str
+        Name of the underlying risk factor.
+    strike : float
+        Strike on the average.
+    maturity : float
+        Payment date (year fraction), on the cube grid.
+    option_type : str
+        Either ``"call"`` or ``"put"``.
+    averaging_start : float
+        The average is taken over the cube dates in
+        ``(averaging_start, maturity]``.
+    """
+
+    underlying: str
+    strike: float
+    maturity: float
+    option_type: str = "call"
+    averaging_start: float = 0.0
+
+    def get_cashflows(self):
+        return {
+            "type": "asian_option",
+            "underlying": self.underlying,
+            "strike": self.strike,
+            "maturity": self.maturity,
+            "option_type": self.option_type,
+            "averaging_start": self.averaging_start,
+        }
+
+    def path_cashflows(self, cube) -> np.ndarray:
+        spot = _factor_paths(cube, self.underlying)
+        times = cube.time_grid.as_array()
+        i = _time_index(times, self.maturity)
+        window = times[: i + 1] > self.averaging_start + _TIME_TOLERANCE
+        if not np.any(window):
+            raise ValueError(f"No averaging dates in ({self.averaging_start}, {self.maturity}].")
+        out = np.zeros_like(spot)
+        out[:, i] = _intrinsic(spot[:, : i + 1][:, window].mean(axis=1), self.strike, self.option_type)
+        return out
+
+
+@dataclass
+class BermudanOption(Instrument):
+    """
+    Option exercisable at a set of dates and at maturity.
+
+    Parameters
+    ----------
+    id : str
+        Trade identifier.
+    underlying : str
+        Name of the underlying risk factor.
+    strike : float
+        Strike price.
+    maturity : float
+        Final exercise date (year fraction).
+    exercise_times : sequence of float
+        Early exercise dates before maturity, all on the cube grid.
+    option_type : str
+        Either ``"call"`` or ``"put"``.
+    """
+
+    underlying: str
+    strike: float
+    maturity: float
+    exercise_times: Sequence[float]
+    option_type: str = "call"
+
+    def get_cashflows(self):
+        return {
+            "type": "bermudan_option",
+            "underlying": self.underlying,
+            "strike": self.strike,
+            "maturity": self.maturity,
+            "exercise_times": list(self.exercise_times),
+            "option_type": self.option_type,
+        }
+
+    def path_cashflows(self, cube) -> np.ndarray:
+        """Payoff at maturity if never exercised before."""
+        spot = _factor_paths(cube, self.underlying)
+        out = np.zeros_like(spot)
+        i = _time_index(cube.time_grid.as_array(), self.maturity)
+        out[:, i] = _intrinsic(spot[:, i], self.strike, self.option_type)
+        return out
+
+    def exercise_values(self, cube) -> np.ndarray:
+        spot = _factor_paths(cube, self.underlying)
+        times = cube.time_grid.as_array()
+        out = np.full_like(spot, np.nan)
+        for t in self.exercise_times:
+            i = _time_index(times, t)
+            out[:, i] = _intrinsic(spot[:, i], self.strike, self.option_type)
+        return out
@@ -0,0 +1,290 @@
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .parsers.yield_curve_parser import META_COLS_LONG, YieldCurveParser, YieldCurvePanel
+
+
+_FORMAT_VERSION = 1
+_MANIFEST = "manifest.json"
+_LAYOUT = "layout.json"
+_HASH_CHUNK = 1 << 20
+
+Arrays = Dict[str, np.ndarray]
+Key = Tuple[str, os.stat_result]
+
+
+def file_digest(path: str) -> str:
+    """SHA-256 of the file content (hex)."""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _encode_rows(rows: List[Any]) -> Tuple[Arrays, Dict[str, Any]]:
+    """
+    Column layout of a list of parsed rows (frozen dataclasses with a
+    ``meta`` dataclass, array fields and scalar fields).
+
+    meta fields -> one array per field ("meta.<name>"), strings or floats
+    array fields -> (n_rows, K) padded array plus its lengths ("<name>.len")
+    scalar fields -> (n_rows,) array
+    """
+    arrays: Arrays = {}
+    layout: Dict[str, Any] = {"n_rows": len(rows), "meta": [], "arrays": [], "scalars": []}
+    if not rows:
+        return arrays, layout
+
+    layout["row_class"] = type(rows[0]).__name__
+    layout["row_module"] = type(rows[0]).__module__
+    for f in dataclasses.fields(rows[0]):
+        values = [getattr(r, f.name) for r in rows]
+        first = values[0]
+        if dataclasses.is_dataclass(first):
+            layout["meta_field"] = f.name
+            layout["meta_class"] = type(first).__name__
+            for mf in dataclasses.fields(first):
+                col = [getattr(v, mf.name) for v in values]
+                arrays[f"meta.{mf.name}"] = np.array(col, dtype=str if isinstance(col[0], str) else float)
+                layout["meta"].append(mf.name)
+        elif isinstance(first, np.ndarray):
+            lengths = np.array([len(v) for v in values], dtype=np.int64)
+            padded = np.full((len(rows), int(lengths.max())), np.nan)
+            for i, v in enumerate(values):
+                padded[i, : lengths[i]] = v
+            arrays[f.name] = padded
+            arrays[f"{f.name}.len"] = lengths
+            layout["arrays"].append(f.name)
+        else:
+            arrays[f.name] = np.asarray(values, dtype=float)
+            layout["scalars"].append(f.name)
+    return arrays, layout
+
+
+def _encode_panel(panel: YieldCurvePanel) -> Tuple[Arrays, Dict[str, Any]]:
+    """Same layout as _encode_rows on panel.rows(), without building the rows."""
+    if len(panel) == 0:
+        return {}, {"n_rows": 0, "meta": [], "arrays": [], "scalars": []}
+    arrays: Arrays = {f"meta.{c}": panel.meta[c].to_numpy(dtype=str) for c in META_COLS_LONG}
+    lengths = np.asarray(panel.n_pillars, dtype=np.int64)
+    for name in ("maturity_days", "zero_rates"):
+        arrays[name] = np.asarray(getattr(panel, name), dtype=float)
+        arrays[f"{name}.len"] = lengths
+    layout = {
+        "n_rows": len(panel),
+        "row_class": "ParsedCurveRow",
+        "row_module": YieldCurvePanel.__module__,
+        "meta_field": "meta",
+        "meta_class": "YieldCurveMeta",
+        "meta": list(META_COLS_LONG),
+        "arrays": ["maturity_days", "zero_rates"],
+        "scalars": [],
+    }
+    return arrays, layout
+
+
+def _decode_rows(arrays: Arrays, layout: Dict[str, Any]) -> List[Any]:
+    """Rebuild the parsed rows from their column layout."""
+    n = layout["n_rows"]
+    if n == 0:
+        return []
+    # classes are looked up in the parser module that produced the rows
+    module = sys.modules[layout["row_module"]]
+    row_cls = getattr(module, layout["row_class"])
+    meta_cls = getattr(module, layout["meta_class"])
+
+    # rows sharing a meta (e.g. the lines of one vol cube) share one meta object
+    names = layout["meta"]
+    metas: Dict[tuple, Any] = {}
+    meta_values = list(zip(*(arrays[f"meta.{m}"].tolist() for m in names)))
+    for key in meta_values:
+        if key not in metas:
+            metas[key] = meta_cls(**dict(zip(names, key)))
+
+    # row arrays are views of one in-memory copy of each padded array
+    columns = [(layout["meta_field"], [metas[key] for key in meta_values])]
+    for a in layout["arrays"]:
+        padded = np.array(arrays[a])
+        columns.append((a, [padded[i, :k] for i, k in enumerate(arrays[f"{a}.len"].tolist())]))
+    for s in layout["scalars"]:
+        columns.append((s, arrays[s].tolist()))
+
+    fields = [name for name, _ in columns]
+    return [row_cls(**dict(zip(fields, values))) for values in zip(*(col for _, col in columns))]
+
+
+class ParsedDataCache:
+    """
+    On-disk cache of parsed market data files.
+
+    Parsed rows are stored column-wise as ``.npy`` arrays in one directory
+    per (parser, file content) pair, named after the SHA-256 of the source
+    file, so an edited file never hits a stale entry and identical files
+    share one entry. ``manifest.json`` maps each source path to its last
+    known size, mtime and digest; when those still match, the file is not
+    even re-hashed. Hits load the arrays memory-mapped and skip text
+    parsing entirely.
+
+    Entries and the manifest are written to a temporary name and renamed
+    into place, so concurrent jobs reading or filling the same cache only
+    ever see complete entries (a lost manifest update just costs a re-hash).
+
+    Parameters
+    ----------
+    cache_dir : str
+        Cache directory (created if missing).
+    trust_stat : bool
+        If True, an unchanged (size, mtime) in the manifest is taken as an
+        unchanged file. If False, every lookup hashes the source file.
+    mmap_mode : str, optional
+        Passed to ``numpy.load``; ``None`` reads the arrays into memory.
+
+    Notes
+    -----
+    Parsers are assumed to be stateless: the entry key is the parser class
+    and the file content, not the parser instance.
+    """
+
+    def __init__(self, cache_dir: str, trust_stat: bool = True, mmap_mode: Optional[str] = "r"):
+        self.cache_dir = cache_dir
+        self.trust_stat = trust_stat
+        self.mmap_mode = mmap_mode
+        os.makedirs(cache_dir, exist_ok=True)
+
+    # ---------- public API ----------
+    def parse(self, parser: Any, path: str) -> List[Any]:
+        """
+        ``parser.parse(path)``, served from the cache when the file is unchanged.
+        """
+        key, arrays, layout = self._lookup(parser, path)
+        if layout is None:
+            rows = parser.parse(path)
+            self._store(parser, path, key, *_encode_rows(rows))
+            return rows
+        return _decode_rows(arrays, layout)
+
+    def yield_curve_panel(self, path: str, parser: Optional[YieldCurveParser] = None) -> YieldCurvePanel:
+        """
+        ``parser.parse_panel(path)``; on a hit the panel arrays are the
+        memory-mapped cache arrays. Shares its entries with
+        ``parse(YieldCurveParser(), path)``.
+        """
+        parser = parser or YieldCurveParser()
+        key, arrays, layout = self._lookup(parser, path)
+        if layout is None:
+            panel = parser.parse_panel(path)
+            self._store(parser, path, key, *_encode_panel(panel))
+            return panel
+        if layout["n_rows"] == 0:
+            return YieldCurvePanel(
+                meta=pd.DataFrame(columns=META_COLS_LONG, dtype=str),
+                maturity_days=np.empty((0, 0)),
+                zero_rates=np.empty((0, 0)),
+                n_pillars=np.empty(0, dtype=int),
+            )
+        return YieldCurvePanel(
+            meta=pd.DataFrame({c: arrays[f"meta.{c}"] for c in META_COLS_LONG}),
+            maturity_days=arrays["maturity_days"],
+            zero_rates=arrays["zero_rates"],
+            n_pillars=arrays["maturity_days.len"],
+        )
+
+    def clear(self) -> None:
+        """Remove every entry and the manifest."""
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    # ---------- keys ----------
+    def _entry_name(self, parser: Any, digest: str) -> str:
+        return f"{type(parser).__name__}-v{_FORMAT_VERSION}-{digest}"
+
+    def _manifest_key(self, parser: Any, path: str) -> str:
+        return f"{type(parser).__name__}:{os.path.abspath(path)}"
+
+    def _read_manifest(self) -> Dict[str, Any]:
+        try:
+            with open(os.path.join(self.cache_dir, _MANIFEST), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _digest(self, parser: Any, path: str, st: os.stat_result) -> Tuple[str, bool]:
+        """(digest, whether the manifest already records it for this stat)."""
+        if self.trust_stat:
+            known = self._read_manifest().get(self._manifest_key(parser, path))
+            if known and known["size"] == st.st_size and known["mtime_ns"] == st.st_mtime_ns:
+                return known["digest"], True
+        return file_digest(path), False
+
+    # ---------- load / store ----------
+    def _lookup(self, parser: Any, path: str) -> Tuple[Key, Arrays, Optional[Dict[str, Any]]]:
+        """((digest, stat), arrays, layout); layout is None on a miss."""
+        st = os.stat(path)
+        digest, recorded = self._digest(parser, path, st)
+        key = (digest, st)
+        entry = os.path.join(self.cache_dir, self._entry_name(parser, digest))
+        try:
+            with open(os.path.join(entry, _LAYOUT), "r", encoding="utf-8") as f:
+                layout = json.load(f)
+        except (OSError, ValueError):
+            return key, {}, None
+
+        arrays = {}
+        for name, shape in layout["shapes"].items():
+            # numpy cannot memory-map empty arrays
+            mode = self.mmap_mode if int(np.prod(shape)) > 0 else None
+            arrays[name] = np.load(os.path.join(entry, f"{name}.npy"), mmap_mode=mode)
+        if not recorded:
+            self._record(parser, path, digest, st)
+        return key, arrays, layout
+
+    def _store(self, parser: Any, path: str, key: Key, arrays: Arrays, layout: Dict[str, Any]) -> None:
+        digest, st = key
+        now = os.stat(path)
+        if (now.st_size, now.st_mtime_ns) != (st.st_size, st.st_mtime_ns):
+            # the file changed while it was being parsed; the digest no longer describes it
+            return
+        entry = os.path.join(self.cache_dir, self._entry_name(parser, digest))
+        layout = dict(layout, version=_FORMAT_VERSION, digest=digest, source=os.path.abspath(path))
+        layout["shapes"] = {name: list(a.shape) for name, a in arrays.items()}
+
+        tmp = tempfile.mkdtemp(prefix=".tmp-", dir=self.cache_dir)
+        try:
+            os.chmod(tmp, 0o755)
+            for name, a in arrays.items():
+                np.save(os.path.join(tmp, f"{name}.npy"), a)
+            with open(os.path.join(tmp, _LAYOUT), "w", encoding="utf-8") as f:
+                json.dump(layout, f)
+            try:
+                os.rename(tmp, entry)
+            except OSError:
+                # another job stored the same entry first
+                pass
+        finally:
+            shutil.rmtree(tmp, ignore_errors=True)
+        self._record(parser, path, digest, st)
+
+    def _record(self, parser: Any, path: str, digest: str, st: os.stat_result) -> None:
+        manifest = self._read_manifest()
+        manifest[self._manifest_key(parser, path)] = {
+            "digest": digest,
+            "size": st.st_size,
+            "mtime_ns": st.st_mtime_ns,
+        }
+        fd, tmp = tempfile.mkstemp(prefix=".manifest-", dir=self.cache_dir)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=1, sort_keys=True)
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, os.path.join(self.cache_dir, _MANIFEST))
@@ -0,0 +1,272 @@
+from __future__ import annotations
+
+from typing import Optional
+
+import numpy as np
+
+
+_METHODS = {
+    "lin": "lin", "linear": "lin",
+    "log-lin": "log-lin", "loglin": "log-lin", "log-linear": "log-lin", "loglinear": "log-lin",
+    "cubic": "cubic", "monotone-cubic": "cubic", "pchip": "cubic",
+}
+# extrapolation labels found in market data files that mean "hold the end zero rate"
+_FLAT_EXTRAPOLATIONS = {"flat", "near", "nearest"}
+
+
+def normalise_method(method: str, default: Optional[str] = None) -> str:
+    """
+    Map an interpolation label (e.g. meta.interp_type) to 'lin', 'log-lin'
+    or 'cubic'. Unknown labels raise, or map to ``default`` if given.
+    """
+    key = str(method).strip().lower()
+    if key not in _METHODS:
+        if default is not None:
+            return normalise_method(default)
+        raise ValueError(f"Unsupported interpolation method: {method}")
+    return _METHODS[key]
+
+
+def normalise_extrapolation(extrapolation: str) -> str:
+    """Map an extrapolation label (e.g. meta.extrap_type) to 'flat' or 'linear'."""
+    return "flat" if str(extrapolation).strip().lower() in _FLAT_EXTRAPOLATIONS else "linear"
+
+
+def _monotone_slopes(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """
+    Fritsch-Carlson knot derivatives (PCHIP): monotone data stay monotone,
+    no overshoot between pillars. y may carry leading batch dimensions;
+    the knots run along its last axis.
+    """
+    h = np.diff(x)
+    s = np.diff(y, axis=-1) / h
+    d = np.zeros_like(y)
+    if y.shape[-1] == 2:
+        d[...] = s[..., :1]
+        return d
+
+    # interior: weighted harmonic mean of adjacent secants, 0 at local extrema
+    w1 = 2.0 * h[1:] + h[:-1]
+    w2 = h[1:] + 2.0 * h[:-1]
+    same_sign = s[..., :-1] * s[..., 1:] > 0.0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        hm = (w1 + w2) / (w1 / s[..., :-1] + w2 / s[..., 1:])
+    d[..., 1:-1] = np.where(same_sign, hm, 0.0)
+
+    # ends: shape-preserving three-point formula
+    def end_slope(h0, h1, s0, s1):
+        e = ((2.0 * h0 + h1) * s0 - h0 * s1) / (h0 + h1)
+        e = np.where(np.sign(e) != np.sign(s0), 0.0, e)
+        return np.where((np.sign(s0) != np.sign(s1)) & (np.abs(e) > np.abs(3.0 * s0)), 3.0 * s0, e)
+
+    d[..., 0] = end_slope(h[0], h[1], s[..., 0], s[..., 1])
+    d[..., -1] = end_slope(h[-1], h[-2], s[..., -1], s[..., -2])
+    return d
+
+
+class CurveInterpolator:
+    """
+    Vectorised zero curve interpolation on fixed pillars.
+
+    Each segment is stored as a cubic polynomial in the distance to its
+    left pillar, with coefficients computed once here; queries are a
+    ``searchsorted`` plus a Horner evaluation over whole arrays.
+
+    Parameters
+    ----------
+    maturities_days : numpy.ndarray
+        Pillar maturities in days, shape ``(K,)``, ``K >= 2``.
+    zero_rates : numpy.ndarray
+        Continuously compounded zero rates at the pillars, shape ``(K,)``.
+    method : str
+        ``"lin"`` (linear zero rates), ``"log-lin"`` (linear log discount
+        factors, i.e. piecewise flat forwards, anchored at DF(0,0)=1) or
+        ``"cubic"`` (monotone cubic Hermite on zero rates). Aliases such as
+        ``"linear"`` or ``"pchip"`` are accepted.
+    extrapolation : str
+        ``"flat"`` holds the end zero rates (``"near"`` is read the same
+        way); anything else extends the end segment linearly (end slope for
+        ``"cubic"``).
+    day_count : float
+        Days per year used to turn maturities into year fractions.
+    """
+
+    def __init__(
+        self,
+        maturities_days: np.ndarray,
+        zero_rates: np.ndarray,
+        method: str = "lin",
+        extrapolation: str = "linear",
+        day_count: float = 365.0,
+    ):
+        x = np.asarray(maturities_days, dtype=float)
+        r = np.asarray(zero_rates, dtype=float)
+        if x.ndim != 1 or r.ndim != 1 or x.size != r.size:
+            raise ValueError("maturities_days and zero_rates must be 1D arrays of the same length.")
+        if x.size < 2:
+            raise ValueError("Need at least 2 pillars to interpolate a curve.")
+        idx = np.argsort(x)
+        x, r = x[idx], r[idx]
+        if np.any(np.diff(x) <= 0.0):
+            raise ValueError("Pillar maturities must be distinct.")
+
+        self.method = normalise_method(method)
+        self.extrapolation = normalise_extrapolation(extrapolation)
+        self.day_count = float(day_count)
+        self.maturities_days = x
+        self.pillar_rates = r
+
+        if self.method == "log-lin":
+            # interpolate ln DF; anchor DF(0,0)=1 so the first segment is flat-forward from today
+            values = -r * x / self.day_count
+            if x[0] > 0.0:
+                x = np.concatenate([[0.0], x])
+                values = np.concatenate([[0.0], values])
+        else:
+            values = r
+
+        h = np.diff(x)
+        s = np.diff(values) / h
+        if self.method == "cubic":
+            d = _monotone_slopes(x, values)
+            c2 = (3.0 * s - 2.0 * d[:-1] - d[1:]) / h
+            c3 = (d[:-1] + d[1:] - 2.0 * s) / (h * h)
+            c1 = d[:-1]
+            self._end_slopes = (d[0], d[-1])
+        else:
+            c1, c2, c3 = s, np.zeros_like(s), np.zeros_like(s)
+            self._end_slopes = (s[0], s[-1])
+
+        self._knots = x
+        self._values = values
+        self._coeffs = np.stack([values[:-1], c1, c2, c3], axis=1)  # (n-1, 4)
+
+    def _values_at(self, xq: np.ndarray) -> np.ndarray:
+        """Interpolated values (zero rates, or ln DF for log-lin) at xq (1D, days)."""
+        x, v = self._knots, self._values
+        i = np.clip(np.searchsorted(x, xq, side="right") - 1, 0, x.size - 2)
+        u = xq - x[i]
+        c = self._coeffs[i]
+        out = c[:, 0] + u * (c[:, 1] + u * (c[:, 2] + u * c[:, 3]))
+
+        lo, hi = xq < x[0], xq > x[-1]
+        if self.extrapolation == "linear":
+            out[lo] = v[0] + self._end_slopes[0] * (xq[lo] - x[0])
+            out[hi] = v[-1] + self._end_slopes[1] * (xq[hi] - x[-1])
+        else:
+            r0, rn = self.pillar_rates[0], self.pillar_rates[-1]
+            if self.method == "log-lin":
+                out[lo] = -r0 * xq[lo] / self.day_count
+                out[hi] = -rn * xq[hi] / self.day_count
+            else:
+                out[lo] = r0
+                out[hi] = rn
+        return out
+
+    def zero_rates(self, maturities_days: np.ndarray) -> np.ndarray:
+        """
+        Zero rates at maturities in days (any shape; same shape returned).
+        """
+        shape = np.shape(maturities_days)
+        xq = np.asarray(maturities_days, dtype=float).ravel()
+        v = self._values_at(xq)
+        if self.method != "log-lin":
+            return v.reshape(shape)
+
+        # r = -ln DF / t; at t <= 0 take the short-end limit (first pillar rate)
+        out = np.full_like(xq, self.pillar_rates[0])
+        pos = xq > 0.0
+        out[pos] = -v[pos] * self.day_count / xq[pos]
+        return out.reshape(shape)
+
+    def dfs(self, maturities_days: np.ndarray) -> np.ndarray:
+        """
+        Discount factors DF(0,t) at maturities in days (any shape; same shape returned).
+        """
+        shape = np.shape(maturities_days)
+        xq = np.asarray(maturities_days, dtype=float).ravel()
+        v = self._values_at(xq)
+        if self.method == "log-lin":
+            return np.exp(v).reshape(shape)
+        return np.exp(-v * xq / self.day_count).reshape(shape)
+
+
+class SimulatedCurveInterpolator:
+    """
+    Evaluate simulated curves at fixed maturities for all paths at once.
+
+    Simulated zero curves share one pillar grid, so the bracketing pillars
+    and linear weights of the target maturities are computed once here
+    and each evaluation is a gather plus a multiply-add over the whole
+    cube, e.g. ``(P, T, K) -> (P, T, G)``. Outside the pillar range values
+    are held flat, as with ``numpy.interp``.
+
+    Parameters
+    ----------
+    pillars : numpy.ndarray
+        Pillar maturities, shape ``(K,)``, strictly increasing (any unit,
+        typically years).
+    targets : float or numpy.ndarray
+        Target maturities in the same unit; the output replaces the
+        pillar axis with ``targets.shape`` (a scalar target drops it).
+    """
+
+    def __init__(self, pillars: np.ndarray, targets):
+        pillars = np.asarray(pillars, dtype=float)
+        if pillars.ndim != 1 or pillars.size < 2:
+            raise ValueError("pillars must be 1D with at least 2 points.")
+        if not np.all(np.diff(pillars) > 0):
+            raise ValueError("pillars must be strictly increasing.")
+        targets = np.asarray(targets, dtype=float)
+
+        self.pillars = pillars
+        self.targets = targets
+        self.index = np.clip(np.searchsorted(pillars, targets, side="right") - 1, 0, pillars.size - 2)
+        w = (targets - pillars[self.index]) / (pillars[self.index + 1] - pillars[self.index])
+        self.weight = np.clip(w, 0.0, 1.0)
+
+    def __call__(self, values: np.ndarray) -> np.ndarray:
+        """
+        Linearly interpolate ``values`` of shape ``(..., K)`` along the last
+        axis; returns ``(..., *targets.shape)``.
+        """
+        values = np.asarray(values)
+        if values.shape[-1] != self.pillars.size:
+            raise ValueError("values last dimension must match pillars length.")
+        lo = np.take(values, self.index, axis=-1)
+        hi = np.take(values, self.index + 1, axis=-1)
+        hi -= lo
+        hi *= self.weight
+        hi += lo
+        return hi
+
+    def zero_rates(self, zero_rates: np.ndarray, method: str = "lin") -> np.ndarray:
+        """
+        Zero rates at the targets from pillar zero rates ``(..., K)``.
+
+        ``method="lin"`` interpolates the rates, ``"log-lin"`` the log
+        discount factors ``-z * M`` (pillars must then be in years). Either
+        way the end pillar rates are held flat outside the pillar range.
+        """
+        method = normalise_method(method)
+        if method == "lin":
+            return self(zero_rates)
+        if method != "log-lin":
+            raise ValueError("SimulatedCurveInterpolator supports 'lin' and 'log-lin' only.")
+
+        zero_rates = np.asarray(zero_rates, dtype=float)
+        log_df = self(-zero_rates * self.pillars)
+        inside = (self.targets >= self.pillars[0]) & (self.targets <= self.pillars[-1])
+        out = -log_df / np.where(inside, self.targets, 1.0)
+        if not np.all(inside):
+            expand = zero_rates.shape[:-1] + (1,) * self.targets.ndim
+            out = np.where(self.targets < self.pillars[0], zero_rates[..., :1].reshape(expand), out)
+            out = np.where(self.targets > self.pillars[-1], zero_rates[..., -1:].reshape(expand), out)
+        return out
+
+    def dfs(self, zero_rates: np.ndarray, method: str = "lin") -> np.ndarray:
+        """
+        Discount factors ``exp(-z(M) * M)`` at the targets (years), e.g. for
+        discounting cashflows on every simulated curve at once.
+        """
+        return np.exp(-self.zero_rates(zero_rates, method) * self.targets)
@@ -1,9 +1,20 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
 import numpy as np
 
 
+Discount = Union[float, Callable[[np.ndarray], np.ndarray]]
+
+_PAYMENTS_PER_YEAR = {
+    "ANNUAL": 1, "YEARLY": 1, "A": 1, "1Y": 1, "12M": 1,
+    "SEMIANNUAL": 2, "SEMI-ANNUAL": 2, "SEMI_ANNUAL": 2, "S": 2, "6M": 2,
+    "QUARTERLY": 4, "Q": 4, "3M": 4,
+    "MONTHLY": 12, "M": 12, "1M": 12,
+}
+
+
 @dataclass(frozen=True)
 class CreditCurveMeta:
     curve_type: str
@@ -24,9 +35,9 @@ class CreditSpreadCurve:
 
     Notes
     -----
-    For now we store spreads directly (par spreads). Later you can extend to:
-    - hazard rate / survival curve bootstrapping
-    - CDS pricing conventions (accrual, ISDA, etc.)
+    Spreads are stored directly (par spreads); `hazard_curve` bootstraps
+    the piecewise-constant hazard rates they imply. Full CDS conventions
+    (ISDA accrual, IMM dates) are not modelled.
     """
 
     def __init__(self, meta: CreditCurveMeta, maturity_months: np.ndarray, par_spreads: np.ndarray):
@@ -56,3 +67,240 @@ class CreditSpreadCurve:
             return float(ys[-2] + (ys[-1] - ys[-2]) * (x - xs[-2]) / (xs[-1] - xs[-2]))
 
         return float(np.interp(x, xs, ys))
+
+    def spreads(self, maturity_months: np.ndarray) -> np.ndarray:
+        """Vectorised `spread`: linear interpolation, linear extrapolation at both ends."""
+        shape = np.shape(maturity_months)
+        x = np.atleast_1d(np.asarray(maturity_months, dtype=float)).ravel()
+        xs, ys = self.maturity_months, self.par_spreads
+
+        out = np.interp(x, xs, ys)
+        lo = x < xs[0]
+        hi = x > xs[-1]
+        out[lo] = ys[0] + (ys[1] - ys[0]) * (x[lo] - xs[0]) / (xs[1] - xs[0])
+        out[hi] = ys[-2] + (ys[-1] - ys[-2]) * (x[hi] - xs[-2]) / (xs[-1] - xs[-2])
+        return out.reshape(shape)
+
+    def hazard_curve(self, discount: Discount = 0.0) -> "HazardCurve":
+        """Bootstrapped hazard curve (see `bootstrap_hazard_curves`)."""
+        return bootstrap_hazard_curves([self], discount=discount)[0]
+
+
+def payments_per_year(payment_freq: str, default: Optional[int] = None) -> int:
+    """
+    Coupons per year for a payment frequency label such as 'QUARTERLY' or
+    'Q'. Unknown labels raise, or give ``default`` if given.
+    """
+    key = str(payment_freq).strip().upper()
+    if key not in _PAYMENTS_PER_YEAR:
+        if default is not None:
+            return default
+        raise ValueError(f"Unsupported payment frequency: {payment_freq}")
+    return _PAYMENTS_PER_YEAR[key]
+
+
+class HazardCurve:
+    """
+    Piecewise-constant hazard rates: ``hazard_rates[..., k]`` applies on
+    ``(T_{k-1}, T_k]`` (``T_{-1} = 0``) and the last rate is held beyond the
+    last pillar, so ``S(t) = exp(-int_0^t lambda(u) du)``.
+
+    Parameters
+    ----------
+    pillar_years : numpy.ndarray
+        Pillar maturities in years, shape ``(K,)``, increasing.
+    hazard_rates : numpy.ndarray
+        Shape ``(K,)`` for one curve or ``(n_curves, K)`` for a stack of
+        curves on the same pillars; outputs then carry the leading axis.
+    recovery : float or numpy.ndarray
+        Recovery rate(s) used in the bootstrap.
+    meta : CreditCurveMeta, optional
+        Meta of the source spread curve.
+    """
+
+    def __init__(
+        self,
+        pillar_years: np.ndarray,
+        hazard_rates: np.ndarray,
+        recovery: Union[float, np.ndarray] = 0.4,
+        meta: Optional[CreditCurveMeta] = None,
+    ):
+        self.pillar_years = np.asarray(pillar_years, dtype=float)
+        self.hazard_rates = np.asarray(hazard_rates, dtype=float)
+        self.recovery = recovery
+        self.meta = meta
+
+        if self.pillar_years.ndim != 1 or self.pillar_years.size == 0:
+            raise ValueError("pillar_years must be a non-empty 1D array.")
+        if self.hazard_rates.shape[-1] != self.pillar_years.size:
+            raise ValueError("hazard_rates last dimension must match pillar_years.")
+        if np.any(np.diff(self.pillar_years) <= 0.0) or self.pillar_years[0] <= 0.0:
+            raise ValueError("pillar_years must be positive and strictly increasing.")
+
+        # cumulative hazard at 0, T_0, ..., T_{K-2} (start of each segment)
+        starts = np.concatenate([[0.0], self.pillar_years[:-1]])
+        self._starts = starts
+        cum = np.cumsum(self.hazard_rates * np.diff(np.concatenate([[0.0], self.pillar_years])), axis=-1)
+        self._cum_at_start = np.concatenate([np.zeros(cum.shape[:-1] + (1,)), cum[..., :-1]], axis=-1)
+
+    def cumulative_hazard(self, times: np.ndarray) -> np.ndarray:
+        """``int_0^t lambda``; shape ``(..., *times.shape)``."""
+        t = np.maximum(np.asarray(times, dtype=float), 0.0)
+        k = np.clip(np.searchsorted(self.pillar_years, t, side="left"), 0, self.pillar_years.size - 1)
+        return self._cum_at_start[..., k] + self.hazard_rates[..., k] * (t - self._starts[k])
+
+    def survival(self, times: np.ndarray) -> np.ndarray:
+        """Survival probabilities ``S(t)`` at times in years."""
+        return np.exp(-self.cumulative_hazard(times))
+
+    def default_probability(self, times: np.ndarray) -> np.ndarray:
+        """``1 - S(t)``."""
+        return -np.expm1(-self.cumulative_hazard(times))
+
+    def marginal_pd(self, time_grid: np.ndarray) -> np.ndarray:
+        """Default probabilities per grid interval, ``S(t_{i-1}) - S(t_i)``; last axis ``T - 1``."""
+        s = self.survival(np.asarray(time_grid, dtype=float).ravel())
+        return s[..., :-1] - s[..., 1:]
+
+
+def _discount_factors(discount: Discount, times: np.ndarray) -> np.ndarray:
+    if callable(discount):
+        return np.asarray(discount(times), dtype=float)
+    return np.exp(-float(discount) * times)
+
+
+def bootstrap_hazard_rates(
+    pillar_years: np.ndarray,
+    par_spreads: np.ndarray,
+    recovery: Union[float, np.ndarray],
+    payments_per_year: int = 4,
+    discount: Discount = 0.0,
+    max_hazard: float = 50.0,
+    tol: float = 1e-14,
+    max_iter: int = 200,
+) -> np.ndarray:
+    """
+    Bootstrap piecewise-constant hazard rates from CDS par spreads, for a
+    stack of curves sharing pillars.
+
+    Parameters
+    ----------
+    pillar_years : numpy.ndarray
+        CDS maturities in years, shape ``(K,)``, increasing.
+    par_spreads : numpy.ndarray
+        Par spreads (decimal), shape ``(n_curves, K)`` or ``(K,)``.
+    recovery : float or numpy.ndarray
+        Recovery rate, scalar or ``(n_curves,)``.
+    payments_per_year : int
+        Premium coupon frequency.
+    discount : float or callable
+        Flat continuously compounded rate, or ``DF(t)`` for an array of
+        times in years.
+    max_hazard : float
+        Upper end of the bisection bracket; pillars that cannot be matched
+        below it (spreads falling too fast) are capped there.
+    tol, max_iter :
+        Bisection stopping rule (absolute width of the hazard bracket).
+
+    Returns
+    -------
+    numpy.ndarray
+        Hazard rates with the shape of ``par_spreads``.
+
+    Notes
+    -----
+    Legs are discretised on the coupon dates ``j / payments_per_year``
+    merged with the pillars. Each interval pays ``spread * dt`` with
+    accrual on default (midpoint survival) and protection
+    ``(1 - R) * (S(t_{j-1}) - S(t_j))``, both discounted at the interval
+    end. Pillar ``k`` solves ``spread_k * RPV01(T_k) = Protection(T_k)``
+    for all curves at once by bisection on the hazard rate of
+    ``(T_{k-1}, T_k]``, with the legs up to ``T_{k-1}`` carried over.
+    Pillars whose spread implies a negative forward hazard get 0.
+    """
+    T = np.asarray(pillar_years, dtype=float)
+    spreads = np.asarray(par_spreads, dtype=float)
+    single = spreads.ndim == 1
+    spreads = np.atleast_2d(spreads)
+    n, K = spreads.shape
+    if T.shape != (K,):
+        raise ValueError("par_spreads last dimension must match pillar_years.")
+    lgd = 1.0 - np.broadcast_to(np.asarray(recovery, dtype=float), (n,))
+
+    coupons = np.arange(1, int(np.ceil(T[-1] * payments_per_year)) + 1) / payments_per_year
+    t = np.unique(np.concatenate([coupons[coupons < T[-1]], T]))
+    dt = np.diff(np.concatenate([[0.0], t]))
+    df = _discount_factors(discount, t)
+    segment = np.searchsorted(T, t, side="left")
+
+    hazard = np.zeros((n, K))
+    s_start = np.ones(n)     # S(T_{k-1})
+    rpv01 = np.zeros(n)      # premium leg per unit spread up to T_{k-1}
+    protection = np.zeros(n)
+
+    for k in range(K):
+        j = segment == k
+        t_start = 0.0 if k == 0 else T[k - 1]
+        tau, dt_k, df_k = t[j] - t_start, dt[j], df[j]
+        s_k = spreads[:, k]
+
+        def legs(lam):
+            s = s_start[:, None] * np.exp(-lam[:, None] * tau[None, :])
+            s_prev = np.concatenate([s_start[:, None], s[:, :-1]], axis=1)
+            a = rpv01 + (0.5 * dt_k * df_k * (s_prev + s)).sum(axis=1)
+            b = protection + lgd * (df_k * (s_prev - s)).sum(axis=1)
+            return a, b, s[:, -1]
+
+        def residual(lam):
+            a, b, _ = legs(lam)
+            return s_k * a - b
+
+        lo = np.zeros(n)
+        # a non-positive residual at 0 means a negative forward hazard: keep 0
+        hi = np.where(residual(lo) > 0.0, max_hazard, 0.0)
+        for _ in range(max_iter):
+            if np.max(hi - lo) <= tol:
+                break
+            mid = 0.5 * (lo + hi)
+            pos = residual(mid) > 0.0
+            lo = np.where(pos, mid, lo)
+            hi = np.where(pos, hi, mid)
+
+        lam = 0.5 * (lo + hi)
+        hazard[:, k] = lam
+        rpv01, protection, s_start = legs(lam)
+
+    return hazard[0] if single else hazard
+
+
+def bootstrap_hazard_curves(
+    curves: Sequence[CreditSpreadCurve],
+    discount: Discount = 0.0,
+) -> List[HazardCurve]:
+    """
+    Bootstrap many spread curves at once.
+
+    Curves sharing pillars and payment frequency are stacked into one
+    ``(n_curves, n_pillars)`` bootstrap (`bootstrap_hazard_rates`); the
+    returned curves are in input order. Unrecognised payment frequency
+    labels are taken as quarterly, the standard CDS premium schedule.
+    """
+    groups: Dict[Tuple[Tuple[float, ...], int], List[int]] = {}
+    for i, c in enumerate(curves):
+        key = (tuple(c.maturity_months.tolist()), payments_per_year(c.meta.payment_freq, default=4))
+        groups.setdefault(key, []).append(i)
+
+    out: List[Optional[HazardCurve]] = [None] * len(curves)
+    for (months, freq), idx in groups.items():
+        pillars = np.asarray(months) / 12.0
+        recovery = np.array([curves[i].meta.recovery for i in idx], dtype=float)
+        hazard = bootstrap_hazard_rates(
+            pillars,
+            np.stack([curves[i].par_spreads for i in idx]),
+            recovery,
+            payments_per_year=freq,
+            discount=discount,
+        )
+        for row, i in enumerate(idx):
+            out[i] = HazardCurve(pillars, hazard[row], recovery[row], meta=curves[i].meta)
+    return out
@@ -1,9 +1,15 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, Tuple
+from typing import Dict, Optional, Tuple
 import numpy as np
 
+from ..interpolation import _monotone_slopes, normalise_extrapolation, normalise_method
+
+
+# upper bound on grid values gathered per block of vol queries
+_BLOCK_ELEMENTS = 1 << 22
+
 
 @dataclass(frozen=True)
 class SwaptionVolMeta:
@@ -58,31 +64,245 @@ class SwaptionVolSlice:
 
         return float(np.interp(x, xs, ys))
 
+    def vols_at(self, tenor_days: np.ndarray) -> np.ndarray:
+        """Vectorised vol(): same linear interpolation and end-segment extrapolation."""
+        x = np.asarray(tenor_days, dtype=float)
+        xs, ys = self.tenor_days, self.vols
+        i = np.clip(np.searchsorted(xs, x, side="right") - 1, 0, xs.size - 2)
+        return ys[i] + (ys[i + 1] - ys[i]) * (x - xs[i]) / (xs[i + 1] - xs[i])
+
+
+def _expand(a: np.ndarray, ndim: int) -> np.ndarray:
+    return a.reshape(a.shape + (1,) * (ndim - a.ndim))
+
+
+def _axis_rule(method: str, extrapolation: str) -> Tuple[str, str]:
+    m = normalise_method(method, default="lin")
+    if m == "log-lin":
+        raise ValueError(f"Unsupported volatility interpolation: {method}")
+    return m, normalise_extrapolation(extrapolation)
+
+
+def _node_index(x: np.ndarray, xq: np.ndarray, method: str) -> np.ndarray:
+    """
+    Grid nodes gathered for each query along one axis, shape (Q, m): the
+    bracketing pair for linear axes, the whole axis for cubic ones (their
+    slopes depend on all nodes).
+    """
+    n = x.size
+    if n == 1:
+        return np.zeros((xq.size, 1), dtype=np.intp)
+    if method == "cubic" and n > 2:
+        return np.broadcast_to(np.arange(n), (xq.size, n))
+    i = np.clip(np.searchsorted(x, xq, side="right") - 1, 0, n - 2)
+    return np.stack([i, i + 1], axis=1)
+
+
+def _reduce_axis(a: np.ndarray, x: np.ndarray, xq: np.ndarray, rule: Tuple[str, str]) -> np.ndarray:
+    """
+    Interpolate a (Q, m, ...) block gathered by _node_index along axis 1
+    at xq (Q,). Returns (Q, ...).
+    """
+    method, extrapolation = rule
+    n = x.size
+    if n == 1:
+        return a[:, 0]
+
+    i = np.clip(np.searchsorted(x, xq, side="right") - 1, 0, n - 2)
+    h = x[i + 1] - x[i]
+    if a.shape[1] == 2:
+        w = (xq - x[i]) / h
+        if extrapolation == "flat":
+            w = np.clip(w, 0.0, 1.0)
+        lo, hi = a[:, 0], a[:, 1]
+        return lo + _expand(w, lo.ndim) * (hi - lo)
+
+    # monotone cubic Hermite, slopes from the gathered nodes of each query
+    v = np.moveaxis(a, 1, -1)  # (Q, ..., n)
+    d = _monotone_slopes(x, v)
+
+    def at(arr: np.ndarray, idx: np.ndarray) -> np.ndarray:
+        return np.take_along_axis(arr, _expand(idx, arr.ndim), axis=-1)[..., 0]
+
+    u = _expand(np.clip((xq - x[i]) / h, 0.0, 1.0), v.ndim - 1)
+    hh = _expand(h, v.ndim - 1)
+    u2, u3 = u * u, u * u * u
+    out = (
+        (2.0 * u3 - 3.0 * u2 + 1.0) * at(v, i)
+        + (u3 - 2.0 * u2 + u) * hh * at(d, i)
+        + (3.0 * u2 - 2.0 * u3) * at(v, i + 1)
+        + (u3 - u2) * hh * at(d, i + 1)
+    )
+    if extrapolation == "linear":
+        lo, hi = _expand(xq < x[0], out.ndim), _expand(xq > x[-1], out.ndim)
+        out = np.where(lo, v[..., 0] + d[..., 0] * _expand(xq - x[0], out.ndim), out)
+        out = np.where(hi, v[..., -1] + d[..., -1] * _expand(xq - x[-1], out.ndim), out)
+    return out
+
 
 class SwaptionVolCube:
     """
     Engine-facing container for a swaption volatility cube.
 
-    Stores slices keyed by (expiry_months, strike) where each slice is vol vs tenor_days.
+    Backed by a dense grid ``vol_grid[e, s, t]`` on sorted expiry_months,
+    strikes and tenor_days, from which :meth:`vols` interpolates whole
+    arrays of (expiry, strike, tenor) queries at once.
 
     Notes
     -----
-    This is a clean "passerelle" object: you can later upgrade to full 3D interpolation:
-      vol(expiry, strike, tenor)
-    For now, we provide:
-      - exact slice retrieval
-      - 1D interpolation in tenor within each slice
+    Each axis follows the meta: ``*_interp`` is ``"lin"`` or ``"cubic"``
+    (monotone cubic Hermite), other labels are linear as in the slices,
+    ``*_extrap`` ``"near"``/``"flat"`` holds the
+    end values and anything else extends the end segment.
+
+    The slice API is kept: slices keyed by (expiry_months, strike), each
+    vol vs tenor_days with its own 1D linear interpolation. A cube built
+    with add_slice gets its grid on first dense access; slices on other
+    tenor pillars are resampled onto the union of tenors, and (expiry,
+    strike) pairs without a slice are NaN.
     """
 
     def __init__(self, meta: SwaptionVolMeta):
         self.meta = meta
         self.slices: Dict[Tuple[float, float], SwaptionVolSlice] = {}
+        self._grid: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]] = None
+
+    @classmethod
+    def from_arrays(
+        cls,
+        meta: SwaptionVolMeta,
+        expiry_months: np.ndarray,
+        strikes: np.ndarray,
+        tenor_days: np.ndarray,
+        vols: np.ndarray,
+    ) -> "SwaptionVolCube":
+        """
+        Cube on a dense grid; vols has shape (E, S, N), NaN where there is
+        no quote. Axes may be given in any order.
+        """
+        axes = [np.asarray(a, dtype=float) for a in (expiry_months, strikes, tenor_days)]
+        vols = np.asarray(vols, dtype=float)
+        if any(a.ndim != 1 for a in axes):
+            raise ValueError("expiry_months, strikes and tenor_days must be 1D arrays.")
+        if vols.shape != tuple(a.size for a in axes):
+            raise ValueError(f"vols must have shape {tuple(a.size for a in axes)}; got {vols.shape}")
+        if axes[2].size < 2:
+            raise ValueError("Need at least 2 tenors for interpolation.")
+
+        for k in range(3):
+            order = np.argsort(axes[k])
+            axes[k] = axes[k][order]
+            vols = np.take(vols, order, axis=k)
+            if np.any(np.diff(axes[k]) <= 0.0):
+                raise ValueError("Grid pillars must be distinct.")
+
+        cube = cls(meta)
+        cube._grid = (axes[0], axes[1], axes[2], vols)
+        return cube
+
+    # --- slices -------------------------------------------------------------
 
     def add_slice(self, expiry_months: float, strike: float, tenor_days: np.ndarray, vols: np.ndarray) -> None:
+        self._materialise_slices()
         self.slices[(float(expiry_months), float(strike))] = SwaptionVolSlice(tenor_days, vols)
+        self._grid = None
 
     def get_slice(self, expiry_months: float, strike: float) -> SwaptionVolSlice:
         key = (float(expiry_months), float(strike))
-        if key not in self.slices:
-            raise KeyError(f"No slice found for expiry={expiry_months}, strike={strike}")
-        return self.slices[key]
+        if key in self.slices:
+            return self.slices[key]
+        if self._grid is not None:
+            E, S, T, G = self._grid
+            i, j = np.flatnonzero(E == key[0]), np.flatnonzero(S == key[1])
+            if i.size and j.size and np.all(np.isfinite(G[i[0], j[0]])):
+                return SwaptionVolSlice(T, G[i[0], j[0]])
+        raise KeyError(f"No slice found for expiry={expiry_months}, strike={strike}")
+
+    def _materialise_slices(self) -> None:
+        # grid-only slices (from_arrays) must survive the grid being rebuilt
+        if self._grid is None:
+            return
+        E, S, T, G = self._grid
+        for i, e in enumerate(E.tolist()):
+            for j, k in enumerate(S.tolist()):
+                if (e, k) not in self.slices and np.all(np.isfinite(G[i, j])):
+                    self.slices[(e, k)] = SwaptionVolSlice(T, G[i, j])
+
+    # --- dense grid ---------------------------------------------------------
+
+    def _dense(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        if self._grid is None:
+            if not self.slices:
+                raise ValueError("SwaptionVolCube has no slices.")
+            keys = np.array(list(self.slices.keys()), dtype=float)
+            E, S = np.unique(keys[:, 0]), np.unique(keys[:, 1])
+            T = np.unique(np.concatenate([sl.tenor_days for sl in self.slices.values()]))
+            G = np.full((E.size, S.size, T.size), np.nan)
+            for (e, k), sl in self.slices.items():
+                same = np.array_equal(sl.tenor_days, T)
+                G[np.searchsorted(E, e), np.searchsorted(S, k)] = sl.vols if same else sl.vols_at(T)
+            self._grid = (E, S, T, G)
+        return self._grid
+
+    @property
+    def expiry_months(self) -> np.ndarray:
+        return self._dense()[0]
+
+    @property
+    def strikes(self) -> np.ndarray:
+        return self._dense()[1]
+
+    @property
+    def tenor_days(self) -> np.ndarray:
+        return self._dense()[2]
+
+    @property
+    def vol_grid(self) -> np.ndarray:
+        """(E, S, N) vols on expiry_months x strikes x tenor_days."""
+        return self._dense()[3]
+
+    def vols(self, expiry_months: np.ndarray, strikes: np.ndarray, tenor_days: np.ndarray) -> np.ndarray:
+        """
+        Interpolated vols for arrays of queries.
+
+        Parameters
+        ----------
+        expiry_months, strikes, tenor_days : numpy.ndarray
+            Query coordinates, broadcast together.
+
+        Returns
+        -------
+        numpy.ndarray
+            Vols with the broadcast shape of the inputs.
+
+        Notes
+        -----
+        The grid nodes each query needs (bracketing pairs on linear axes,
+        whole axes on cubic ones) are gathered for a block of queries and
+        reduced one axis at a time: expiry, then strike, then tenor.
+        """
+        E, S, T, G = self._dense()
+        nodes = (E, S, T)
+        rules = (
+            _axis_rule(self.meta.expiry_interp, self.meta.expiry_extrap),
+            _axis_rule(self.meta.strike_interp, self.meta.strike_extrap),
+            _axis_rule(self.meta.tenor_interp, self.meta.tenor_extrap),
+        )
+        arrays = np.broadcast_arrays(*(np.asarray(a, dtype=float) for a in (expiry_months, strikes, tenor_days)))
+        shape = arrays[0].shape
+        q = [a.ravel() for a in arrays]
+
+        per_query = 1
+        for x, (method, _) in zip(nodes, rules):
+            per_query *= x.size if (method == "cubic" and x.size > 2) else min(x.size, 2)
+        block = max(1, _BLOCK_ELEMENTS // per_query)
+
+        out = np.empty(q[0].size)
+        for start in range(0, out.size, block):
+            qb = [a[start:start + block] for a in q]
+            ie, js, kt = (_node_index(x, xq, rule[0]) for x, xq, rule in zip(nodes, qb, rules))
+            a = G[ie[:, :, None, None], js[:, None, :, None], kt[:, None, None, :]]  # (Q, me, ms, mt)
+            for x, xq, rule in zip(nodes, qb, rules):
+                a = _reduce_axis(a, x, xq, rule)
+            out[start:start + block] = a
+        return out.reshape(shape)
@@ -4,6 +4,8 @@ from dataclasses import dataclass
 from typing import Dict, List, Optional
 import numpy as np
 
+from ..interpolation import CurveInterpolator, normalise_method
+
 
 @dataclass(frozen=True)
 class YieldCurveMeta:
@@ -37,21 +39,35 @@ class YieldCurve:
         idx = np.argsort(self.maturity_days)
         self.maturity_days = self.maturity_days[idx]
         self.zero_rates = self.zero_rates[idx]
+        # knot coefficients for meta.interp_type / meta.extrap_type, computed once;
+        # labels without a supported scheme keep the historical linear interpolation
+        self.interpolator = CurveInterpolator(
+            self.maturity_days,
+            self.zero_rates,
+            method=normalise_method(meta.interp_type, default="lin"),
+            extrapolation=meta.extrap_type,
+        )
 
     def zero_rate(self, maturity_days: float) -> float:
-        """Linear interpolation of zero rates."""
-        x = float(maturity_days)
-        xs, ys = self.maturity_days, self.zero_rates
-
-        if x <= xs[0]:
-            return float(ys[0] + (ys[1] - ys[0]) * (x - xs[0]) / (xs[1] - xs[0]))
-        if x >= xs[-1]:
-            return float(ys[-2] + (ys[-1] - ys[-2]) * (x - xs[-2]) / (xs[-1] - xs[-2]))
-
-        return float(np.interp(x, xs, ys))
+        """Interpolated zero rate (meta.interp_type / meta.extrap_type)."""
+        return float(self.interpolator.zero_rates(np.array([float(maturity_days)]))[0])
 
     def df(self, maturity_days: float) -> float:
         """Discount factor using continuous compounding (simple default)."""
-        t = float(maturity_days) / 365.0
-        r = self.zero_rate(maturity_days)
-        return float(np.exp(-r * t))
+        return float(self.interpolator.dfs(np.array([float(maturity_days)]))[0])
+
+    def zero_rates_at(self, maturity_days: np.ndarray) -> np.ndarray:
+        """Vectorised zero_rate over an array of maturities in days, same shape as input."""
+        return self.interpolator.zero_rates(maturity_days)
+
+    def dfs(self, maturity_days: np.ndarray) -> np.ndarray:
+        """Vectorised df over an array of maturities in days, same shape as input."""
+        return self.interpolator.dfs(maturity_days)
+
+    def batch(self, times_years: np.ndarray) -> np.ndarray:
+        """DF(0,t) for an array of times in years (vectorised df0 protocol)."""
+        return self.dfs(np.asarray(times_years, dtype=float) * 365.0)
+
+    def __call__(self, t_years: float) -> float:
+        """DF(0,t) with t in years, so the curve can be passed as df0."""
+        return float(self.batch(np.array([t_years]))[0])
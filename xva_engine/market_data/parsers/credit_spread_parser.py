@@ -5,7 +5,7 @@ from typing import List, Optional
 import pandas as pd
 import numpy as np
 
-from ..objects.credit_curve import CreditCurveMeta, CreditSpreadCurve
+from ..objects.credit_curve import CreditCurveMeta, CreditSpreadCurve, Discount, HazardCurve, bootstrap_hazard_curves
 
 
 @dataclass(frozen=True)
@@ -161,3 +161,8 @@ class CreditSpreadParser:
     @staticmethod
     def to_objects(rows: List[ParsedCreditCurveRow]) -> List[CreditSpreadCurve]:
         return [CreditSpreadCurve(r.meta, r.maturity_months, r.par_spreads) for r in rows]
+
+    @classmethod
+    def to_hazard_curves(cls, rows: List[ParsedCreditCurveRow], discount: Discount = 0.0) -> List[HazardCurve]:
+        """Bootstrapped hazard curves, stacked over rows sharing pillars."""
+        return bootstrap_hazard_curves(cls.to_objects(rows), discount=discount)
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, List, Tuple
+from itertools import chain
+from typing import Dict, Iterator, List, Tuple
 import numpy as np
 import pandas as pd
 
@@ -43,6 +44,88 @@ class SwaptionVolatilityParser:
                 out.append(self._parse_one_line(line))
         return out
 
+    def iter_cubes(self, path: str, chunk_rows: int = 1024) -> Iterator[SwaptionVolCube]:
+        """
+        Stream the file and yield one SwaptionVolCube per
+        (cube_id, observation_date) group, in file order.
+
+        Lines are read chunk_rows at a time and each chunk's numeric fields
+        are parsed as one block (_parse_block); memory stays bounded by a
+        chunk plus the group being assembled, and each cube is yielded as
+        soon as its last row has been read. Rows of a group must be
+        contiguous (as written by the simulator and exports).
+        """
+        if chunk_rows <= 0:
+            raise ValueError("chunk_rows must be a positive integer.")
+        seen = set()
+        pending: List[ParsedSwaptionVolRow] = []
+
+        def complete_groups(rows: List[ParsedSwaptionVolRow]) -> Iterator[SwaptionVolCube]:
+            nonlocal pending
+            for r in rows:
+                key = (r.meta.cube_id, r.meta.observation_date)
+                if pending and key != (pending[0].meta.cube_id, pending[0].meta.observation_date):
+                    yield self.to_cube(pending)
+                    seen.add((pending[0].meta.cube_id, pending[0].meta.observation_date))
+                    pending = []
+                if not pending and key in seen:
+                    raise ValueError(f"Rows of swaption vol cube {key[0]} {key[1]} are not contiguous in {path}")
+                pending.append(r)
+
+        with open(path, "r", encoding="utf-8") as f:
+            chunk: List[str] = []
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                chunk.append(line)
+                if len(chunk) == chunk_rows:
+                    yield from complete_groups(self._parse_block(chunk))
+                    chunk = []
+            if chunk:
+                yield from complete_groups(self._parse_block(chunk))
+        if pending:
+            yield self.to_cube(pending)
+
+    def _parse_block(self, lines: List[str]) -> List[ParsedSwaptionVolRow]:
+        """
+        Parse a block of lines at once. Rows are grouped by layout (number of
+        fields) and the numeric fields of each group are converted as one
+        (rows, fields) array. Groups with stray tokens ('...', blanks, text)
+        go through _parse_one_line, which also produces the error messages.
+        """
+        F = self.FIXED_COLS
+        parts = [line.split(",") for line in lines]
+        layouts: Dict[int, List[int]] = {}
+        for i, p in enumerate(parts):
+            while p and not p[-1].strip():
+                p.pop()
+            layouts.setdefault(len(p), []).append(i)
+
+        out: List[ParsedSwaptionVolRow] = [None] * len(lines)
+        metas: Dict[Tuple[str, ...], SwaptionVolMeta] = {}
+        for n_tok, idx in layouts.items():
+            n_dyn = n_tok - F
+            if n_dyn < 6 or n_dyn % 2:
+                continue
+            try:
+                # float() accepts the surrounding blanks the line parser strips
+                nums = np.fromiter(
+                    map(float, chain.from_iterable(parts[i][F:] for i in idx)), dtype=float, count=len(idx) * n_dyn
+                ).reshape(len(idx), n_dyn)
+            except ValueError:
+                continue
+            expiry, strike = nums[:, 0].tolist(), nums[:, 1].tolist()
+            tenors, vols = nums[:, 2::2], nums[:, 3::2]
+            for j, i in enumerate(idx):
+                key = tuple(parts[i][:F])
+                meta = metas.get(key)
+                if meta is None:
+                    meta = metas[key] = SwaptionVolMeta(*(t.strip() for t in key))
+                out[i] = ParsedSwaptionVolRow(meta, expiry[j], strike[j], tenors[j], vols[j])
+
+        return [r if r is not None else self._parse_one_line(line) for r, line in zip(out, lines)]
+
     def _parse_one_line(self, line: str) -> ParsedSwaptionVolRow:
         parts = [p.strip() for p in line.split(",")]
         while parts and parts[-1] == "":
@@ -180,7 +263,30 @@ class SwaptionVolatilityParser:
 
         # All rows share same meta for a given (cube_id, obs_date) in your dataset.
         meta = rows[0].meta
+        groups = {(r.meta.cube_id, r.meta.observation_date) for r in rows}
+        if len(groups) > 1:
+            raise ValueError(
+                f"Rows span {len(groups)} (cube_id, observation_date) groups; use to_cubes or iter_cubes."
+            )
+
+        # common tenor pillars (the usual layout): stack straight into the dense grid
+        tenors = rows[0].tenor_days
+        if np.unique(tenors).size == tenors.size and all(np.array_equal(r.tenor_days, tenors) for r in rows):
+            expiries, ie = np.unique([r.expiry_months for r in rows], return_inverse=True)
+            strikes, js = np.unique([r.strike for r in rows], return_inverse=True)
+            vols = np.full((expiries.size, strikes.size, tenors.size), np.nan)
+            vols[ie, js] = np.stack([r.vols for r in rows])
+            return SwaptionVolCube.from_arrays(meta, expiries, strikes, tenors, vols)
+
         cube = SwaptionVolCube(meta)
         for r in rows:
             cube.add_slice(r.expiry_months, r.strike, r.tenor_days, r.vols)
         return cube
+
+    @classmethod
+    def to_cubes(cls, rows: List[ParsedSwaptionVolRow]) -> List[SwaptionVolCube]:
+        """One cube per (cube_id, observation_date) group, in order of first appearance."""
+        groups: Dict[Tuple[str, str], List[ParsedSwaptionVolRow]] = {}
+        for r in rows:
+            groups.setdefault((r.meta.cube_id, r.meta.observation_date), []).append(r)
+        return [cls.to_cube(g) for g in groups.values()]
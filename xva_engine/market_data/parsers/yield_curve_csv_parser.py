@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 import pandas as pd
 import numpy as np
 
@@ -81,8 +81,9 @@ class YieldCurveCsvParser:
         df = pd.read_csv(csv_path, header=0 if self.has_header else None)
 
         rows: List[ParsedYieldCurveRow] = []
-        for _, r in df.iterrows():
-            parsed = self._parse_single_row(r)
+        # plain tuples: no per-row Series as with iterrows
+        for values in df.itertuples(index=False, name=None):
+            parsed = self._parse_single_row(values)
             if parsed is not None:
                 rows.append(parsed)
 
@@ -91,8 +92,8 @@ class YieldCurveCsvParser:
 
         return rows
 
-    def _parse_single_row(self, row: pd.Series) -> Optional[ParsedYieldCurveRow]:
-        values = row.tolist()
+    def _parse_single_row(self, row: Sequence[Any]) -> Optional[ParsedYieldCurveRow]:
+        values = list(row)
 
         # drop trailing NaNs / empty strings
         while values and (values[-1] is None or (isinstance(values[-1], float) and np.isnan(values[-1])) or str(values[-1]).strip() == ""):
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
+import io
 import re
 import pandas as pd
 import numpy as np
@@ -15,6 +16,14 @@ META_COLS_LONG = [
 ]
 
 
+def _float_or_nan(token: str) -> float:
+    """float(token), or NaN when float() rejects it."""
+    try:
+        return float(token)
+    except ValueError:
+        return float("nan")
+
+
 @dataclass(frozen=True)
 class ParsedCurveRow:
     meta: YieldCurveMeta
@@ -22,6 +31,89 @@ class ParsedCurveRow:
     zero_rates: np.ndarray
 
 
+@dataclass(frozen=True)
+class YieldCurvePanel:
+    """
+    Dense history of wide-format curve snapshots.
+
+    meta: one row per snapshot, columns META_COLS_LONG (strings)
+    maturity_days: (n_snapshots, K) pillar maturities, NaN-padded
+    zero_rates: (n_snapshots, K) zero rates, NaN-padded
+    n_pillars: (n_snapshots,) number of pillars of each snapshot
+
+    ParsedCurveRow objects are only built on demand (row, rows, iteration).
+    """
+    meta: pd.DataFrame
+    maturity_days: np.ndarray
+    zero_rates: np.ndarray
+    n_pillars: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.n_pillars)
+
+    def __iter__(self) -> Iterator[ParsedCurveRow]:
+        for i in range(len(self)):
+            yield self.row(i)
+
+    @property
+    def pillars_days(self) -> np.ndarray:
+        """Pillars (K,) shared by all snapshots; raises if the snapshots differ."""
+        if len(self) == 0:
+            return np.empty(0)
+        first = self.maturity_days[0]
+        same = np.all(self.n_pillars == self.n_pillars[0]) and np.array_equal(
+            self.maturity_days, np.broadcast_to(first, self.maturity_days.shape), equal_nan=True
+        )
+        if not same:
+            raise ValueError("Snapshots do not share a common pillar grid.")
+        return first[: self.n_pillars[0]]
+
+    def row_meta(self, i: int) -> YieldCurveMeta:
+        return YieldCurveMeta(**{c: str(self.meta[c].iat[i]) for c in META_COLS_LONG})
+
+    def row(self, i: int) -> ParsedCurveRow:
+        k = int(self.n_pillars[i])
+        return ParsedCurveRow(
+            meta=self.row_meta(i),
+            maturity_days=self.maturity_days[i, :k].copy(),
+            zero_rates=self.zero_rates[i, :k].copy(),
+        )
+
+    def rows(self) -> List[ParsedCurveRow]:
+        return [self.row(i) for i in range(len(self))]
+
+    def select(self, mask: np.ndarray) -> "YieldCurvePanel":
+        """Sub-panel of the snapshots where mask is True (or at the given indices)."""
+        idx = np.arange(len(self))[np.asarray(mask)]
+        return YieldCurvePanel(
+            meta=self.meta.iloc[idx].reset_index(drop=True),
+            maturity_days=self.maturity_days[idx],
+            zero_rates=self.zero_rates[idx],
+            n_pillars=self.n_pillars[idx],
+        )
+
+    def for_curve(self, curve_id: str) -> "YieldCurvePanel":
+        return self.select(self.meta["curve_id"].to_numpy() == curve_id)
+
+    def to_objects(self) -> List[YieldCurve]:
+        return YieldCurveParser.to_objects(self.rows())
+
+    @classmethod
+    def from_rows(cls, rows: List[ParsedCurveRow]) -> "YieldCurvePanel":
+        """Stack ParsedCurveRow objects into a panel (NaN-padded to the longest row)."""
+        n_pillars = np.array([len(r.maturity_days) for r in rows], dtype=int)
+        k = int(n_pillars.max()) if len(rows) else 0
+        maturity_days = np.full((len(rows), k), np.nan)
+        zero_rates = np.full((len(rows), k), np.nan)
+        for i, r in enumerate(rows):
+            maturity_days[i, : n_pillars[i]] = r.maturity_days
+            zero_rates[i, : n_pillars[i]] = r.zero_rates
+        meta = pd.DataFrame(
+            [[getattr(r.meta, c) for c in META_COLS_LONG] for r in rows], columns=META_COLS_LONG, dtype=str
+        )
+        return cls(meta=meta, maturity_days=maturity_days, zero_rates=zero_rates, n_pillars=n_pillars)
+
+
 class YieldCurveParser:
     """
     Parser for yield curves that supports:
@@ -51,6 +143,19 @@ class YieldCurveParser:
         # Wide format: read raw lines
         return self._parse_wide_lines(path)
 
+    def parse_panel(self, path: str) -> YieldCurvePanel:
+        """
+        Same detection as parse, returning a YieldCurvePanel (wide files are
+        never expanded into ParsedCurveRow objects).
+        """
+        try:
+            df = pd.read_csv(path)
+            if "maturity_days" in df.columns and ("yield" in df.columns or "zero_rate" in df.columns):
+                return YieldCurvePanel.from_rows(self._parse_long_df(df))
+        except Exception:
+            pass
+        return self.parse_wide_panel(path)
+
     # ---------- LONG FORMAT ----------
     def _parse_long_df(self, df: pd.DataFrame) -> List[ParsedCurveRow]:
         ycol = "yield" if "yield" in df.columns else "zero_rate"
@@ -80,14 +185,121 @@ class YieldCurveParser:
 
     # ---------- WIDE FORMAT ----------
     def _parse_wide_lines(self, path: str) -> List[ParsedCurveRow]:
-        rows: List[ParsedCurveRow] = []
+        return self.parse_wide_panel(path).rows()
+
+    def parse_wide_panel(self, path: str) -> YieldCurvePanel:
+        """
+        Parse a whole wide-format file into a YieldCurvePanel.
+
+        The file is tokenised in one pass (pandas C reader) and the '...'
+        glue, maturity detection and yield extraction run on the flattened
+        token array with numpy string ufuncs, following the same rules as
+        _parse_one_wide_line.
+        """
         with open(path, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                rows.append(self._parse_one_wide_line(line))
-        return rows
+            text = f.read()
+        n_cols = max(8, max((line.count(",") for line in text.splitlines()), default=0) + 1)
+        if not text.strip():
+            return YieldCurvePanel(
+                meta=pd.DataFrame(columns=META_COLS_LONG, dtype=str),
+                maturity_days=np.empty((0, 0)),
+                zero_rates=np.empty((0, 0)),
+                n_pillars=np.empty(0, dtype=int),
+            )
+
+        df = pd.read_csv(
+            io.StringIO(text), header=None, names=range(n_cols), dtype=str,
+            keep_default_na=False, skip_blank_lines=True, engine="c",
+        )
+        # the C reader skips blank and whitespace-only lines, as the line parser
+        # does; separator-only lines such as ",,," are kept and fail as too short
+        tokens = df.to_numpy(dtype=str)
+        if " " in text or "\t" in text:
+            tokens = np.char.strip(tokens)
+        filled = tokens != ""
+        n = tokens.shape[0]
+
+        # row length once trailing empties are dropped (0 for separator-only rows)
+        length = np.where(filled.any(axis=1), tokens.shape[1] - np.argmax(filled[:, ::-1], axis=1), 0)
+
+        def line_of(i: int) -> str:
+            lines = [line.strip() for line in text.split("\n") if line.strip()]
+            if len(lines) == n:
+                return lines[i][:120]
+            return ",".join(tokens[i, :length[i]])[:120]
+
+        short = np.flatnonzero(length < 10)
+        if short.size:
+            raise ValueError(f"Wide row too short: {line_of(short[0])}...")
+
+        meta = pd.DataFrame(tokens[:, :8].astype(object), columns=META_COLS_LONG)
+
+        # flatten the dynamic block row by row, without the trailing empties
+        dyn = tokens[:, 8:]
+        in_row = np.arange(dyn.shape[1])[None, :] < (length - 8)[:, None]
+        row_id = np.broadcast_to(np.arange(n)[:, None], dyn.shape)[in_row]
+        tok = dyn[in_row]
+
+        if "..." in text:
+            # "18...309" -> "18", "309"; a bare "..." (or a "..." tail) is dropped
+            head, _, tail = np.char.partition(tok, "...").T
+            glued = np.char.isdigit(head) & (np.char.str_len(tail) > 0)
+            tok = np.where(glued, head, tok)
+            order = np.argsort(np.concatenate([2 * np.arange(tok.size), 2 * np.flatnonzero(glued) + 1]), kind="stable")
+            row_id = np.concatenate([row_id, row_id[glued]])[order]
+            tok = np.concatenate([tok, tail[glued]])[order]
+            keep = tok != "..."
+            row_id, tok = row_id[keep], tok[keep]
+
+        # position of each token in its row
+        pos = np.arange(tok.size) - np.searchsorted(row_id, np.arange(n))[row_id]
+
+        # maturities: the leading run of digit tokens
+        is_int = np.char.isdigit(tok)
+        n_mat = np.bincount(row_id, minlength=n)
+        np.minimum.at(n_mat, row_id[~is_int], pos[~is_int])
+        if np.any(n_mat == 0):
+            raise ValueError(
+                f"Could not parse maturity pillars in wide row: {line_of(np.flatnonzero(n_mat == 0)[0])}..."
+            )
+        is_mat = pos < n_mat[row_id]
+
+        # yields: the first n_mat float tokens after the maturities
+        numeric = tok != ""
+        values = np.full(tok.size, np.nan)
+        try:
+            # float() over the whole column at C speed (same rounding as the line parser)
+            values[numeric] = np.fromiter(map(float, tok[numeric].tolist()), dtype=float)
+        except ValueError:
+            # stray non-numeric tokens, skipped as by the line parser; float() per
+            # token so exactly the tokens the line parser accepts are numeric
+            values[numeric] = np.fromiter(map(_float_or_nan, tok[numeric].tolist()), dtype=float)
+            nan_literal = np.char.lstrip(np.char.lower(tok), "+-") == "nan"
+            numeric &= ~np.isnan(values) | nan_literal
+        bad_mat = np.flatnonzero(is_mat & ~numeric)
+        if bad_mat.size:
+            raise ValueError(
+                f"Could not parse maturity pillars in wide row: {line_of(row_id[bad_mat[0]])}..."
+            )
+        is_yield = ~is_mat & numeric
+        y_row = row_id[is_yield]
+        y_rank = np.arange(y_row.size) - np.searchsorted(y_row, np.arange(n))[y_row]
+        take = y_rank < n_mat[y_row]
+        n_yld = np.bincount(y_row[take], minlength=n)
+        bad = np.flatnonzero(n_yld != n_mat)
+        if bad.size:
+            i = int(bad[0])
+            raise ValueError(
+                f"Yield count mismatch for {meta['curve_id'].iat[i]} {meta['observation_date'].iat[i]}: "
+                f"{n_mat[i]} maturities vs {n_yld[i]} yields"
+            )
+
+        K = int(n_mat.max())
+        maturity_days = np.full((n, K), np.nan)
+        zero_rates = np.full((n, K), np.nan)
+        maturity_days[row_id[is_mat], pos[is_mat]] = values[is_mat]
+        zero_rates[y_row[take], y_rank[take]] = values[is_yield][take]
+        return YieldCurvePanel(meta=meta, maturity_days=maturity_days, zero_rates=zero_rates, n_pillars=n_mat)
 
     def _parse_one_wide_line(self, line: str) -> ParsedCurveRow:
         # Split by commas (wide files are comma-separated)
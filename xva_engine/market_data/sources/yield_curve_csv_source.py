@@ -1,9 +1,11 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 from .base import MarketDataSource
+from ..cache import ParsedDataCache
 from ..environment import MarketDataEnvironment
-from ..parsers.yield_curve_parser import YieldCurveParser
+from ..objects.yield_curve import YieldCurve
+from ..parsers.yield_curve_parser import ParsedCurveRow, YieldCurveParser, YieldCurvePanel
 
 
 class YieldCurveCsvSource(MarketDataSource):
@@ -13,17 +15,46 @@ class YieldCurveCsvSource(MarketDataSource):
     Keys stored in env:
       curve:<curve_id>  -> YieldCurve object
       ts:<curve_id>     -> list[YieldCurve snapshots] (optional)
+
+    The file is parsed on first use, not in __init__. With a
+    ParsedDataCache the parsed panel is loaded from the cache when the file
+    is unchanged, and snapshots only build the curves they return.
     """
 
-    def __init__(self, csv_path: str):
+    def __init__(self, csv_path: str, cache: Optional[ParsedDataCache] = None):
         self.csv_path = csv_path
         self.parser = YieldCurveParser()
-        self.rows = self.parser.parse(csv_path)
-        self.curves = self.parser.to_objects(self.rows)
+        self.cache = cache
+        self._panel: Optional[YieldCurvePanel] = None
+        self._curves: Optional[List[YieldCurve]] = None
+
+    @property
+    def panel(self) -> YieldCurvePanel:
+        if self._panel is None:
+            if self.cache is not None:
+                self._panel = self.cache.yield_curve_panel(self.csv_path, self.parser)
+            else:
+                self._panel = self.parser.parse_panel(self.csv_path)
+        return self._panel
+
+    @property
+    def rows(self) -> List[ParsedCurveRow]:
+        return self.panel.rows()
+
+    @property
+    def curves(self) -> List[YieldCurve]:
+        if self._curves is None:
+            self._curves = self.panel.to_objects()
+        return self._curves
+
+    def _select(self, column: str, value: str) -> List[YieldCurve]:
+        if self._curves is not None:
+            return [c for c in self._curves if getattr(c.meta, column) == value]
+        return self.panel.select(self.panel.meta[column].to_numpy() == value).to_objects()
 
     def get_snapshot(self, as_of: str) -> MarketDataEnvironment:
         data: Dict[str, Any] = {}
-        selected = [c for c in self.curves if c.meta.observation_date == as_of]
+        selected = self._select("observation_date", as_of)
         if not selected:
             raise ValueError(f"No curves for as_of={as_of} in {self.csv_path}")
 
@@ -33,4 +64,4 @@ class YieldCurveCsvSource(MarketDataSource):
 
     def get_time_series(self, identifier: str, start: str, end: str):
         # minimal: return all snapshots for curve_id (you can add proper date filtering later)
-        return [c for c in self.curves if c.meta.curve_id == identifier]
+        return self._select("curve_id", identifier)
@@ -4,6 +4,8 @@ from dataclasses import dataclass
 from typing import List, Literal, Optional
 import numpy as np
 
+from .interpolation import CurveInterpolator, normalise_method
+
 
 InterpType = Literal["lin", "log-lin", "cubic"]
 Compounding = Literal["CONTINUOUS", "ANNUAL", "SEMIANNUAL", "QUARTERLY", "DAILY"]
@@ -61,35 +63,63 @@ class YieldCurve:
         self.maturities_days = maturities_days[idx]
         self.zero_rates = zero_rates[idx]
         self.allow_extrapolation = allow_extrapolation
-
-    def _interp_lin(self, x: float) -> float:
+        # knot coefficients for meta.interpolation / meta.extrapolation, computed once;
+        # labels without a supported scheme keep the historical linear interpolation
+        self.interpolator = CurveInterpolator(
+            self.maturities_days,
+            self.zero_rates,
+            method=normalise_method(meta.interpolation, default="lin"),
+            extrapolation=meta.extrapolation,
+        )
+
+    def _check_range(self, x: np.ndarray) -> None:
         xs = self.maturities_days
-        ys = self.zero_rates
-
-        if not self.allow_extrapolation:
-            if x < xs[0] or x > xs[-1]:
-                raise ValueError(f"Requested maturity {x} outside curve range [{xs[0]}, {xs[-1]}].")
-
-        # numpy.interp extrapolates flat outside bounds, so do explicit linear extrap if allowed
-        if x <= xs[0]:
-            # linear extrap
-            return ys[0] + (ys[1] - ys[0]) * (x - xs[0]) / (xs[1] - xs[0])
-        if x >= xs[-1]:
-            return ys[-2] + (ys[-1] - ys[-2]) * (x - xs[-2]) / (xs[-1] - xs[-2])
-
-        return float(np.interp(x, xs, ys))
+        if not self.allow_extrapolation and x.size:
+            if np.min(x) < xs[0] or np.max(x) > xs[-1]:
+                raise ValueError(f"Requested maturities outside curve range [{xs[0]}, {xs[-1]}].")
 
     def zero_rate(self, maturity_days: float) -> float:
         """
         Return interpolated zero rate at maturity (in days).
         """
-        # For now: only linear. You can extend to log-linear/cubic later.
-        return self._interp_lin(float(maturity_days))
+        return float(self.zero_rates_at(np.array([float(maturity_days)]))[0])
 
     def df(self, maturity_days: float) -> float:
         """
         Discount factor using continuous compounding (default).
         """
-        t = float(maturity_days) / 365.0
-        r = self.zero_rate(maturity_days)
-        return float(np.exp(-r * t))
+        return float(self.dfs(np.array([float(maturity_days)]))[0])
+
+    def zero_rates_at(self, maturities_days: np.ndarray) -> np.ndarray:
+        """
+        Zero rates at an array of maturities (in days), same shape as input.
+
+        Interpolation follows meta.interpolation ("lin", "log-lin" or monotone
+        "cubic") and meta.extrapolation; see CurveInterpolator.
+        """
+        x = np.asarray(maturities_days, dtype=float)
+        self._check_range(x)
+        return self.interpolator.zero_rates(x)
+
+    def dfs(self, maturities_days: np.ndarray) -> np.ndarray:
+        """
+        Discount factors at an array of maturities (in days), same shape as input.
+        """
+        x = np.asarray(maturities_days, dtype=float)
+        self._check_range(x)
+        return self.interpolator.dfs(x)
+
+    def batch(self, times_years: np.ndarray) -> np.ndarray:
+        """
+        Discount factors DF(0,t) for an array of times in years (df0 protocol).
+
+        One vectorised evaluation, same shape as times_years; used by the
+        IR mean function builders instead of one df() call per time.
+        """
+        return self.dfs(np.asarray(times_years, dtype=float) * 365.0)
+
+    def __call__(self, t_years: float) -> float:
+        """
+        DF(0,t) with t in years, so the curve can be passed as df0.
+        """
+        return float(self.batch(np.array([t_years]))[0])
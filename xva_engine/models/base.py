@@ -1,7 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Union
 import numpy as np
 from ..core.time_grid import TimeGrid
+from ..simulation.normals import NormalSource
 from ..market_data.environment import MarketDataEnvironment
 
 
@@ -25,6 +26,11 @@ class RiskFactorModel(ABC):
     and path generation. Discretisation details (Euler, Milstein, ...)
     can either be implemented inside the model or delegated to the
     simulation driver.
+
+    Models that also implement the stepping protocol (:meth:`init_state`
+    and :meth:`step`) can be advanced jointly by the
+    :class:`~xva_engine.simulation.driver.SimulationDriver` with
+    correlated Brownian increments in a single time loop.
     """
 
     def __init__(self, name: str, params: dict):
@@ -50,7 +56,7 @@ class RiskFactorModel(ABC):
         self,
         time_grid: TimeGrid,
         n_scenarios: int,
-        rng: np.random.Generator,
+        rng: Union[np.random.Generator, NormalSource],
         **kwargs: Any,
     ) -> np.ndarray:
         """
@@ -62,8 +68,9 @@ class RiskFactorModel(ABC):
             Time grid for simulation.
         n_scenarios : int
             Number of Monte Carlo scenarios.
-        rng : numpy.random.Generator
-            Random number generator.
+        rng : numpy.random.Generator or NormalSource
+            Random number generator, or a `NormalSource` (quasi-random,
+            antithetic, ...) supplying the normals step by step.
         **kwargs
             Optional implementation-specific arguments.
 
@@ -74,3 +81,50 @@ class RiskFactorModel(ABC):
             ``(n_scenarios, n_times, dim)``.
         """
         raise NotImplementedError
+
+    def init_state(self, n_scenarios: int) -> np.ndarray:
+        """
+        Initial state of the model at the first time of the grid.
+
+        Parameters
+        ----------
+        n_scenarios : int
+            Number of Monte Carlo scenarios.
+
+        Returns
+        -------
+        numpy.ndarray
+            State of shape ``(n_scenarios,)``; this is also the value
+            stored in the risk factor cube.
+        """
+        raise NotImplementedError
+
+    def step(self, state: np.ndarray, dt: float, z: np.ndarray) -> np.ndarray:
+        """
+        Advance the state by one time step.
+
+        Parameters
+        ----------
+        state : numpy.ndarray
+            Current state of shape ``(n_scenarios,)``.
+        dt : float
+            Time step in year fractions.
+        z : numpy.ndarray
+            Standard normal increments of shape ``(n_scenarios,)``,
+            already correlated with the other risk factors.
+
+        Returns
+        -------
+        numpy.ndarray
+            New state of shape ``(n_scenarios,)``.
+        """
+        raise NotImplementedError
+
+    @property
+    def supports_stepping(self) -> bool:
+        """Whether the model overrides :meth:`init_state` and :meth:`step`."""
+        cls = type(self)
+        return (
+            cls.init_state is not RiskFactorModel.init_state
+            and cls.step is not RiskFactorModel.step
+        )
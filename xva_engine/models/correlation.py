@@ -1,15 +1,218 @@
+from collections import OrderedDict
 from dataclasses import dataclass
+from typing import Optional, Tuple
+import hashlib
 import numpy as np
 
 
+_FACTOR_CACHE: "OrderedDict[Tuple, CorrelationFactor]" = OrderedDict()
+_FACTOR_CACHE_SIZE = 64
+
+
+@dataclass(frozen=True)
+class CorrelationFactor:
+    """
+    Factor ``L`` of a correlation matrix, ``C ~= L @ L.T``.
+
+    Parameters
+    ----------
+    matrix : numpy.ndarray
+        Factor of shape ``(n_factors, rank)``. Read-only, as factors are
+        shared through the factorisation cache.
+    method : str
+        How the factor was obtained: ``"cholesky"`` (exact, matrix was
+        positive definite), ``"eigen"`` (full-rank eigen factor of the
+        matrix or of its nearest correlation matrix) or ``"low_rank"``
+        (eigen-truncated factor with rows rescaled to unit variance).
+    """
+    matrix: np.ndarray
+    method: str
+
+    @property
+    def n_factors(self) -> int:
+        return self.matrix.shape[0]
+
+    @property
+    def rank(self) -> int:
+        """Number of independent normals consumed by :meth:`apply`."""
+        return self.matrix.shape[1]
+
+    def apply(self, z: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Correlate independent standard normals.
+
+        Parameters
+        ----------
+        z : numpy.ndarray
+            Array of shape ``(..., rank)``.
+        out : numpy.ndarray, optional
+            Preallocated output of shape ``(..., n_factors)``.
+
+        Returns
+        -------
+        numpy.ndarray
+            Correlated normals of shape ``(..., n_factors)``. For a
+            low-rank factor this costs ``O(n_factors * rank)`` per draw
+            instead of ``O(n_factors ** 2)``.
+        """
+        return np.matmul(z, self.matrix.T, out=out)
+
+
+def nearest_correlation_matrix(
+    corr: np.ndarray,
+    tol: float = 1e-10,
+    max_iter: int = 200,
+) -> np.ndarray:
+    """
+    Nearest correlation matrix in Frobenius norm (Higham, 2002).
+
+    Alternating projections with Dykstra's correction onto the positive
+    semi-definite cone and the unit-diagonal matrices.
+
+    Parameters
+    ----------
+    corr : numpy.ndarray
+        Symmetric matrix of shape ``(n, n)``, typically an estimated
+        correlation matrix that is not positive semi-definite.
+    tol : float
+        Relative convergence tolerance.
+    max_iter : int
+        Maximum number of projection sweeps.
+
+    Returns
+    -------
+    numpy.ndarray
+        Positive semi-definite matrix with unit diagonal.
+    """
+    a = 0.5 * (np.asarray(corr, dtype=float) + np.asarray(corr, dtype=float).T)
+    y = a.copy()
+    ds = np.zeros_like(a)
+    for _ in range(max_iter):
+        r = y - ds
+        w, v = np.linalg.eigh(r)
+        x = (v * np.maximum(w, 0.0)) @ v.T
+        ds = x - r
+        y_prev = y
+        y = x.copy()
+        np.fill_diagonal(y, 1.0)
+        if np.linalg.norm(y - y_prev) <= tol * np.linalg.norm(y):
+            break
+    return 0.5 * (y + y.T)
+
+
+def _eigen_factor(corr: np.ndarray, rank: Optional[int]) -> np.ndarray:
+    w, v = np.linalg.eigh(corr)
+    order = np.argsort(w)[::-1]
+    w, v = w[order], v[:, order]
+    if rank is not None:
+        w, v = w[:rank], v[:, :rank]
+    return v * np.sqrt(np.maximum(w, 0.0))
+
+
+def factorise_correlation(
+    corr: np.ndarray,
+    max_rank: Optional[int] = None,
+    psd_tol: float = 1e-10,
+) -> CorrelationFactor:
+    """
+    Factorise a correlation matrix, with caching and PSD repair.
+
+    Parameters
+    ----------
+    corr : numpy.ndarray
+        Correlation matrix of shape ``(n, n)``.
+    max_rank : int, optional
+        If smaller than ``n``, return an eigen-truncated factor keeping the
+        ``max_rank`` largest eigenvalues. Rows are rescaled so that the
+        correlated normals keep unit variance.
+    psd_tol : float
+        Eigenvalues above ``-psd_tol`` are treated as non-negative; below
+        that the matrix is first repaired with
+        :func:`nearest_correlation_matrix`.
+
+    Returns
+    -------
+    CorrelationFactor
+        Factor obtained, in order of preference, by Cholesky, eigen
+        decomposition, or eigen decomposition of the nearest correlation
+        matrix.
+
+    Notes
+    -----
+    Factors are cached keyed by a hash of the matrix bytes, so repeated
+    calls with the same matrix (every step, every simulator) only
+    factorise once.
+    """
+    corr = np.ascontiguousarray(corr, dtype=float)
+    if corr.ndim != 2 or corr.shape[0] != corr.shape[1]:
+        raise ValueError(f"corr must be a square matrix; got shape {corr.shape}")
+    n = corr.shape[0]
+    if max_rank is not None and max_rank <= 0:
+        raise ValueError("max_rank must be a positive integer.")
+    rank = None if max_rank is None or max_rank >= n else int(max_rank)
+
+    key = (hashlib.sha1(corr.tobytes()).hexdigest(), corr.shape, rank, psd_tol)
+    cached = _FACTOR_CACHE.get(key)
+    if cached is not None:
+        _FACTOR_CACHE.move_to_end(key)
+        return cached
+
+    if rank is None:
+        try:
+            matrix, method = np.linalg.cholesky(corr), "cholesky"
+        except np.linalg.LinAlgError:
+            method = "eigen"
+    else:
+        method = "low_rank"
+
+    if method != "cholesky":
+        target = corr
+        if np.linalg.eigvalsh(corr)[0] < -psd_tol:
+            target = nearest_correlation_matrix(corr)
+        matrix = _eigen_factor(target, rank)
+        if rank is not None:
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            matrix = matrix / np.where(norms > 0.0, norms, 1.0)
+
+    matrix.setflags(write=False)
+    factor = CorrelationFactor(matrix=matrix, method=method)
+    _FACTOR_CACHE[key] = factor
+    if len(_FACTOR_CACHE) > _FACTOR_CACHE_SIZE:
+        _FACTOR_CACHE.popitem(last=False)
+    return factor
+
+
 @dataclass
 class CorrelationModel:
-    """Encapsulates correlation structure and sampling."""
+    """
+    Encapsulates correlation structure and sampling.
+
+    Parameters
+    ----------
+    corr_matrix : numpy.ndarray
+        Correlation matrix of shape ``(n_factors, n_factors)``.
+    max_rank : int, optional
+        If set, sampling uses an eigen-truncated factor of this rank
+        (see :func:`factorise_correlation`).
+    """
     corr_matrix: np.ndarray
+    max_rank: Optional[int] = None
+
+    def factor(self) -> CorrelationFactor:
+        """Return the (cached) factor used for sampling."""
+        return factorise_correlation(self.corr_matrix, max_rank=self.max_rank)
 
     def cholesky(self) -> np.ndarray:
-        """Return Cholesky factor."""
-        return np.linalg.cholesky(self.corr_matrix)
+        """Return full-rank factor (Cholesky, or eigen factor if not PD)."""
+        return factorise_correlation(self.corr_matrix).matrix
+
+    def apply(self, z: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Correlate independent normals of shape ``(..., rank)``.
+
+        See :meth:`CorrelationFactor.apply`.
+        """
+        return self.factor().apply(z, out=out)
 
     def sample_normals(
         self,
@@ -18,10 +221,9 @@ class CorrelationModel:
         n_steps: int
     ) -> np.ndarray:
         """
-        Sample correlated standard normals using Cholesky.
+        Sample correlated standard normals using the cached factor.
         Shape: [n_scenarios, n_steps, n_factors]
         """
-        n_factors = self.corr_matrix.shape[0]
-        L = self.cholesky()
-        z = rng.standard_normal(size=(n_scenarios, n_steps, n_factors))
-        return z @ L.T
+        factor = self.factor()
+        z = rng.standard_normal(size=(n_scenarios, n_steps, factor.rank))
+        return factor.apply(z)
@@ -1,6 +1,7 @@
 import numpy as np
-from typing import Any
+from typing import Any, Union
 from .base import RiskFactorModel
+from ..simulation.normals import NormalSource, as_normal_source
 from ..core.time_grid import TimeGrid
 from ..market_data.environment import MarketDataEnvironment
 
@@ -43,12 +44,15 @@ class GBMEquityModel(RiskFactorModel):
         self,
         time_grid: TimeGrid,
         n_scenarios: int,
-        rng: np.random.Generator,
+        rng: Union[np.random.Generator, NormalSource],
         **kwargs: Any,
     ) -> np.ndarray:
         """
         Simulate GBM equity paths using an Euler scheme on log S.
 
+        ``rng`` may be a generator (plain pseudo-random draws, as before)
+        or any `NormalSource`.
+
         Returns
         -------
         numpy.ndarray
@@ -57,20 +61,39 @@ class GBMEquityModel(RiskFactorModel):
         times = time_grid.as_array()
         n_times = times.shape[0]
 
-        spot = float(self.params["spot"])
-        mu = float(self.params["mu"])
-        sigma = float(self.params["sigma"])
-
         paths = np.zeros((n_scenarios, n_times), dtype=float)
-        paths[:, 0] = spot
+        paths[:, 0] = self.init_state(n_scenarios)
 
-        for i in range(1, n_times):
+        normals = as_normal_source(rng).iter_steps(n_scenarios, times, 1)
+        for i, z in enumerate(normals, start=1):
             dt = times[i] - times[i - 1]
-            # Normal increments
-            z = rng.standard_normal(size=n_scenarios)
-            # Log-Euler step: S_{t+dt} = S_t * exp((mu - 0.5 sigma^2) dt + sigma sqrt(dt) z)
-            drift = (mu - 0.5 * sigma ** 2) * dt
-            diffusion = sigma * np.sqrt(dt) * z
-            paths[:, i] = paths[:, i - 1] * np.exp(drift + diffusion)
+            paths[:, i] = self.step(paths[:, i - 1], dt, z[:, 0])
 
         return paths
+
+    def init_state(self, n_scenarios: int) -> np.ndarray:
+        """
+        Initial state: the spot price on every scenario.
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of shape ``(n_scenarios,)``.
+        """
+        return np.full(n_scenarios, float(self.params["spot"]), dtype=float)
+
+    def step(self, state: np.ndarray, dt: float, z: np.ndarray) -> np.ndarray:
+        """
+        One log-Euler step of the GBM dynamics.
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of shape ``(n_scenarios,)`` with the prices at ``t + dt``.
+        """
+        mu = float(self.params["mu"])
+        sigma = float(self.params["sigma"])
+        # Log-Euler step: S_{t+dt} = S_t * exp((mu - 0.5 sigma^2) dt + sigma sqrt(dt) z)
+        drift = (mu - 0.5 * sigma ** 2) * dt
+        diffusion = sigma * np.sqrt(dt) * z
+        return state * np.exp(drift + diffusion)
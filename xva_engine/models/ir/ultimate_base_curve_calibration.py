@@ -3,6 +3,8 @@ from __future__ import annotations
 from dataclasses import dataclass
 import numpy as np
 
+from ...simulation.risk_factors.ir.mean_function import evaluate_df0
+
 
 @dataclass(frozen=True)
 class MeanFunctionSpec:
@@ -14,7 +16,7 @@ class MeanFunctionSpec:
 def build_forward_forward_mean_function(
     time_grid: np.ndarray,            # year fractions (T,)
     pillars_days: np.ndarray,         # (K,) in days
-    df0: callable,                    # function t -> DF(0,t) with t in year fractions
+    df0: callable,                    # function t -> DF(0,t) with t in year fractions (df0.batch used if present)
     spec: MeanFunctionSpec = MeanFunctionSpec(),
 ) -> np.ndarray:
     """
@@ -24,10 +26,9 @@ def build_forward_forward_mean_function(
     t = np.asarray(time_grid, dtype=float)
     M = np.asarray(pillars_days, dtype=float) / spec.day_count  # (K,)
 
-    g = np.zeros((len(t), len(M)), dtype=float)
-    for i, ti in enumerate(t):
-        df_t = df0(ti)
-        df_t_M = np.array([df0(ti + Mk) for Mk in M], dtype=float)
-        f = -(1.0 / M) * np.log(df_t_M / df_t)
-        g[i, :] = np.maximum(f, spec.delta_floor)
-    return g
+    # one vectorised DF evaluation over (T,K+1) times: t and t+M_k
+    times = np.concatenate([t[:, None], t[:, None] + M[None, :]], axis=1)
+    dfs = evaluate_df0(df0, times)
+
+    f = -(1.0 / M) * np.log(dfs[:, 1:] / dfs[:, :1])
+    return np.maximum(f, spec.delta_floor)
@@ -5,6 +5,9 @@ from typing import Optional
 
 import numpy as np
 
+from ..correlation import factorise_correlation
+from ...simulation.normals import NormalSource, PseudoRandomNormals
+
 
 @dataclass(frozen=True)
 class UltimateBaseCurveIrParams:
@@ -69,7 +72,12 @@ class UltimateBaseCurveModel:
     Produces continuously compounded zero rates at fixed maturity pillars.
     """
 
-    def __init__(self, params: UltimateBaseCurveIrParams, corr: Optional[np.ndarray] = None):
+    def __init__(
+        self,
+        params: UltimateBaseCurveIrParams,
+        corr: Optional[np.ndarray] = None,
+        max_rank: Optional[int] = None,
+    ):
         self.params = params
         self.K = int(len(params.pillars_days))
 
@@ -81,8 +89,9 @@ class UltimateBaseCurveModel:
                 raise ValueError(f"corr must be ({self.K},{self.K})")
             self.corr = corr
 
-        # Cholesky for correlated normals
-        self.chol = np.linalg.cholesky(self.corr + 1e-12 * np.eye(self.K))
+        # factor for correlated normals (cached, with PSD repair / optional rank truncation)
+        self.factor = factorise_correlation(self.corr, max_rank=max_rank)
+        self.chol = self.factor.matrix
 
         # convert shift from bp to rate units
         self.shift = np.asarray(params.shift_bp, dtype=float) * 1e-4
@@ -95,11 +104,16 @@ class UltimateBaseCurveModel:
         mean_function: np.ndarray,      # g(t,k) shape (T,K)
         n_paths: int,
         seed: Optional[int] = None,
+        normals: Optional[NormalSource] = None,
+        dtype: np.dtype = np.float64,
     ) -> np.ndarray:
         """
         Returns simulated zero rates Y(t,k) as array shape (n_paths, T, K).
+        normals: source of the independent normals (default: pseudo-random from seed).
+        dtype: storage type of the returned rates (e.g. float32); the OU state stays float64.
         """
-        rng = np.random.default_rng(seed)
+        if normals is None:
+            normals = PseudoRandomNormals(seed)
         time_grid = np.asarray(time_grid, dtype=float)
         T = len(time_grid)
 
@@ -111,15 +125,15 @@ class UltimateBaseCurveModel:
 
         # state
         x = np.zeros((n_paths, self.K), dtype=float)
-        y = np.zeros((n_paths, T, self.K), dtype=float)
+        y = np.zeros((n_paths, T, self.K), dtype=dtype)
 
         # initial step (t=0)
         y[:, 0, :] = transform_shifted_exponential(x, mean_function[0], self.shift, v2_tk[0])
 
-        for i in range(1, T):
+        draws = normals.iter_steps(n_paths, time_grid, self.factor.rank)
+        for i, z in enumerate(draws, start=1):
             dt = time_grid[i] - time_grid[i - 1]
-            z = rng.standard_normal(size=(n_paths, self.K))
-            zc = z @ self.chol.T  # correlate across tenors
+            zc = self.factor.apply(z)  # correlate across tenors
 
             x = ou_exact_step(x, dt, self.lam, self.sigma, zc)
             y[:, i, :] = transform_shifted_exponential(x, mean_function[i], self.shift, v2_tk[i])
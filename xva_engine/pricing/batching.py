@@ -0,0 +1,95 @@
+from dataclasses import dataclass
+from typing import Dict, List, Sequence, Tuple
+import numpy as np
+from ..instruments.base import Instrument
+from ..instruments.vanilla import EuropeanOption
+
+
+@dataclass(frozen=True)
+class EuropeanOptionBatch:
+    """
+    Struct-of-arrays view of European options sharing one underlying.
+
+    Parameters
+    ----------
+    underlying : str
+        Common underlying risk factor name.
+    columns : numpy.ndarray
+        Integer positions of the trades in the original trade list, i.e.
+        their columns in the exposure cube. Shape ``(n,)``.
+    ids : list of str
+        Trade identifiers, aligned with ``columns``.
+    strikes : numpy.ndarray
+        Strikes, shape ``(n,)``.
+    maturities : numpy.ndarray
+        Maturities in year fractions, shape ``(n,)``.
+    is_call : numpy.ndarray
+        Boolean call flags, shape ``(n,)``. Any option type other than
+        ``"call"`` is treated as a put.
+    """
+    underlying: str
+    columns: np.ndarray
+    ids: List[str]
+    strikes: np.ndarray
+    maturities: np.ndarray
+    is_call: np.ndarray
+
+    @property
+    def size(self) -> int:
+        return int(self.columns.size)
+
+    @property
+    def sign(self) -> np.ndarray:
+        """Payoff sign: ``+1`` for calls, ``-1`` for puts."""
+        return np.where(self.is_call, 1.0, -1.0)
+
+    def column_index(self):
+        """
+        Index selecting the batch columns in an exposure array.
+
+        Returns a ``slice`` when the columns are contiguous (so that writes
+        are plain strided stores), otherwise the integer array.
+        """
+        c = self.columns
+        if c.size and np.all(np.diff(c) == 1):
+            return slice(int(c[0]), int(c[-1]) + 1)
+        return c
+
+
+def group_european_options(
+    trades: Sequence[Instrument],
+) -> Tuple[Dict[str, EuropeanOptionBatch], List[int]]:
+    """
+    Group European options by underlying into struct-of-arrays batches.
+
+    Parameters
+    ----------
+    trades : sequence of Instrument
+        Trades in exposure-cube column order.
+
+    Returns
+    -------
+    (dict, list of int)
+        Batches keyed by underlying, and the column positions of the
+        trades that are not `EuropeanOption` (left to the caller).
+    """
+    by_underlying: Dict[str, List[int]] = {}
+    others: List[int] = []
+    for k, trade in enumerate(trades):
+        if isinstance(trade, EuropeanOption):
+            by_underlying.setdefault(trade.underlying, []).append(k)
+        else:
+            others.append(k)
+
+    batches: Dict[str, EuropeanOptionBatch] = {}
+    for underlying, cols in by_underlying.items():
+        group = [trades[k] for k in cols]
+        batches[underlying] = EuropeanOptionBatch(
+            underlying=underlying,
+            columns=np.asarray(cols, dtype=np.intp),
+            ids=[t.id for t in group],
+            strikes=np.array([t.strike for t in group], dtype=float),
+            maturities=np.array([t.maturity for t in group], dtype=float),
+            is_call=np.array([t.option_type.lower() == "call" for t in group], dtype=bool),
+        )
+    return batches, others
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Optional, Sequence
 import numpy as np
 from ...instruments.base import Instrument
 from ..context import PricingContext
@@ -24,3 +25,42 @@ class PricingEngine(ABC):
         Default: raise unless overridden.
         """
         raise NotImplementedError
+
+    def price_paths_batch(
+        self,
+        trades: Sequence[Instrument],
+        cube: RiskFactorCube,
+        ctx: PricingContext,
+        out: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """
+        Price several trades along paths.
+
+        Parameters
+        ----------
+        trades : sequence of Instrument
+            Trades to price; trade ``k`` is written to ``out[:, :, k]``.
+        cube : RiskFactorCube
+            Simulated risk factors.
+        ctx : PricingContext
+            Market data and valuation settings.
+        out : numpy.ndarray, optional
+            Preallocated array of shape ``(n_scenarios, n_times, n_trades)``
+            (e.g. a block of the exposure cube) written in place.
+
+        Returns
+        -------
+        numpy.ndarray
+            ``out``, or a new array if none was given.
+
+        Notes
+        -----
+        Default: one :meth:`price_paths` call per trade. Engines override
+        this to price groups of similar trades in one broadcasted kernel.
+        """
+        if out is None:
+            n_scenarios, n_times, _ = cube.data.shape
+            out = np.zeros((n_scenarios, n_times, len(trades)))
+        for k, trade in enumerate(trades):
+            out[:, :, k] = self.price_paths(trade, cube, ctx)
+        return out
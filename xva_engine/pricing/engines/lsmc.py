@@ -1,6 +1,410 @@
-""" 
-Skeleton module for the XVA / CCR / PFE engine.
+from collections import OrderedDict
+from dataclasses import dataclass
+import hashlib
+from itertools import combinations_with_replacement
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import numpy as np
+from .base import PricingEngine
+from .analytic import _discount_factors
+from ..batching import EuropeanOptionBatch, group_european_options
+from ...instruments.base import Instrument
+from ..context import PricingContext
+from ...core.cube import RiskFactorCube
 
-Fill in with actual implementation or copy over the prepared skeleton code.
-"""
 
+def polynomial_basis(state: np.ndarray, degree: int) -> np.ndarray:
+    """
+    Monomials of total degree ``<= degree`` of a standardised state.
+
+    Parameters
+    ----------
+    state : numpy.ndarray
+        Regressors of shape ``(n_scenarios, n_state)``.
+    degree : int
+        Maximum total polynomial degree.
+
+    Returns
+    -------
+    numpy.ndarray
+        Design matrix of shape ``(n_scenarios, n_basis)``, first column
+        constant. Each regressor is centred and scaled by its standard
+        deviation first, which keeps the design well conditioned.
+    """
+    mean = state.mean(axis=0)
+    std = state.std(axis=0)
+    x = (state - mean) / np.where(std > 0.0, std, 1.0)
+
+    columns = [np.ones(x.shape[0])]
+    for d in range(1, degree + 1):
+        for combo in combinations_with_replacement(range(x.shape[1]), d):
+            columns.append(np.prod(x[:, combo], axis=1))
+    return np.stack(columns, axis=1)
+
+
+@dataclass(frozen=True)
+class RegressionBasis:
+    """
+    Orthonormal regression bases of a set of state factors, one per date.
+
+    Parameters
+    ----------
+    factors : tuple of str
+        State factors the basis is built on.
+    q : list of numpy.ndarray
+        ``q[i]`` has shape ``(n_scenarios, rank_i)`` and orthonormal
+        columns spanning the design matrix at time index ``i``.
+
+    Notes
+    -----
+    The least-squares fit of any number of targets ``Y`` at date ``i`` is
+    ``q[i] @ (q[i].T @ Y)``: one factorisation per date is shared by every
+    trade on the same state, and each additional trade only adds a
+    matrix product.
+    """
+    factors: Tuple[str, ...]
+    q: List[np.ndarray]
+
+    def project(self, time_idx: int, targets: np.ndarray) -> np.ndarray:
+        """
+        Conditional expectation estimate of ``targets`` at a date.
+
+        Parameters
+        ----------
+        time_idx : int
+            Index into the cube time grid.
+        targets : numpy.ndarray
+            Array of shape ``(n_scenarios, n_targets)``.
+
+        Returns
+        -------
+        numpy.ndarray
+            Fitted values, same shape as ``targets``.
+        """
+        q = self.q[time_idx]
+        return q @ (q.T @ targets)
+
+
+def build_regression_basis(
+    cube: RiskFactorCube,
+    factors: Sequence[str],
+    degree: int,
+    rcond: float = 1e-10,
+) -> RegressionBasis:
+    """
+    Factorise the polynomial design matrix at every date of the cube.
+
+    Parameters
+    ----------
+    cube : RiskFactorCube
+        Simulated risk factors.
+    factors : sequence of str
+        Names of the state factors used as regressors.
+    degree : int
+        Polynomial degree, see :func:`polynomial_basis`.
+    rcond : float
+        Singular values below ``rcond`` times the largest are dropped, so
+        degenerate dates (e.g. ``t=0`` where all paths coincide) fall back
+        to the lower-rank fit instead of failing.
+
+    Returns
+    -------
+    RegressionBasis
+    """
+    try:
+        idx = [cube.factors.index(f) for f in factors]
+    except ValueError as exc:
+        raise KeyError(f"State factors {list(factors)} not all in cube.factors") from exc
+
+    q = []
+    for i in range(cube.data.shape[1]):
+        design = polynomial_basis(np.asarray(cube.data[:, i, idx], dtype=float), degree)
+        u, s, _ = np.linalg.svd(design, full_matrices=False)
+        rank = int(np.count_nonzero(s > rcond * s[0])) if s.size and s[0] > 0.0 else 0
+        q.append(np.ascontiguousarray(u[:, :rank]))
+    return RegressionBasis(factors=tuple(factors), q=q)
+
+
+class LSMCEngine(PricingEngine):
+    """
+    Least-squares Monte Carlo engine for mark-to-future valuation.
+
+    At each cube date the value of a trade is estimated by regressing its
+    realised discounted future cashflows on polynomial functions of the
+    simulated state at that date. Regression bases are factorised once
+    per date and shared by all trades on the same state factors.
+
+    Any trade providing ``path_cashflows(cube)`` can be valued (e.g.
+    `AsianOption` and other path-dependent payoffs). Trades whose
+    ``exercise_values(cube)`` is not None are valued by Longstaff-Schwartz
+    backward induction: where the exercise value is positive and at least
+    the estimated holding value, the trade is exercised and its realised
+    cashflows are replaced by the exercise value. `EuropeanOption` batches
+    go through a dedicated kernel that needs no cashflow arrays.
+
+    Parameters
+    ----------
+    risk_free_curve_key : str
+        Key of the discount curve in the `MarketDataEnvironment`
+        (``curve:<key>``): a flat continuous rate or a curve object
+        exposing ``df(maturity_days)``.
+    degree : int
+        Polynomial degree of the regression basis.
+    state_factors : dict, optional
+        Mapping underlying -> state factors used as regressors. Defaults
+        to the underlying alone.
+    maturity_tolerance : float
+        Tolerance for locating maturities on the time grid.
+    cache_size : int
+        Number of recent bases kept for reuse across calls. Entries are
+        keyed by the time grid, state factors, degree and a digest of the
+        state paths, and hold no reference to the cube.
+    cube : RiskFactorCube, optional
+        Default cube for :meth:`price`.
+
+    Notes
+    -----
+    Values are discounted to the valuation date (`ExposureCube`
+    convention): cashflows paid at a date plus the regression estimate of
+    the later ones, zero after the last cashflow or after exercise. The
+    exercise regression uses all paths, not only those in the money, so
+    that the basis stays shared. When pricing in scenario blocks, each
+    block is regressed on its own paths.
+    """
+
+    def __init__(
+        self,
+        risk_free_curve_key: str,
+        degree: int = 3,
+        state_factors: Optional[Dict[str, Sequence[str]]] = None,
+        maturity_tolerance: float = 1e-6,
+        cache_size: int = 8,
+        cube: Optional[RiskFactorCube] = None,
+    ):
+        if degree < 0:
+            raise ValueError("degree must be non-negative.")
+        self.risk_free_curve_key = risk_free_curve_key
+        self.degree = degree
+        self.state_factors = state_factors or {}
+        self.maturity_tolerance = maturity_tolerance
+        self.cache_size = cache_size
+        self.cube = cube
+        self._basis_cache: "OrderedDict[Tuple, RegressionBasis]" = OrderedDict()
+
+    def clear_cache(self) -> None:
+        """Drop all cached regression bases."""
+        self._basis_cache.clear()
+
+    def _basis_key(self, cube: RiskFactorCube, factors: Sequence[str]) -> Tuple:
+        try:
+            idx = [cube.factors.index(f) for f in factors]
+        except ValueError as exc:
+            raise KeyError(f"State factors {list(factors)} not all in cube.factors") from exc
+        state = np.ascontiguousarray(cube.data[:, :, idx], dtype=float)
+        return (
+            tuple(cube.time_grid.as_array().tolist()),
+            tuple(factors),
+            self.degree,
+            state.shape,
+            hashlib.blake2b(state.data, digest_size=16).digest(),
+        )
+
+    def regression_basis(self, cube: RiskFactorCube, factors: Sequence[str]) -> RegressionBasis:
+        """
+        Return the (cached) regression basis of ``factors`` on ``cube``.
+        """
+        key = self._basis_key(cube, factors)
+        basis = self._basis_cache.get(key)
+        if basis is not None:
+            self._basis_cache.move_to_end(key)
+            return basis
+
+        basis = build_regression_basis(cube, factors, self.degree)
+        self._basis_cache[key] = basis
+        while len(self._basis_cache) > self.cache_size:
+            self._basis_cache.popitem(last=False)
+        return basis
+
+    def price(self, inst: Instrument, ctx: PricingContext, cube: Optional[RiskFactorCube] = None) -> float:
+        """
+        Value at the valuation date: mean over paths of the discounted
+        cashflows realised under the estimated exercise policy.
+
+        Parameters
+        ----------
+        cube : RiskFactorCube, optional
+            Simulated risk factors; defaults to ``self.cube``.
+        """
+        cube = cube if cube is not None else self.cube
+        if cube is None:
+            raise ValueError("LSMCEngine.price needs a RiskFactorCube (argument or engine.cube).")
+        _, realised = self._price_cashflow_trades([inst], cube, ctx)
+        return float(realised[:, 0].mean())
+
+    def price_paths(
+        self,
+        inst: Instrument,
+        cube: RiskFactorCube,
+        ctx: PricingContext,
+    ) -> np.ndarray:
+        """
+        Mark-to-future value of a trade on every cube node.
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of shape ``(n_scenarios, n_times)``.
+        """
+        return self.price_paths_batch([inst], cube, ctx)[:, :, 0]
+
+    def price_paths_batch(
+        self,
+        trades: Sequence[Instrument],
+        cube: RiskFactorCube,
+        ctx: PricingContext,
+        out: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """
+        Mark-to-future values of a set of trades, one regression per date
+        and state shared by all trades on that state.
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of shape ``(n_scenarios, n_times, n_trades)``.
+        """
+        batches, others = group_european_options(trades)
+
+        if out is None:
+            n_scenarios, n_times, _ = cube.data.shape
+            out = np.zeros((n_scenarios, n_times, len(trades)))
+
+        for batch in batches.values():
+            out[:, :, batch.column_index()] = self._price_batch(batch, cube, ctx)
+
+        by_state: Dict[Tuple[str, ...], List[int]] = {}
+        for k in others:
+            by_state.setdefault(self._factors_of(trades[k]), []).append(k)
+        for cols in by_state.values():
+            values, _ = self._price_cashflow_trades([trades[k] for k in cols], cube, ctx)
+            out[:, :, cols] = values
+        return out
+
+    def _factors_of(self, trade: Instrument) -> Tuple[str, ...]:
+        underlying = getattr(trade, "underlying", None)
+        if underlying in self.state_factors:
+            return tuple(self.state_factors[underlying])
+        if underlying is None:
+            raise ValueError(
+                f"Trade {trade.id} has no underlying; set its state factors in LSMCEngine.state_factors."
+            )
+        return (underlying,)
+
+    def _discount_curve(self, ctx: PricingContext) -> Any:
+        curve = ctx.market_env.get_curve(self.risk_free_curve_key)
+        if curve is None:
+            raise KeyError(f"Curve {self.risk_free_curve_key} not in market environment")
+        return curve
+
+    def _price_cashflow_trades(
+        self,
+        trades: Sequence[Instrument],
+        cube: RiskFactorCube,
+        ctx: PricingContext,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Backward induction for trades on one state.
+
+        Returns
+        -------
+        (numpy.ndarray, numpy.ndarray)
+            Values of shape ``(n_scenarios, n_times, n_trades)`` and the
+            discounted cashflows realised on each path under the exercise
+            policy, shape ``(n_scenarios, n_trades)``.
+        """
+        n_scenarios, n_times = cube.data.shape[:2]
+        n = len(trades)
+        df = _discount_factors(self._discount_curve(ctx), cube.time_grid.as_array())
+
+        cashflows = np.empty((n_scenarios, n_times, n))
+        exercise = None
+        for k, trade in enumerate(trades):
+            try:
+                cashflows[:, :, k] = trade.path_cashflows(cube)
+            except NotImplementedError as exc:
+                raise TypeError(
+                    f"{type(trade).__name__} does not provide path_cashflows(); LSMCEngine cannot value it."
+                ) from exc
+            ex = trade.exercise_values(cube)
+            if ex is not None:
+                if exercise is None:
+                    exercise = np.full((n_scenarios, n_times, n), np.nan)
+                exercise[:, :, k] = ex
+        cashflows *= df[None, :, None]
+        if exercise is not None:
+            exercise *= df[None, :, None]
+            exercised = np.zeros((n_scenarios, n_times, n), dtype=bool)
+
+        basis = self.regression_basis(cube, self._factors_of(trades[0]))
+        values = np.zeros((n_scenarios, n_times, n))
+        future = np.zeros((n_scenarios, n))  # realised discounted cashflows after date i
+        for i in range(n_times - 1, -1, -1):
+            hold = cashflows[:, i].copy()
+            live = np.any(future != 0.0, axis=0)
+            if np.any(live):
+                hold[:, live] += basis.project(i, future[:, live])
+            future += cashflows[:, i]
+            if exercise is not None:
+                ex = exercise[:, i]
+                stop = (ex > 0.0) & (ex >= hold)  # False where exercise is not allowed (NaN)
+                hold = np.where(stop, ex, hold)
+                future = np.where(stop, ex, future)
+                exercised[:, i] = stop
+            values[:, i] = hold
+
+        if exercise is not None:
+            # the trade no longer exists on a path after it has been exercised
+            gone = np.logical_or.accumulate(exercised, axis=1)[:, :-1]
+            values[:, 1:][gone] = 0.0
+        return values, future
+
+    def _price_batch(
+        self,
+        batch: EuropeanOptionBatch,
+        cube: RiskFactorCube,
+        ctx: PricingContext,
+    ) -> np.ndarray:
+        try:
+            factor_idx = cube.factors.index(batch.underlying)
+        except ValueError as exc:
+            raise KeyError(f"Factor {batch.underlying} not in cube.factors") from exc
+
+        times = cube.time_grid.as_array()
+        tol = self.maturity_tolerance
+        maturity_idx = np.searchsorted(times, batch.maturities - tol, side="left")
+        found = maturity_idx < times.size
+        found[found] &= np.abs(times[maturity_idx[found]] - batch.maturities[found]) <= tol
+        if not np.all(found):
+            missing = batch.maturities[~found][0]
+            raise ValueError(
+                f"Maturity {missing} not found in time grid (tolerance={tol})."
+            )
+
+        curve = self._discount_curve(ctx)
+
+        # realised cashflows discounted to t0: the regression targets
+        s_T = np.asarray(cube.data[:, maturity_idx, factor_idx], dtype=float)  # (n_scenarios, n_batch)
+        payoff = np.maximum(batch.sign * (s_T - batch.strikes), 0.0)
+        discounted = _discount_factors(curve, batch.maturities) * payoff
+
+        n_scenarios, n_times = cube.data.shape[:2]
+        values = np.zeros((n_scenarios, n_times, batch.size))
+        factors = self.state_factors.get(batch.underlying, (batch.underlying,))
+        basis = self.regression_basis(cube, factors)
+        for i in range(n_times):
+            alive = maturity_idx > i
+            if np.any(alive):
+                values[:, i, alive] = basis.project(i, discounted[:, alive])
+            at_maturity = maturity_idx == i
+            if np.any(at_maturity):
+                values[:, i, at_maturity] = discounted[:, at_maturity]
+        return values
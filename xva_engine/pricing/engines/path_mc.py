@@ -1,6 +1,7 @@
 import numpy as np
-from typing import Optional
+from typing import Optional, Sequence
 from .base import PricingEngine
+from ..batching import EuropeanOptionBatch, group_european_options
 from ...instruments.base import Instrument
 from ...instruments.vanilla import EuropeanOption
 from ..context import PricingContext
@@ -111,3 +112,65 @@ class PathwiseMCEngine(PricingEngine):
                 values[:, i] = discounted_payoff
 
         return values
+
+    def price_paths_batch(
+        self,
+        trades: Sequence[Instrument],
+        cube: RiskFactorCube,
+        ctx: PricingContext,
+        out: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """
+        Price a list of EuropeanOptions in broadcasted kernels.
+
+        Options are grouped into struct-of-arrays batches and each batch is
+        valued in one vectorised pass, written straight into ``out``.
+        Results are identical to calling `price_paths` per trade.
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of shape ``(n_scenarios, n_times, n_trades)``.
+        """
+        batches, others = group_european_options(trades)
+        if others:
+            raise TypeError("PathwiseMCEngine currently supports only EuropeanOption.")
+
+        if out is None:
+            n_scenarios, n_times, _ = cube.data.shape
+            out = np.zeros((n_scenarios, n_times, len(trades)))
+
+        for batch in batches.values():
+            out[:, :, batch.column_index()] = self._price_batch(batch, cube, ctx)
+        return out
+
+    def _price_batch(
+        self,
+        batch: EuropeanOptionBatch,
+        cube: RiskFactorCube,
+        ctx: PricingContext,
+    ) -> np.ndarray:
+        factor_idx = self._find_factor_index(cube)
+        underlying_paths = cube.data[:, :, factor_idx]  # (n_scenarios, n_times)
+        times = cube.time_grid.as_array()
+        tol = self.maturity_tolerance
+
+        # first grid time within tolerance of each maturity
+        maturity_idx = np.searchsorted(times, batch.maturities - tol, side="left")
+        found = maturity_idx < times.size
+        found[found] &= np.abs(times[maturity_idx[found]] - batch.maturities[found]) <= tol
+        if not np.all(found):
+            missing = batch.maturities[~found][0]
+            raise ValueError(
+                f"Maturity {missing} not found in time grid (tolerance={tol})."
+            )
+
+        r = ctx.market_env.get_curve(self.risk_free_curve_key)
+
+        s_T = underlying_paths[:, maturity_idx]  # (n_scenarios, n_batch)
+        payoff = np.maximum(batch.sign * (s_T - batch.strikes), 0.0)
+        discounted_payoff = np.exp(-r * batch.maturities) * payoff
+
+        # same convention as price_paths: zero before maturity, payoff after
+        alive = times[:, None] >= batch.maturities[None, :] - tol  # (n_times, n_batch)
+        return discounted_payoff[:, None, :] * alive[None, :, :]
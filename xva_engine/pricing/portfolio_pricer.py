@@ -1,9 +1,9 @@
-from typing import List
+from typing import Iterator, List, Optional, Tuple
 import numpy as np
 from .context import PricingContext
 from .engines.base import PricingEngine
 from ..instruments.portfolio import Portfolio
-from ..core.cube import RiskFactorCube, ExposureCube
+from ..core.cube import RiskFactorCube, ExposureCube, allocate_cube_array
 from ..instruments.base import Instrument
 
 
@@ -19,20 +19,76 @@ class PortfolioPricer:
         self,
         portfolio: Portfolio,
         cube: RiskFactorCube,
-        ctx: PricingContext
+        ctx: PricingContext,
+        block_size: Optional[int] = None,
+        out_path: Optional[str] = None,
+        dtype: Optional[np.dtype] = None,
     ) -> ExposureCube:
         """
-        For now: naive loop over trades and delegate to engine.price_paths().
+        Price every trade of the portfolio along all scenarios of the cube.
+
+        Trades are handed to the engine's ``price_paths_batch`` in one call
+        per scenario block, so engines with a vectorised batch kernel avoid
+        per-trade Python dispatch.
+
+        Parameters
+        ----------
+        portfolio : Portfolio
+            Trades to price.
+        cube : RiskFactorCube
+            Simulated risk factors. May be memory-mapped.
+        ctx : PricingContext
+            Market data and valuation settings.
+        block_size : int, optional
+            Number of scenarios priced at a time. Only one block of the
+            risk factor cube is read per step. ``None`` prices all
+            scenarios in one block.
+        out_path : str, optional
+            If given, the exposure cube is written to a memory-mapped
+            ``.npy`` file at this path instead of being held in RAM.
+        dtype : data-type, optional
+            Storage type of the exposure cube. Defaults to the type of the
+            risk factor cube, so a float32 simulation gives a float32
+            exposure cube.
+
+        Returns
+        -------
+        ExposureCube
+            Values of shape ``(n_scenarios, n_times, n_trades)``.
         """
         n_scenarios, n_times, _ = cube.data.shape
         n_trades = len(portfolio.trades)
-        data = np.zeros((n_scenarios, n_times, n_trades))
+        dtype = cube.data.dtype if dtype is None else np.dtype(dtype)
+        data = allocate_cube_array((n_scenarios, n_times, n_trades), dtype=dtype, path=out_path)
 
-        for k, trade in enumerate(portfolio.trades):
-            # In a real implementation, you'd map cube -> scenario-specific market env.
-            prices = self.engine.price_paths(trade, cube, ctx)
-            data[:, :, k] = prices
+        for sl, _ in cube.iter_blocks(axis="scenario", size=block_size):
+            # the engine prices groups of similar trades in one kernel and
+            # writes straight into this block of the exposure cube
+            self.engine.price_paths_batch(portfolio.trades, cube.scenario_block(sl), ctx, out=data[sl])
 
         scenarios = cube.scenarios
         trades_ids = [t.id for t in portfolio.trades]
         return ExposureCube(data=data, scenarios=scenarios, time_grid=cube.time_grid, trades=trades_ids)
+
+    def iter_exposure_blocks(
+        self,
+        portfolio: Portfolio,
+        cube: RiskFactorCube,
+        ctx: PricingContext,
+        block_size: Optional[int] = None,
+    ) -> Iterator[Tuple[slice, np.ndarray]]:
+        """
+        Price the portfolio one scenario block at a time without storing
+        the exposure cube.
+
+        Intended to feed `ExposureAccumulator.update`, so that exposure
+        metrics are computed with memory proportional to ``block_size``.
+
+        Yields
+        ------
+        (slice, numpy.ndarray)
+            Scenario slice and the priced block of shape
+            ``(n_block, n_times, n_trades)``.
+        """
+        for sl, _ in cube.iter_blocks(axis="scenario", size=block_size):
+            yield sl, self.engine.price_paths_batch(portfolio.trades, cube.scenario_block(sl), ctx)
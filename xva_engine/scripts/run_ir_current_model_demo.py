@@ -12,6 +12,14 @@ def build_df0_from_zero_curve(pillars_years, zero_rates):
             return 1.0
         z = float(np.interp(t, pillars_years, zero_rates))
         return float(np.exp(-z * t))
+
+    def batch(times):
+        # vectorised df0 protocol, used to build the mean function in one call
+        times = np.asarray(times, dtype=float)
+        z = np.interp(times, pillars_years, zero_rates)
+        return np.where(times <= 0.0, 1.0, np.exp(-z * times))
+
+    df0.batch = batch
     return df0
 
 
@@ -40,7 +48,9 @@ if __name__ == "__main__":
         sigma=sigma,
         lam=lam,
         shift_bp=np.full(len(pillars_days), 100.0),
-        run=IrUltimateBaseCurveRunConfig(n_paths=3000, seed=42, return_driver=False),
+        run=IrUltimateBaseCurveRunConfig(
+            n_paths=3000, n_steps=len(time_grid) - 1, horizon_years=float(time_grid[-1]), seed=42, return_driver=False
+        ),
     )
 
-    print("Current model rates cube:", out["rates"].shape)
+    print("Current model rates cube:", out.rates.shape)
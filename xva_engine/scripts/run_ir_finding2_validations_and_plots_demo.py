@@ -26,79 +26,6 @@ from xva_engine.validation.ir.interpolation.reporting.plots_interpolation import
 )
 
 
-# ------------------------------------------------------------
-# Helpers: robust access to generator outputs (consistent with "rest of codes")
-# ------------------------------------------------------------
-def _get_zero_rates_cube(obj) -> np.ndarray:
-    """
-    Try common attribute names used across the project.
-    Expected shape: (Npaths, Ntimes, Kpillars).
-    """
-    for name in ("zero_rates", "rates", "rates_cube", "cube"):
-        if hasattr(obj, name):
-            arr = getattr(obj, name)
-            if isinstance(arr, np.ndarray):
-                return arr
-    raise AttributeError(
-        "Could not find zero rates cube on generator output. "
-        "Expected attribute: zero_rates (or rates/rates_cube/cube)."
-    )
-
-
-def _get_pillars_years(obj) -> np.ndarray:
-    """
-    Try common pillar representations.
-    Returns maturity pillars in years as 1D array.
-    """
-    if hasattr(obj, "pillars"):
-        p = getattr(obj, "pillars")
-        if isinstance(p, np.ndarray):
-            return p.astype(float)
-
-    # Some outputs may store days instead
-    if hasattr(obj, "pillars_days"):
-        d = getattr(obj, "pillars_days")
-        if isinstance(d, np.ndarray):
-            return (d.astype(float) / 365.0)
-
-    raise AttributeError(
-        "Could not find pillars on generator output. "
-        "Expected attribute: pillars (years) or pillars_days (days)."
-    )
-
-
-def _get_time_grid_years(obj, cfg: IrUltimateBaseCurveRunConfig, cube: np.ndarray) -> np.ndarray:
-    """
-    Prefer output time grid if present. Otherwise derive from config if it exposes
-    horizon and n_steps. As a last resort, assume uniform steps of 1/12y.
-    """
-    for name in ("time_grid_years", "time_grid", "times_years", "t_grid_years"):
-        if hasattr(obj, name):
-            tg = getattr(obj, name)
-            if isinstance(tg, np.ndarray) and tg.ndim == 1:
-                return tg.astype(float)
-
-    # Try infer from config
-    # Common patterns: cfg.time_grid_years, cfg.n_steps, cfg.dt_years, cfg.horizon_years
-    if hasattr(cfg, "time_grid_years") and isinstance(cfg.time_grid_years, np.ndarray):
-        return cfg.time_grid_years.astype(float)
-
-    n_times = cube.shape[1]
-
-    if hasattr(cfg, "dt_years") and isinstance(cfg.dt_years, (int, float)):
-        dt = float(cfg.dt_years)
-        return np.linspace(0.0, dt * (n_times - 1), n_times)
-
-    if hasattr(cfg, "horizon_years") and hasattr(cfg, "n_steps"):
-        H = float(cfg.horizon_years)
-        n_steps = int(cfg.n_steps)
-        # n_times should usually be n_steps + 1
-        return np.linspace(0.0, H, n_times)
-
-    # Fallback: monthly steps
-    return np.linspace(0.0, (n_times - 1) / 12.0, n_times)
-
-
 def _build_df0_from_initial_zero_curve(
     z0_pillars: np.ndarray,
     pillars_years: np.ndarray,
@@ -142,7 +69,10 @@ def main() -> None:
 
     # Simple DF(0,t) for demo (replace with your market DF builder if you have one)
     flat_r = 0.02
-    df0 = lambda t: float(np.exp(-flat_r * t))
+    def df0(t):
+        return float(np.exp(-flat_r * t))
+
+    df0.batch = lambda times: np.exp(-flat_r * np.asarray(times, dtype=float))  # vectorised df0 protocol
 
     K = len(pillars_days)
 
@@ -162,15 +92,9 @@ def main() -> None:
         run=cfg,
     )
 
-    # cfg = IrUltimateBaseCurveRunConfig()
-    # gen = IrUltimateBaseCurveScenarioGenerator(cfg)
-    # current = gen.generate()
-
-
-
-    current_cube = _get_zero_rates_cube(current)         # (P, T, K)
-    pillars_years = _get_pillars_years(current)           # (K,)
-    time_grid_years = _get_time_grid_years(current, cfg, current_cube)  # (T,)
+    current_cube = current.rates                  # (P, T, K)
+    pillars_years = current.pillars_years         # (K,)
+    time_grid_years = current.time_grid_years     # (T,)
 
     print("Current model rates cube:", current_cube.shape)
     print("Time grid len:", time_grid_years.shape[0], " Pillars:", pillars_years.shape[0])
@@ -11,6 +11,9 @@ def df0(t: float) -> float:
     r = 0.03
     return np.exp(-r * t)
 
+# vectorised df0 protocol: DF(0,t) on an array of times in one call
+df0.batch = lambda times: np.exp(-0.03 * np.asarray(times, dtype=float))
+
 if __name__ == "__main__":
     pillars_days = np.array([30, 90, 180, 365, 730, 1825, 3650], dtype=float)
     time_grid = np.linspace(0.0, 5.0, 121)  # 5y monthly
@@ -30,7 +33,9 @@ if __name__ == "__main__":
         sigma=sigma,
         lam=lam,
         shift_bp=np.full(len(pillars_days), 100.0),
-        run=IrUltimateBaseCurveRunConfig(n_paths=2000, seed=42, return_driver=False),
+        run=IrUltimateBaseCurveRunConfig(
+            n_paths=2000, n_steps=len(time_grid) - 1, horizon_years=float(time_grid[-1]), seed=42, return_driver=False
+        ),
     )
 
-    print(out["rates"].shape)  # (paths, times, pillars)
+    print(out.rates.shape)  # (paths, times, pillars)
@@ -1,10 +1,11 @@
-from typing import List
+from typing import List, Optional
 import numpy as np
 from ..core.time_grid import TimeGrid
-from ..core.cube import RiskFactorCube
+from ..core.cube import RiskFactorCube, allocate_cube_array
 from ..models.base import RiskFactorModel
 from ..models.correlation import CorrelationModel
 from ..config.schema import SimulationConfig
+from .normals import NormalSource, PseudoRandomNormals
 
 
 class SimulationDriver:
@@ -22,21 +23,61 @@ class SimulationDriver:
         corr_model: CorrelationModel,
         time_grid: TimeGrid,
         seed: int = 42,
+        out_path: Optional[str] = None,
+        normals: Optional[NormalSource] = None,
     ) -> RiskFactorCube:
-        """Generate a RiskFactorCube according to the config and models."""
-        rng = np.random.default_rng(seed)
+        """
+        Generate a RiskFactorCube according to the config and models.
+
+        All models are advanced together in a single time loop through
+        the stepping protocol (:meth:`RiskFactorModel.init_state` and
+        :meth:`RiskFactorModel.step`). At each step one
+        ``(n_scenarios, n_factors)`` block of standard normals is drawn
+        and correlated with the cached factor of ``corr_model`` (Cholesky,
+        or a low-rank factor if ``corr_model.max_rank`` is set), so that
+        the ``j``-th column drives ``models[j]``.
+
+        If ``out_path`` is given, the cube is backed by a memory-mapped
+        ``.npy`` file at that path instead of an in-memory array. The cube
+        is stored with ``config.dtype`` (e.g. ``"float32"`` to halve its
+        size); model states are advanced in float64.
+
+        ``normals`` selects the source of the independent normals (e.g.
+        `SobolNormals`, `AntitheticNormals`); by default they are
+        pseudo-random draws seeded with ``seed``.
+        """
+        if normals is None:
+            normals = PseudoRandomNormals(seed)
         n_scenarios = self.config.n_scenarios
-        n_times = len(time_grid.times)
+        times = time_grid.as_array()
+        n_times = len(times)
         n_factors = len(models)
 
-        # Placeholder structure
-        data = np.zeros((n_scenarios, n_times, n_factors))
+        not_stepping = [m.name for m in models if not m.supports_stepping]
+        if not_stepping:
+            raise TypeError(f"Models do not implement init_state/step: {not_stepping}")
+        if corr_model.corr_matrix.shape != (n_factors, n_factors):
+            raise ValueError(
+                f"corr_matrix must be ({n_factors},{n_factors}) to match the models; "
+                f"got {corr_model.corr_matrix.shape}"
+            )
+
+        data = allocate_cube_array(
+            (n_scenarios, n_times, n_factors), dtype=np.dtype(self.config.dtype), path=out_path
+        )
+
+        # factorised once for the whole run
+        factor = corr_model.factor()
+
+        states = [m.init_state(n_scenarios) for m in models]
+        data[:, 0, :] = np.stack(states, axis=1)
 
-        # TODO: implement proper correlated stepping and SDE schemes
-        # For now, just call each model independently
-        for j, model in enumerate(models):
-            paths = model.simulate_paths(time_grid, n_scenarios, rng)
-            data[:, :, j] = paths
+        draws = normals.iter_steps(n_scenarios, times, factor.rank)
+        for i, w in enumerate(draws, start=1):
+            dt = times[i] - times[i - 1]
+            z = factor.apply(w)
+            states = [m.step(x, dt, z[:, j]) for j, (m, x) in enumerate(zip(models, states))]
+            data[:, i, :] = np.stack(states, axis=1)
 
         factors = [m.name for m in models]
         scenarios = list(range(n_scenarios))
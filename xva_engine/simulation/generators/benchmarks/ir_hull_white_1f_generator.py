@@ -1,8 +1,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Optional
 import numpy as np
 
+from xva_engine.simulation.normals import NormalSource, PseudoRandomNormals
+from xva_engine.simulation.scenario_cube import ScenarioCube
+
 
 @dataclass(frozen=True)
 class HullWhite1FParams:
@@ -10,8 +14,44 @@ class HullWhite1FParams:
     sigma: float
 
 
-def _interp_1d(x: np.ndarray, y: np.ndarray, xq: np.ndarray) -> np.ndarray:
-    return np.interp(xq, x, y)
+def _log_df0(curve_times: np.ndarray, curve_values: np.ndarray, tq: np.ndarray) -> np.ndarray:
+    """
+    ln DF(0,t) at tq by log-linear DF interpolation (piecewise flat forwards).
+    DF(0,0)=1 is added if missing; beyond the last point the last forward is extended.
+    """
+    x = np.asarray(curve_times, dtype=float)
+    y = np.log(np.clip(np.asarray(curve_values, dtype=float), 1e-300, None))
+    idx = np.argsort(x)
+    x, y = x[idx], y[idx]
+    if x[0] > 0.0:
+        x, y = np.concatenate([[0.0], x]), np.concatenate([[0.0], y])
+    if x.size < 2:
+        raise ValueError("df0 curve needs at least one point with t > 0")
+
+    out = np.interp(tq, x, y)
+    beyond = tq > x[-1]
+    out[beyond] = y[-1] + (y[-1] - y[-2]) / (x[-1] - x[-2]) * (tq[beyond] - x[-1])
+    return out
+
+
+def hw1f_bond_b(tau: np.ndarray, a: float) -> np.ndarray:
+    """B(t,T) = (1 - e^{-a tau}) / a with tau = T - t (tau for a ~ 0)."""
+    tau = np.asarray(tau, dtype=float)
+    if a > 1e-12:
+        return (1.0 - np.exp(-a * tau)) / a
+    return tau
+
+
+def hw1f_variance_v(tau: np.ndarray, a: float, sigma: float) -> np.ndarray:
+    """
+    V(t,T) = Var[int_t^T x(u) du | x_t], tau = T - t:
+      sigma^2/a^2 * (tau + 2/a e^{-a tau} - 1/(2a) e^{-2 a tau} - 3/(2a))
+    """
+    tau = np.asarray(tau, dtype=float)
+    if a > 1e-12:
+        e = np.exp(-a * tau)
+        return (sigma * sigma) / (a * a) * (tau + (2.0 / a) * e - (0.5 / a) * e * e - 1.5 / a)
+    return sigma * sigma * tau ** 3 / 3.0
 
 
 def simulate_hw1f_curve_paths(
@@ -22,8 +62,21 @@ def simulate_hw1f_curve_paths(
     df0_curve_values: np.ndarray,    # DF(0,t)
     params: HullWhite1FParams,
     seed: int | None = None,
+    normals: NormalSource | None = None,
+    dtype: np.dtype = np.float64,
 ) -> np.ndarray:
-    rng = np.random.default_rng(seed)
+    """
+    Zero rates R(t, t+M_k) under HW1F in G1++ form, r(t) = x(t) + phi(t), shape (P,T,K).
+
+    x is simulated exactly at the simulation dates only, and bonds use the
+    exact formula P(t,T) = A(t,T) exp(-B(t,T) x_t) with
+      ln A(t,T) = ln DF(0,T) - ln DF(0,t) + (V(t,T) - V(0,T) + V(0,t)) / 2,
+    which fits the initial curve DF(0,.) (log-linear interpolation). Cost is
+    O(P*T*K) broadcasted arrays; no per-path interpolation, no auxiliary grid.
+    dtype: storage type of the returned rates (e.g. float32); x and the bond terms stay float64.
+    """
+    if normals is None:
+        normals = PseudoRandomNormals(seed)
     t = np.asarray(time_grid_years, dtype=float)
     dt = np.diff(t)
     if np.any(dt <= 0):
@@ -31,22 +84,10 @@ def simulate_hw1f_curve_paths(
     M = np.asarray(pillars_days, dtype=float) / 365.0
     P, Tn, K = n_paths, len(t), len(M)
 
-    # Build required times: simulation times + times needed for t+M
-    required_times = np.unique(np.concatenate([t, (t[:, None] + M[None, :]).ravel()]))
-    required_times = required_times[required_times >= 0.0]
-
-    df0_req = _interp_1d(df0_curve_times, df0_curve_values, required_times)
-    ln_df = np.log(np.clip(df0_req, 1e-300, None))
-    dln = np.gradient(ln_df, required_times, edge_order=1)
-    f0_req = -dln  # approx inst forward f(0,t)
-
-    # shift on simulation times
-    f0_t = _interp_1d(required_times, f0_req, t)
-
-    # simulate OU x(t): dx=-a x dt + sigma dW
+    # simulate OU x(t): dx=-a x dt + sigma dW (exact transition)
     a, sigma = params.a, params.sigma
     x = np.zeros((P, Tn), dtype=float)
-    for i in range(Tn - 1):
+    for i, z in enumerate(normals.iter_steps(P, t, 1)):
         dti = dt[i]
         if a > 1e-12:
             phi = np.exp(-a * dti)
@@ -54,38 +95,26 @@ def simulate_hw1f_curve_paths(
         else:
             phi = 1.0
             var = sigma * sigma * dti
-        z = rng.standard_normal(P)
-        x[:, i + 1] = phi * x[:, i] + np.sqrt(max(var, 0.0)) * z
-
-    # interpolate x to required_times per path
-    x_req = np.empty((P, len(required_times)), dtype=float)
-    for p in range(P):
-        x_req[p] = _interp_1d(t, x[p], required_times)
-
-    # build DF path on required_times via Euler: DF_{j+1}=DF_j*exp(-(x+f0)*dt)
-    df_req_path = np.ones((P, len(required_times)), dtype=float)
-    dtreq = np.diff(required_times)
-    for j in range(len(required_times) - 1):
-        rj = x_req[:, j] + f0_req[j]
-        df_req_path[:, j + 1] = df_req_path[:, j] * np.exp(-rj * dtreq[j])
-
-    idx_t = np.searchsorted(required_times, t)
-    idx_tM = np.searchsorted(required_times, (t[:, None] + M[None, :]))
-
-    DF_t = df_req_path[:, idx_t]           # (P,T)
-    DF_tM = df_req_path[:, idx_tM]         # (P,T,K)
-    DF_rel = DF_tM / DF_t[:, :, None]      # DF(t,t+M)
-
-    rates = -np.log(np.clip(DF_rel, 1e-300, None)) / M[None, None, :]
+        x[:, i + 1] = phi * x[:, i] + np.sqrt(max(var, 0.0)) * z[:, 0]
+
+    # deterministic part of ln P(t,t+M_k), (T,K)
+    tM = t[:, None] + M[None, :]
+    ln_df_t = _log_df0(df0_curve_times, df0_curve_values, t)[:, None]
+    ln_df_tM = _log_df0(df0_curve_times, df0_curve_values, tM.ravel()).reshape(Tn, K)
+    ln_a = ln_df_tM - ln_df_t + 0.5 * (
+        hw1f_variance_v(M, a, sigma)[None, :]
+        - hw1f_variance_v(tM, a, sigma)
+        + hw1f_variance_v(t, a, sigma)[:, None]
+    )
+    b = hw1f_bond_b(M, a)  # (K,)
+
+    # R = -ln P(t,t+M)/M = (B x - ln A)/M
+    rates = np.empty((P, Tn, K), dtype=dtype)
+    np.multiply(x[:, :, None], (b / M)[None, None, :], out=rates, casting="same_kind")
+    rates -= (ln_a / M[None, :])[None, :, :].astype(rates.dtype)
     return rates
 
 
-# --- Add below your existing code (at bottom of file) ---
-
-from dataclasses import dataclass
-from typing import Optional
-
-
 @dataclass(frozen=True)
 class IRHullWhite1FGeneratorConfig:
     n_paths: int = 3000
@@ -103,19 +132,11 @@ class IRHullWhite1FGeneratorConfig:
     a: float = 0.03
     sigma: float = 0.01
 
+    # Optional normal source (Sobol, antithetic, ...); default pseudo-random from seed
+    normals: Optional[NormalSource] = None
 
-@dataclass(frozen=True)
-class IRRateCube:
-    """
-    Standard container to match your generator output conventions.
-    """
-    zero_rates: np.ndarray        # (Npaths, Ntimes, K)
-    time_grid_years: np.ndarray   # (Ntimes,)
-    pillars_days: np.ndarray      # (K,)
-
-    @property
-    def pillars(self) -> np.ndarray:
-        return np.asarray(self.pillars_days, dtype=float) / 365.0
+    # Storage type of the rates cube, e.g. "float32" to halve memory
+    dtype: str = "float64"
 
 
 class IRHullWhite1FGenerator:
@@ -125,7 +146,7 @@ class IRHullWhite1FGenerator:
     def __init__(self, cfg: IRHullWhite1FGeneratorConfig):
         self.cfg = cfg
 
-    def generate(self) -> IRRateCube:
+    def generate(self) -> ScenarioCube:
         cfg = self.cfg
         if cfg.time_grid_years is None:
             raise ValueError("IRHullWhite1FGeneratorConfig.time_grid_years must be provided.")
@@ -144,10 +165,12 @@ class IRHullWhite1FGenerator:
             df0_curve_values=np.asarray(cfg.df0_curve_values, dtype=float),
             params=params,
             seed=cfg.seed,
+            normals=cfg.normals,
+            dtype=np.dtype(cfg.dtype),
         )
 
-        return IRRateCube(
-            zero_rates=rates,
+        return ScenarioCube(
+            rates=rates,
             time_grid_years=np.asarray(cfg.time_grid_years, dtype=float),
             pillars_days=np.asarray(cfg.pillars_days, dtype=float),
         )
@@ -5,6 +5,8 @@ from typing import Callable, Optional
 
 import numpy as np
 
+from xva_engine.simulation.normals import NormalSource
+from xva_engine.simulation.scenario_cube import ScenarioCube
 from xva_engine.simulation.risk_factors.ir.ultimate_base_curve_process import (
     UltimateBaseCurveParams,
     UltimateBaseCurveProcess,
@@ -26,6 +28,8 @@ class IrUltimateBaseCurveRunConfig:
     horizon_years: float
     seed: int = 1234
     return_driver: bool = False
+    normals: Optional[NormalSource] = None
+    dtype: str = "float64"   # storage type of rates/driver, e.g. "float32"
 
 
 class IrUltimateBaseCurveScenarioGenerator:
@@ -35,7 +39,7 @@ class IrUltimateBaseCurveScenarioGenerator:
     Notes on architecture:
     - This belongs under xva_engine/simulation/generators (trajectory generation).
     - It consumes market data (discount curve + history) from your market_data layer.
-    - It returns a numpy cube (paths, times, pillars). You can wrap into your Cube later.
+    - It returns a ScenarioCube with axes (paths, times, pillars).
     """
 
     def __init__(
@@ -81,17 +85,18 @@ class IrUltimateBaseCurveScenarioGenerator:
     def generate(
         self,
         time_grid: np.ndarray,             # (T,) year fractions
-        df0: Callable[[float], float],     # DF(0,t) callable
+        df0: Callable[[float], float],     # DF(0,t) callable (df0.batch(times) used if present)
         corr: np.ndarray,
         sigma: np.ndarray,
         lam: np.ndarray,
         shift_bp: np.ndarray,
         run: IrUltimateBaseCurveRunConfig,
-    ) -> dict[str, np.ndarray]:
+        curve_id: str = "IR_BASE",
+    ) -> ScenarioCube:
         """
-        Returns dict:
-          - 'rates': (n_paths, T, K)
-          - optionally 'driver': (n_paths, T, K)
+        Returns ScenarioCube with
+          - rates: (n_paths, T, K)
+          - driver: (n_paths, T, K) if run.return_driver else None
         """
         params = UltimateBaseCurveParams(
             pillars_days=self.pillars_days,
@@ -116,33 +121,14 @@ class IrUltimateBaseCurveScenarioGenerator:
             n_paths=run.n_paths,
             seed=run.seed,
             return_driver=run.return_driver,
+            normals=run.normals,
+            dtype=np.dtype(run.dtype),
         )
 
-        out = {"rates": y}
-        if run.return_driver and x is not None:
-            out["driver"] = x
-        return out
-
-    def _get_zero_rates_cube(obj) -> np.ndarray:
-        if isinstance(obj, dict):
-            for k in ("zero_rates", "rates", "rates_cube", "cube"):
-                if k in obj and isinstance(obj[k], np.ndarray):
-                    return obj[k]
-        for name in ("zero_rates", "rates", "rates_cube", "cube"):
-            if hasattr(obj, name):
-                arr = getattr(obj, name)
-                if isinstance(arr, np.ndarray):
-                    return arr
-        raise AttributeError("Could not find zero rates cube ...")
-
-    def _get_pillars_years(obj) -> np.ndarray:
-        if isinstance(obj, dict):
-            if "pillars_years" in obj: return np.asarray(obj["pillars_years"], float)
-            if "pillars_days" in obj:  return np.asarray(obj["pillars_days"], float) / 365.0
-        for name in ("pillars_years", "pillars"):
-            if hasattr(obj, name): return np.asarray(getattr(obj, name), float)
-        if hasattr(obj, "pillars_days"):
-            return np.asarray(getattr(obj, "pillars_days"), float) / 365.0
-        raise AttributeError("Could not find pillars ...")
-
-
+        return ScenarioCube(
+            rates=y,
+            time_grid_years=np.asarray(time_grid, dtype=float),
+            pillars_days=self.pillars_days,
+            curve_id=curve_id,
+            driver=x if run.return_driver else None,
+        )
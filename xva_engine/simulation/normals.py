@@ -0,0 +1,333 @@
+from abc import ABC, abstractmethod
+from typing import Iterator, Optional, Tuple, Union
+import numpy as np
+from scipy.special import ndtri
+
+
+SOBOL_MAX_DIM = 21201
+
+
+class NormalSource(ABC):
+    """
+    Source of the standard normals driving a path simulation.
+
+    Simulators ask for the draws of a whole run at once through
+    :meth:`iter_steps` and consume them one time step at a time, so that
+    sources which need the full ``(paths, steps, dimensions)`` picture
+    (quasi-random sequences, Brownian bridge ordering, moment matching)
+    can be swapped for plain pseudo-random draws without changing the
+    simulator.
+    """
+
+    @abstractmethod
+    def iter_steps(
+        self,
+        n_paths: int,
+        time_grid: np.ndarray,
+        dim: int,
+    ) -> Iterator[np.ndarray]:
+        """
+        Yield the normals of each step of a simulation.
+
+        Parameters
+        ----------
+        n_paths : int
+            Number of paths.
+        time_grid : numpy.ndarray
+            Simulation times, shape ``(T,)``; ``T - 1`` steps are yielded.
+        dim : int
+            Number of independent normals per path and step.
+
+        Yields
+        ------
+        numpy.ndarray
+            Array of shape ``(n_paths, dim)`` for each step ``t_{i-1} -> t_i``,
+            scaled so that ``sqrt(t_i - t_{i-1}) * z`` is the Brownian
+            increment.
+        """
+        raise NotImplementedError
+
+    def iter_blocks(
+        self,
+        n_paths: int,
+        time_grid: np.ndarray,
+        dim: int,
+        block_steps: int,
+    ) -> Iterator[Tuple[int, np.ndarray]]:
+        """
+        Yield the normals of several consecutive steps at a time.
+
+        Yields
+        ------
+        (int, numpy.ndarray)
+            Index of the first step of the block and an array of shape
+            ``(n_block_steps, n_paths, dim)`` (step-major). The values are
+            those of :meth:`iter_steps`. Implementations may reuse the
+            array between blocks, so consume it before the next one.
+        """
+        if block_steps <= 0:
+            raise ValueError("block_steps must be a positive integer.")
+        buffer, start = [], 0
+        for i, z in enumerate(self.iter_steps(n_paths, time_grid, dim)):
+            buffer.append(z)
+            if len(buffer) == block_steps:
+                yield start, np.stack(buffer)
+                buffer, start = [], i + 1
+        if buffer:
+            yield start, np.stack(buffer)
+
+    def sample(self, n_paths: int, time_grid: np.ndarray, dim: int) -> np.ndarray:
+        """
+        All normals of a simulation, shape ``(n_paths, T - 1, dim)``.
+        """
+        n_steps = max(len(np.asarray(time_grid)) - 1, 0)
+        out = np.empty((n_paths, n_steps, dim))
+        for i, z in enumerate(self.iter_steps(n_paths, time_grid, dim)):
+            out[:, i, :] = z
+        return out
+
+
+class PseudoRandomNormals(NormalSource):
+    """
+    Independent pseudo-random normals, drawn step by step.
+
+    Parameters
+    ----------
+    seed : int or numpy.random.Generator, optional
+        Seed or generator. With a seed, the stream is identical to calling
+        ``np.random.default_rng(seed).standard_normal((n_paths, dim))`` at
+        every step.
+    """
+
+    def __init__(self, seed: Union[int, np.random.Generator, None] = None):
+        self.rng = seed if isinstance(seed, np.random.Generator) else np.random.default_rng(seed)
+
+    def iter_steps(self, n_paths, time_grid, dim):
+        for _ in range(max(len(np.asarray(time_grid)) - 1, 0)):
+            yield self.rng.standard_normal(size=(n_paths, dim))
+
+    def iter_blocks(self, n_paths, time_grid, dim, block_steps):
+        if block_steps <= 0:
+            raise ValueError("block_steps must be a positive integer.")
+        n_steps = max(len(np.asarray(time_grid)) - 1, 0)
+        buffer = np.empty((min(block_steps, n_steps), n_paths, dim))
+        # step-major draws consume the generator exactly as iter_steps does
+        for start in range(0, n_steps, block_steps):
+            b = min(block_steps, n_steps - start)
+            yield start, self.rng.standard_normal(out=buffer[:b])
+
+
+class AntitheticNormals(NormalSource):
+    """
+    Antithetic pairs: paths ``n_paths // 2`` onwards use the negated draws
+    of the first half.
+
+    Parameters
+    ----------
+    seed : int or numpy.random.Generator, optional
+        Seed or generator of the underlying pseudo-random draws.
+    """
+
+    def __init__(self, seed: Union[int, np.random.Generator, None] = None):
+        self.rng = seed if isinstance(seed, np.random.Generator) else np.random.default_rng(seed)
+
+    def iter_steps(self, n_paths, time_grid, dim):
+        if n_paths % 2:
+            raise ValueError("AntitheticNormals requires an even number of paths.")
+        half = n_paths // 2
+        for _ in range(max(len(np.asarray(time_grid)) - 1, 0)):
+            z = self.rng.standard_normal(size=(half, dim))
+            yield np.concatenate([z, -z], axis=0)
+
+
+class MomentMatchedNormals(NormalSource):
+    """
+    Normals standardised per step and dimension to exact sample mean 0
+    and variance 1 across paths.
+
+    Parameters
+    ----------
+    base : NormalSource, optional
+        Source of the raw draws; defaults to `PseudoRandomNormals`.
+    seed : int or numpy.random.Generator, optional
+        Seed of the default base source.
+    """
+
+    def __init__(
+        self,
+        base: Optional[NormalSource] = None,
+        seed: Union[int, np.random.Generator, None] = None,
+    ):
+        self.base = base if base is not None else PseudoRandomNormals(seed)
+
+    def iter_steps(self, n_paths, time_grid, dim):
+        if n_paths < 2:
+            raise ValueError("MomentMatchedNormals requires at least two paths.")
+        for z in self.base.iter_steps(n_paths, time_grid, dim):
+            z = z - z.mean(axis=0)
+            yield z / z.std(axis=0)
+
+
+def _brownian_bridge_schedule(times: np.ndarray):
+    """
+    Construction order of a Brownian bridge on ``times`` (``times[0]`` is
+    the start, where ``W = 0``).
+
+    Returns ``(target, left, right, w_left, w_right, std)`` arrays of
+    length ``n_steps``: entry ``k`` sets
+    ``W[target] = w_left * W[left] + w_right * W[right] + std * z_k``.
+    The first entry is the terminal point, then midpoints by bisection.
+    """
+    n = len(times) - 1
+    target = np.empty(n, dtype=np.intp)
+    left = np.zeros(n, dtype=np.intp)
+    right = np.zeros(n, dtype=np.intp)
+    w_left = np.zeros(n)
+    w_right = np.zeros(n)
+    std = np.empty(n)
+
+    target[0] = n
+    std[0] = np.sqrt(times[n] - times[0])
+    k = 1
+    queue = [(0, n)]
+    while queue:
+        lo, hi = queue.pop(0)
+        if hi - lo < 2:
+            continue
+        mid = (lo + hi) // 2
+        t_lo, t_mid, t_hi = times[lo], times[mid], times[hi]
+        target[k], left[k], right[k] = mid, lo, hi
+        w_left[k] = (t_hi - t_mid) / (t_hi - t_lo)
+        w_right[k] = (t_mid - t_lo) / (t_hi - t_lo)
+        std[k] = np.sqrt((t_mid - t_lo) * (t_hi - t_mid) / (t_hi - t_lo))
+        k += 1
+        queue.append((lo, mid))
+        queue.append((mid, hi))
+    return target, left, right, w_left, w_right, std
+
+
+class SobolNormals(NormalSource):
+    """
+    Scrambled Sobol normals on the leading dimensions, pseudo-random
+    normals on the rest, optionally in Brownian bridge order.
+
+    The quasi-random structure matters on the few coordinates that drive
+    the coarse shape of the paths, so only the first ``sobol_dim``
+    coordinates of each path come from a Sobol sequence (mapped to
+    normals through the inverse normal CDF) and the rest are
+    pseudo-random. This keeps long daily grids with many factors usable
+    and the draws are still produced one step at a time.
+
+    Parameters
+    ----------
+    seed : int or numpy.random.Generator, optional
+        Seed of the scrambling and of the pseudo-random coordinates.
+    scramble : bool
+        Owen scrambling (recommended; makes estimates unbiased and allows
+        error estimation over independent seeds).
+    brownian_bridge : bool
+        If True, the Sobol coordinates build a coarse skeleton of each
+        Brownian motion: its terminal value first, then midpoints by
+        bisection, as far as ``sobol_dim`` allows. The steps in between
+        are filled in order by bridging from the current point to the
+        next skeleton point with pseudo-random normals. If False, the
+        first steps use Sobol normals and the later ones pseudo-random
+        normals.
+    sobol_dim : int
+        Number of quasi-random coordinates per path (at most 21201, the
+        direction numbers available in SciPy), ordered by bridge level
+        (or step) and then by dimension.
+
+    Notes
+    -----
+    Sobol points are best used with ``n_paths`` a power of two. The
+    skeleton holds ``(n_paths, sobol_dim)`` values; memory otherwise does
+    not grow with the number of steps. When ``sobol_dim`` covers all
+    ``n_steps * dim`` coordinates, no pseudo-random normals are drawn.
+    """
+
+    def __init__(
+        self,
+        seed: Union[int, np.random.Generator, None] = None,
+        scramble: bool = True,
+        brownian_bridge: bool = True,
+        sobol_dim: int = 128,
+    ):
+        if not 1 <= sobol_dim <= SOBOL_MAX_DIM:
+            raise ValueError(f"sobol_dim must be between 1 and {SOBOL_MAX_DIM}; got {sobol_dim}.")
+        self.rng = seed if isinstance(seed, np.random.Generator) else np.random.default_rng(seed)
+        self.scramble = scramble
+        self.brownian_bridge = brownian_bridge
+        self.sobol_dim = sobol_dim
+
+    def _sobol_normals(self, n_paths: int, n_levels: int, dim: int) -> np.ndarray:
+        """
+        Normals of shape ``(n_paths, n_levels, dim)``: Sobol on the first
+        ``sobol_dim`` coordinates (level-major), pseudo-random after.
+        """
+        from scipy.stats import qmc
+
+        d = min(n_levels * dim, self.sobol_dim)
+        sampler = qmc.Sobol(d=d, scramble=self.scramble, seed=self.rng)
+        u = sampler.random(n_paths)
+        # unscrambled sequences start at 0; keep the inverse CDF finite
+        np.clip(u, 1e-12, 1.0 - 1e-12, out=u)
+        z = np.empty((n_paths, n_levels * dim))
+        z[:, :d] = ndtri(u)
+        if d < z.shape[1]:
+            z[:, d:] = self.rng.standard_normal((n_paths, z.shape[1] - d))
+        return z.reshape(n_paths, n_levels, dim)
+
+    def iter_steps(self, n_paths, time_grid, dim):
+        times = np.asarray(time_grid, dtype=float)
+        n_steps = max(len(times) - 1, 0)
+        if n_steps == 0:
+            return
+        n_levels = min(n_steps, -(-self.sobol_dim // dim))
+
+        if not self.brownian_bridge:
+            z = self._sobol_normals(n_paths, n_levels, dim)
+            for i in range(n_levels):
+                yield z[:, i, :]
+            for _ in range(n_levels, n_steps):
+                yield self.rng.standard_normal((n_paths, dim))
+            return
+
+        # skeleton: the first n_levels bridge points, built from their
+        # bisection parents (which always come earlier in the schedule)
+        target, left, right, w_left, w_right, std = _brownian_bridge_schedule(times)
+        z = self._sobol_normals(n_paths, n_levels, dim)
+        skeleton = {0: np.zeros((n_paths, dim))}
+        for k in range(n_levels):
+            skeleton[target[k]] = (
+                w_left[k] * skeleton[left[k]] + w_right[k] * skeleton[right[k]] + std[k] * z[:, k, :]
+            )
+        del z
+        nodes = np.array(sorted(skeleton))
+
+        w = skeleton[0]
+        for i in range(n_steps):
+            nxt = int(nodes[np.searchsorted(nodes, i + 1)])
+            if nxt == i + 1:
+                w_next = skeleton[nxt]
+            else:
+                # Brownian bridge from (t_i, w) to the next skeleton point
+                t0, t1, tk = times[i], times[i + 1], times[nxt]
+                a = (t1 - t0) / (tk - t0)
+                sd = np.sqrt((t1 - t0) * (tk - t1) / (tk - t0))
+                w_next = w + a * (skeleton[nxt] - w) + sd * self.rng.standard_normal((n_paths, dim))
+            yield (w_next - w) / np.sqrt(times[i + 1] - times[i])
+            skeleton.pop(i, None)
+            w = w_next
+
+
+def as_normal_source(
+    source: Union[NormalSource, np.random.Generator, int, None],
+) -> NormalSource:
+    """
+    Coerce a seed, a ``numpy.random.Generator`` or a `NormalSource` into a
+    `NormalSource` (seeds and generators give `PseudoRandomNormals`).
+    """
+    if isinstance(source, NormalSource):
+        return source
+    return PseudoRandomNormals(source)
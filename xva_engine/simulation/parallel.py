@@ -0,0 +1,256 @@
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+from functools import partial
+from multiprocessing import shared_memory
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+import numpy as np
+from ..core.cube import RiskFactorCube, allocate_cube_array
+from ..core.time_grid import TimeGrid
+from .normals import NormalSource, PseudoRandomNormals
+
+
+# task(n_paths, normals) -> array of shape (n_paths, ...)
+ShardTask = Callable[[int, NormalSource], np.ndarray]
+NormalsFactory = Callable[[np.random.Generator], NormalSource]
+
+
+def shard_slices(n_paths: int, n_shards: int) -> List[slice]:
+    """
+    Split ``range(n_paths)`` into ``n_shards`` contiguous, near-equal slices.
+    """
+    if n_shards <= 0:
+        raise ValueError("n_shards must be a positive integer.")
+    bounds = np.linspace(0, n_paths, n_shards + 1).round().astype(int)
+    return [slice(int(a), int(b)) for a, b in zip(bounds[:-1], bounds[1:])]
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:  # Python < 3.13; workers share the parent's resource tracker
+        return shared_memory.SharedMemory(name=name)
+
+
+def _run_shard(
+    task: ShardTask,
+    normals_factory: NormalsFactory,
+    seed: np.random.SeedSequence,
+    sl: slice,
+    shape: Tuple[int, ...],
+    dtype: str,
+    shm_name: Optional[str],
+    path: Optional[str],
+) -> None:
+    normals = normals_factory(np.random.default_rng(seed))
+    values = task(sl.stop - sl.start, normals)
+
+    if path is not None:
+        target = np.load(path, mmap_mode="r+")
+        target[sl] = values
+        target.flush()
+        del target
+        return
+    shm = _attach(shm_name)
+    try:
+        np.ndarray(shape, dtype=dtype, buffer=shm.buf)[sl] = values
+    finally:
+        shm.close()
+
+
+class ParallelScenarioRunner:
+    """
+    Run a path simulation in independent scenario shards across processes.
+
+    The paths are split into a fixed number of shards, each seeded with
+    its own child of ``np.random.SeedSequence(seed)``. Since the shard
+    layout and seeds do not depend on the number of workers, the output
+    is bit-identical whether the shards run on 1 or 64 processes.
+
+    Parameters
+    ----------
+    n_shards : int
+        Number of scenario shards. Part of the random stream definition:
+        changing it changes the paths.
+    max_workers : int, optional
+        Worker processes (default: ``os.cpu_count()``). ``1`` runs the
+        shards in the calling process.
+    normals_factory : callable, optional
+        Builds each shard's `NormalSource` from its generator; defaults to
+        `PseudoRandomNormals`.
+
+    Notes
+    -----
+    Workers write their shard directly into a shared-memory cube (or into
+    the memory-mapped output file if ``out_path`` is given), so results
+    are never pickled back to the parent. Tasks and their arguments must
+    be picklable.
+    """
+
+    def __init__(
+        self,
+        n_shards: int = 64,
+        max_workers: Optional[int] = None,
+        normals_factory: Optional[NormalsFactory] = None,
+    ):
+        self.n_shards = n_shards
+        self.max_workers = max_workers
+        self.normals_factory = normals_factory or PseudoRandomNormals
+
+    def run(
+        self,
+        task: ShardTask,
+        n_paths: int,
+        path_shape: Sequence[int],
+        seed: Optional[int] = None,
+        dtype: Any = float,
+        out_path: Optional[str] = None,
+    ) -> np.ndarray:
+        """
+        Run ``task`` on every shard and assemble the output.
+
+        Parameters
+        ----------
+        task : callable
+            ``task(n_paths, normals)`` returning an array of shape
+            ``(n_paths, *path_shape)``.
+        n_paths : int
+            Total number of paths.
+        path_shape : sequence of int
+            Shape of a single path, e.g. ``(n_times, n_factors)``.
+        seed : int, optional
+            Root seed.
+        dtype : data-type
+            Output element type.
+        out_path : str, optional
+            If given, the output is a memory-mapped ``.npy`` file at this
+            path, written to directly by the workers.
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of shape ``(n_paths, *path_shape)``.
+        """
+        shape = (n_paths,) + tuple(path_shape)
+        dtype = np.dtype(dtype)
+        slices = shard_slices(n_paths, self.n_shards)
+        seeds = np.random.SeedSequence(seed).spawn(self.n_shards)
+        jobs = [(s, sl) for s, sl in zip(seeds, slices) if sl.stop > sl.start]
+
+        shm = None
+        if out_path is not None:
+            # create the file up front; workers reopen it in r+ mode
+            allocate_cube_array(shape, dtype=dtype, path=out_path).flush()
+        else:
+            shm = shared_memory.SharedMemory(create=True, size=max(int(np.prod(shape)) * dtype.itemsize, 1))
+
+        try:
+            run_shard = partial(
+                _run_shard,
+                task,
+                self.normals_factory,
+                shape=shape,
+                dtype=dtype.str,
+                shm_name=None if shm is None else shm.name,
+                path=out_path,
+            )
+            if self.max_workers == 1:
+                for s, sl in jobs:
+                    run_shard(s, sl)
+            else:
+                with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+                    for future in [pool.submit(run_shard, s, sl) for s, sl in jobs]:
+                        future.result()
+
+            if shm is None:
+                return np.load(out_path, mmap_mode="r+")
+            return np.ndarray(shape, dtype=dtype, buffer=shm.buf).copy()
+        finally:
+            if shm is not None:
+                shm.close()
+                shm.unlink()
+
+
+def _ubc_task(process, time_grid, mean_function, dtype, n_paths, normals):
+    y, _ = process.simulate(
+        time_grid=time_grid, mean_function=mean_function, n_paths=n_paths, normals=normals, dtype=dtype
+    )
+    return y
+
+
+def _hw1f_task(kwargs, n_paths, normals):
+    from .generators.benchmarks.ir_hull_white_1f_generator import simulate_hw1f_curve_paths
+    return simulate_hw1f_curve_paths(n_paths=n_paths, normals=normals, **kwargs)
+
+
+def _driver_task(driver, models, corr_model, time_grid, n_paths, normals):
+    shard_driver = type(driver)(replace(driver.config, n_scenarios=n_paths))
+    return shard_driver.run(models, corr_model, time_grid, normals=normals).data
+
+
+def simulate_ubc_parallel(
+    runner: ParallelScenarioRunner,
+    process,
+    time_grid: np.ndarray,
+    mean_function: np.ndarray,
+    n_paths: int,
+    seed: Optional[int] = None,
+    out_path: Optional[str] = None,
+    dtype: Any = float,
+) -> np.ndarray:
+    """
+    Sharded `UltimateBaseCurveProcess.simulate`; returns rates of shape
+    ``(n_paths, T, K)`` stored as ``dtype``.
+    """
+    time_grid = np.asarray(time_grid, dtype=float)
+    dtype = np.dtype(dtype)
+    task = partial(_ubc_task, process, time_grid, np.asarray(mean_function, dtype=float), dtype)
+    return runner.run(task, n_paths, (len(time_grid), process.K), seed=seed, dtype=dtype, out_path=out_path)
+
+
+def simulate_hw1f_parallel(
+    runner: ParallelScenarioRunner,
+    n_paths: int,
+    seed: Optional[int] = None,
+    out_path: Optional[str] = None,
+    **kwargs: Any,
+) -> np.ndarray:
+    """
+    Sharded `simulate_hw1f_curve_paths`; ``kwargs`` are its arguments other
+    than ``n_paths``, ``seed`` and ``normals`` (including ``dtype``).
+    """
+    n_times = len(np.asarray(kwargs["time_grid_years"]))
+    n_pillars = len(np.asarray(kwargs["pillars_days"]))
+    task = partial(_hw1f_task, kwargs)
+    return runner.run(
+        task, n_paths, (n_times, n_pillars), seed=seed, dtype=kwargs.get("dtype", float), out_path=out_path
+    )
+
+
+def run_driver_parallel(
+    runner: ParallelScenarioRunner,
+    driver,
+    models: Sequence[Any],
+    corr_model,
+    time_grid: TimeGrid,
+    seed: Optional[int] = None,
+    out_path: Optional[str] = None,
+) -> RiskFactorCube:
+    """
+    Sharded `SimulationDriver.run` over ``driver.config.n_scenarios`` paths.
+    """
+    n_paths = driver.config.n_scenarios
+    task = partial(_driver_task, driver, list(models), corr_model, time_grid)
+    data = runner.run(
+        task,
+        n_paths,
+        (len(time_grid.times), len(models)),
+        seed=seed,
+        dtype=driver.config.dtype,
+        out_path=out_path,
+    )
+    return RiskFactorCube(
+        data=data,
+        scenarios=list(range(n_paths)),
+        time_grid=time_grid,
+        factors=[m.name for m in models],
+    )
@@ -15,10 +15,26 @@ class MeanFunctionConfig:
     day_count: float = 365.0
 
 
+def evaluate_df0(df0: Callable[[float], float], times: np.ndarray) -> np.ndarray:
+    """
+    DF(0,t) on an array of times (years), same shape as times.
+
+    Uses the vectorised protocol df0.batch(times: ndarray) -> ndarray when the
+    curve provides it, else falls back to one scalar df0(t) call per time.
+    """
+    times = np.asarray(times, dtype=float)
+    batch = getattr(df0, "batch", None)
+    if batch is not None:
+        values = np.asarray(batch(times.ravel()), dtype=float)
+    else:
+        values = np.array([float(df0(ti)) for ti in times.ravel()], dtype=float)
+    return values.reshape(times.shape)
+
+
 def build_forward_forward_mean_function(
     time_grid: np.ndarray,                # (T,) year fractions
     pillars_days: np.ndarray,             # (K,) in days
-    df0: Callable[[float], float],        # discount factor DF(0,t), t in years
+    df0: Callable[[float], float],        # discount factor DF(0,t), t in years (df0.batch used if present)
     cfg: MeanFunctionConfig = MeanFunctionConfig(),
 ) -> np.ndarray:
     """
@@ -26,20 +42,15 @@ def build_forward_forward_mean_function(
       f_k(t) = -(1/M_k) ln( DF(0,t+M_k)/DF(0,t) )
       g_k(t) = max(f_k(t), delta_floor)
 
+    All T*(K+1) discount factors are evaluated in one call (see evaluate_df0).
     Returns array (T,K).
     """
     t = np.asarray(time_grid, dtype=float)
     M = np.asarray(pillars_days, dtype=float) / cfg.day_count  # (K,)
 
-    T = len(t)
-    K = len(M)
-    g = np.zeros((T, K), dtype=float)
-
-    for i, ti in enumerate(t):
-        df_t = float(df0(ti))
-        # compute DF(0, ti + M_k) for all k
-        df_tM = np.array([float(df0(ti + Mk)) for Mk in M], dtype=float)
-        f = -(1.0 / M) * np.log(df_tM / df_t)
-        g[i, :] = np.maximum(f, cfg.delta_floor)
+    # column 0: DF(0,t), columns 1..K: DF(0,t+M_k)
+    times = np.concatenate([t[:, None], t[:, None] + M[None, :]], axis=1)  # (T,K+1)
+    dfs = evaluate_df0(df0, times)
 
-    return g
+    f = -(1.0 / M) * np.log(dfs[:, 1:] / dfs[:, :1])
+    return np.maximum(f, cfg.delta_floor)
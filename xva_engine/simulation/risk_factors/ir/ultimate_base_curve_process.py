@@ -5,6 +5,9 @@ from typing import Optional
 
 import numpy as np
 
+from xva_engine.models.correlation import factorise_correlation
+from xva_engine.simulation.normals import NormalSource, PseudoRandomNormals
+
 
 @dataclass(frozen=True)
 class UltimateBaseCurveParams:
@@ -48,6 +51,22 @@ def ou_exact_step(x: np.ndarray, dt: float, lam: np.ndarray, sigma: np.ndarray,
     return expm * x + std * z
 
 
+def ou_step_tables(time_grid: np.ndarray, lam: np.ndarray, sigma: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Per-step exact OU decay e^{-lam dt} and innovation std, both (T-1,K).
+    Same formulas as ou_exact_step, computed once for the whole grid.
+    """
+    dt = np.diff(np.asarray(time_grid, dtype=float))[:, None]  # (T-1,1)
+    lam = np.asarray(lam, dtype=float)[None, :]
+    sigma = np.asarray(sigma, dtype=float)[None, :]
+
+    eps = 1e-14
+    lam_safe = np.where(np.abs(lam) < eps, eps, lam)
+    decay = np.exp(-lam * dt)
+    var = (sigma ** 2) * (1.0 - np.exp(-2.0 * lam_safe * dt)) / (2.0 * lam_safe)
+    return decay, np.sqrt(np.maximum(var, 0.0))
+
+
 def driver_variance(time_grid: np.ndarray, lam: np.ndarray, sigma: np.ndarray) -> np.ndarray:
     """
     Var[X_k(t)] for each t and k. Returns (T,K).
@@ -77,7 +96,12 @@ class UltimateBaseCurveProcess:
     Produces simulated per-pillar continuous zero rates Y(t,k).
     """
 
-    def __init__(self, params: UltimateBaseCurveParams, corr: Optional[np.ndarray] = None):
+    def __init__(
+        self,
+        params: UltimateBaseCurveParams,
+        corr: Optional[np.ndarray] = None,
+        max_rank: Optional[int] = None,
+    ):
         self.params = params
         self.K = int(len(np.asarray(params.pillars_days)))
 
@@ -96,8 +120,9 @@ class UltimateBaseCurveProcess:
                 raise ValueError(f"corr must be shape (K,K)=({self.K},{self.K}); got {corr.shape}")
             self.corr = corr
 
-        # stabilize SPD
-        self.chol = np.linalg.cholesky(self.corr + 1e-12 * np.eye(self.K))
+        # shared cached factorisation (Cholesky, PSD repair, or rank-truncated if max_rank < K)
+        self.factor = factorise_correlation(self.corr, max_rank=max_rank)
+        self.chol = self.factor.matrix
 
     def simulate(
         self,
@@ -106,13 +131,26 @@ class UltimateBaseCurveProcess:
         n_paths: int,
         seed: Optional[int] = None,
         return_driver: bool = False,
+        normals: Optional[NormalSource] = None,
+        dtype: np.dtype = np.float64,
+        block_steps: int = 16,
     ) -> tuple[np.ndarray, Optional[np.ndarray]]:
         """
         Returns:
           y: (n_paths, T, K) simulated zero rates
           x: (n_paths, T, K) driver paths if return_driver=True else None
+
+        normals: source of the independent normals (default: pseudo-random from seed)
+        dtype: dtype of the returned arrays (e.g. float32); the driver state is kept in float64
+        block_steps: number of time steps whose normals are drawn and correlated together
+
+        Fast path: OU decay/std tables are precomputed for the whole grid, normals are
+        drawn and correlated block_steps at a time (one matmul per block) and the state
+        and outputs are updated in place. Same numbers as stepping with ou_exact_step
+        and transform_shifted_exponential.
         """
-        rng = np.random.default_rng(seed)
+        if normals is None:
+            normals = PseudoRandomNormals(seed)
 
         time_grid = np.asarray(time_grid, dtype=float)
         T = len(time_grid)
@@ -120,25 +158,40 @@ class UltimateBaseCurveProcess:
             raise ValueError(f"mean_function must be (T,K)=({T},{self.K}), got {mean_function.shape}")
 
         v2_tk = driver_variance(time_grid, self.lam, self.sigma)  # (T,K)
+        decay, std = ou_step_tables(time_grid, self.lam, self.sigma)  # (T-1,K)
+        # transform Y = (g+s)*exp(x - v2/2) - s as tables
+        scale = mean_function + self.shift[None, :]  # (T,K)
+        half_v2 = 0.5 * v2_tk
 
         x = np.zeros((n_paths, self.K), dtype=float)
-        y = np.zeros((n_paths, T, self.K), dtype=float)
-        x_store = np.zeros_like(y) if return_driver else None
+        tmp = np.empty_like(x)
+        y = np.empty((n_paths, T, self.K), dtype=dtype)
+        x_store = np.empty_like(y) if return_driver else None
 
         # t=0
         y[:, 0, :] = transform_shifted_exponential(x, mean_function[0], self.shift, v2_tk[0])
         if return_driver:
             x_store[:, 0, :] = x
 
-        for i in range(1, T):
-            dt = time_grid[i] - time_grid[i - 1]
-            z = rng.standard_normal(size=(n_paths, self.K))
-            zc = z @ self.chol.T
-
-            x = ou_exact_step(x, dt, self.lam, self.sigma, zc)
-            y[:, i, :] = transform_shifted_exponential(x, mean_function[i], self.shift, v2_tk[i])
-
-            if return_driver:
-                x_store[:, i, :] = x
+        zc = None
+        for start, z in normals.iter_blocks(n_paths, time_grid, self.factor.rank, block_steps):
+            b = z.shape[0]
+            if zc is None or zc.shape[0] != b:
+                zc = np.empty((b, n_paths, self.K))
+            self.factor.apply(z, out=zc)  # correlate the whole block at once
+            zc *= std[start:start + b, None, :]
+
+            for j in range(b):
+                i = start + j + 1
+                np.multiply(x, decay[i - 1], out=x)
+                x += zc[j]
+
+                np.subtract(x, half_v2[i], out=tmp)
+                np.exp(tmp, out=tmp)
+                tmp *= scale[i]
+                np.subtract(tmp, self.shift, out=y[:, i, :], casting="same_kind")
+
+                if return_driver:
+                    x_store[:, i, :] = x
 
         return y, x_store
@@ -1,18 +1,241 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+from typing import Iterator, Optional, Sequence, Tuple, Union
+
 import numpy as np
 
+from xva_engine.core.cube import RiskFactorCube
+from xva_engine.core.time_grid import TimeGrid
+
+
+AXES = ("path", "time", "pillar")
+
+Indexer = Union[slice, int, Sequence[int], np.ndarray]
+
+
+def _as_slice(idx: Indexer, n: int) -> Union[slice, np.ndarray]:
+    """
+    Turn an indexer into a slice when possible (so numpy returns a view).
+    Integers keep their axis (length-1 slice); evenly spaced index lists become
+    strided slices; anything else stays an index array (numpy copies).
+    """
+    if isinstance(idx, slice):
+        return idx
+    if np.isscalar(idx):
+        i = int(idx) % n
+        return slice(i, i + 1)
+    arr = np.asarray(idx, dtype=np.intp) % n
+    if arr.size == 0:
+        return slice(0, 0)
+    if arr.size == 1:
+        return slice(int(arr[0]), int(arr[0]) + 1)
+    steps = np.diff(arr)
+    if steps[0] > 0 and np.all(steps == steps[0]):
+        return slice(int(arr[0]), int(arr[-1]) + 1, int(steps[0]))
+    return arr
+
 
 @dataclass(frozen=True)
-class IRScenarioCube:
+class ScenarioCube:
     """
-    Container for simulated interest-rate scenarios.
+    Simulated curve scenarios with named axes (path, time, pillar).
 
     rates[p, t, k] = simulated continuous zero rate at simulation time t
                      for remaining maturity corresponding to pillar k.
+
+    Single output type of the IR generators (Ultimate Base Curve, HW1F);
+    IRScenarioCube is an alias and IRRateCube a subclass keeping its
+    former ``zero_rates=`` constructor. Selections along the axes
+    (isel, scenario_block, time_window, pillar_subset) return cubes whose
+    arrays are numpy views of this one, so pricing and validation can work
+    on sub-cubes without copying.
     """
-    rates: np.ndarray               # (P, T, K)
-    time_grid_years: np.ndarray     # (T,)
-    pillars_days: np.ndarray        # (K,)
+    rates: np.ndarray                       # (P, T, K)
+    time_grid_years: np.ndarray             # (T,)
+    pillars_days: np.ndarray                # (K,)
     curve_id: str = "IR_BASE"
+    driver: Optional[np.ndarray] = None     # (P, T, K) OU drivers, if requested
+
+    def __post_init__(self):
+        rates = self.rates
+        if rates.ndim != 3:
+            raise ValueError(f"rates must be (paths, times, pillars); got shape {rates.shape}")
+        if rates.shape[1] != len(self.time_grid_years) or rates.shape[2] != len(self.pillars_days):
+            raise ValueError(
+                f"rates shape {rates.shape} does not match {len(self.time_grid_years)} times "
+                f"and {len(self.pillars_days)} pillars"
+            )
+        if self.driver is not None and self.driver.shape != rates.shape:
+            raise ValueError("driver must have the same shape as rates")
+
+    # --- axes ---------------------------------------------------------------
+
+    axes = AXES
+
+    @property
+    def shape(self) -> Tuple[int, int, int]:
+        return self.rates.shape
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self.rates.dtype
+
+    @property
+    def n_paths(self) -> int:
+        return self.rates.shape[0]
+
+    @property
+    def n_times(self) -> int:
+        return self.rates.shape[1]
+
+    @property
+    def n_pillars(self) -> int:
+        return self.rates.shape[2]
+
+    @property
+    def pillars_years(self) -> np.ndarray:
+        return np.asarray(self.pillars_days, dtype=float) / 365.0
+
+    # IRRateCube names
+    @property
+    def zero_rates(self) -> np.ndarray:
+        return self.rates
+
+    @property
+    def pillars(self) -> np.ndarray:
+        return self.pillars_years
+
+    # --- views --------------------------------------------------------------
+
+    def isel(
+        self,
+        path: Optional[Indexer] = None,
+        time: Optional[Indexer] = None,
+        pillar: Optional[Indexer] = None,
+    ) -> "ScenarioCube":
+        """
+        Select along named axes by position. Slices, integers (axis kept) and
+        evenly spaced index lists give views; other index lists copy.
+        """
+        sel = [slice(None)] * 3
+        for ax, idx in enumerate((path, time, pillar)):
+            if idx is not None:
+                sel[ax] = _as_slice(idx, self.rates.shape[ax])
+
+        def take(a: np.ndarray, ax: int) -> np.ndarray:
+            key = [slice(None)] * a.ndim
+            key[ax] = sel[ax]
+            return a[tuple(key)]
+
+        rates, driver = self.rates, self.driver
+        for ax in range(3):
+            rates = take(rates, ax)
+            driver = None if driver is None else take(driver, ax)
+        return replace(
+            self,
+            rates=rates,
+            time_grid_years=np.asarray(self.time_grid_years)[sel[1]],
+            pillars_days=np.asarray(self.pillars_days)[sel[2]],
+            driver=driver,
+        )
+
+    def scenario_block(self, sl: slice) -> "ScenarioCube":
+        """Paths sl (view)."""
+        return self.isel(path=sl)
+
+    def time_window(self, start: Optional[float] = None, stop: Optional[float] = None) -> "ScenarioCube":
+        """Simulation times in [start, stop] years (view)."""
+        t = np.asarray(self.time_grid_years, dtype=float)
+        i0 = 0 if start is None else int(np.searchsorted(t, start, side="left"))
+        i1 = len(t) if stop is None else int(np.searchsorted(t, stop, side="right"))
+        return self.isel(time=slice(i0, i1))
+
+    def pillar_subset(self, pillars: Indexer) -> "ScenarioCube":
+        """
+        Pillars by position (slice or indices). A view unless the indices
+        are irregularly spaced.
+        """
+        return self.isel(pillar=pillars)
+
+    def iter_blocks(self, axis: str = "path", size: Optional[int] = None) -> Iterator[Tuple[slice, "ScenarioCube"]]:
+        """
+        Iterate over blocks of paths or times, yielding (slice, sub-cube view).
+        """
+        if axis not in ("path", "time"):
+            raise ValueError(f"axis must be 'path' or 'time'; got {axis!r}")
+        n = self.n_paths if axis == "path" else self.n_times
+        size = max(n, 1) if size is None else size
+        if size <= 0:
+            raise ValueError("Block size must be a positive integer.")
+        for start in range(0, n, size):
+            sl = slice(start, min(start + size, n))
+            yield sl, self.isel(**{axis: sl})
+
+    # --- conversions --------------------------------------------------------
+
+    def factor_names(self) -> list[str]:
+        return [f"{self.curve_id}.{int(round(d))}D" for d in np.asarray(self.pillars_days, dtype=float)]
+
+    def to_risk_factor_cube(self) -> RiskFactorCube:
+        """
+        RiskFactorCube sharing the rates array (one factor per pillar,
+        named '<curve_id>.<days>D'), for the pricing layer.
+        """
+        return RiskFactorCube(
+            data=self.rates,
+            scenarios=list(range(self.n_paths)),
+            time_grid=TimeGrid(list(np.asarray(self.time_grid_years, dtype=float))),
+            factors=self.factor_names(),
+        )
+
+    @classmethod
+    def from_risk_factor_cube(
+        cls,
+        cube: RiskFactorCube,
+        pillars_days: np.ndarray,
+        curve_id: str = "IR_BASE",
+    ) -> "ScenarioCube":
+        """Wrap a RiskFactorCube whose factors are curve pillars (no copy)."""
+        return cls(
+            rates=cube.data,
+            time_grid_years=np.asarray(cube.time_grid.times, dtype=float),
+            pillars_days=np.asarray(pillars_days, dtype=float),
+            curve_id=curve_id,
+        )
+
+
+# previous name of the IR scenario container (same fields)
+IRScenarioCube = ScenarioCube
+
+
+class IRRateCube(ScenarioCube):
+    """
+    ScenarioCube with the former IRRateCube constructor, where the rates
+    are passed as ``zero_rates``:
+    ``IRRateCube(zero_rates, time_grid_years, pillars_days)``.
+    ``rates=`` is accepted too, so ``dataclasses.replace`` and the
+    selection methods keep working.
+    """
+
+    def __init__(
+        self,
+        zero_rates: Optional[np.ndarray] = None,
+        time_grid_years: Optional[np.ndarray] = None,
+        pillars_days: Optional[np.ndarray] = None,
+        curve_id: str = "IR_BASE",
+        driver: Optional[np.ndarray] = None,
+        *,
+        rates: Optional[np.ndarray] = None,
+    ):
+        if (zero_rates is None) == (rates is None):
+            raise TypeError("IRRateCube takes exactly one of zero_rates and rates.")
+        if time_grid_years is None or pillars_days is None:
+            raise TypeError("IRRateCube requires time_grid_years and pillars_days.")
+        super().__init__(
+            rates=zero_rates if rates is None else rates,
+            time_grid_years=time_grid_years,
+            pillars_days=pillars_days,
+            curve_id=curve_id,
+            driver=driver,
+        )
@@ -1,5 +1,7 @@
 import numpy as np
 
+from xva_engine.market_data.interpolation import SimulatedCurveInterpolator
+
 
 def pillars_years(pillars_days: np.ndarray, day_count: float = 365.0) -> np.ndarray:
     return np.asarray(pillars_days, dtype=float) / day_count
@@ -42,10 +44,7 @@ def interp_rate_at_maturity(rates_t: np.ndarray, M: np.ndarray, target: float) -
     rates_t: (P,K) rates across pillars at fixed time
     returns: (P,) interpolated rate at maturity target (years)
     """
-    out = np.empty(rates_t.shape[0], dtype=float)
-    for p in range(rates_t.shape[0]):
-        out[p] = np.interp(target, M, rates_t[p])
-    return out
+    return SimulatedCurveInterpolator(M, target)(rates_t)
 
 
 def df_wedge_one_step(
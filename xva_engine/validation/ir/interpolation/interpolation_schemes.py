@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import numpy as np
 
+from xva_engine.market_data.interpolation import SimulatedCurveInterpolator
+
 
 def _check_inputs(pillars: np.ndarray, zero_rates: np.ndarray) -> None:
     if pillars.ndim != 1:
@@ -41,10 +43,8 @@ def interp_zero_linear(pillars: np.ndarray, zero_rates: np.ndarray, grid: np.nda
     grid = np.asarray(grid)
     if grid.ndim != 1:
         raise ValueError("grid must be 1D.")
-    # np.interp supports 1D y only, so vectorize across leading dims
-    flat = zero_rates.reshape(-1, zero_rates.shape[-1])
-    out = np.vstack([np.interp(grid, pillars, row) for row in flat])
-    return out.reshape(zero_rates.shape[:-1] + (grid.shape[0],))
+    # shared pillars: bracket indices/weights computed once for all leading dims
+    return SimulatedCurveInterpolator(pillars, grid)(zero_rates)
 
 
 def interp_zero_logdf_linear(pillars: np.ndarray, zero_rates: np.ndarray, grid: np.ndarray) -> np.ndarray:
@@ -56,9 +56,7 @@ def interp_zero_logdf_linear(pillars: np.ndarray, zero_rates: np.ndarray, grid:
     df = discount_factors_from_zero(zero_rates, pillars)
     logdf = np.log(np.clip(df, 1e-16, None))
 
-    flat = logdf.reshape(-1, logdf.shape[-1])
-    out_logdf = np.vstack([np.interp(grid, pillars, row) for row in flat])
-    out_logdf = out_logdf.reshape(logdf.shape[:-1] + (grid.shape[0],))
+    out_logdf = SimulatedCurveInterpolator(pillars, np.asarray(grid, dtype=float))(logdf)
 
     out_df = np.exp(out_logdf)
     return zero_from_discount_factors(out_df, grid)
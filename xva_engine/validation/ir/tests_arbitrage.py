@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import numpy as np
 
+from xva_engine.market_data.interpolation import SimulatedCurveInterpolator
+
 
 def _pillars_years(pillars_days: np.ndarray, day_count: float = 365.0) -> np.ndarray:
     return np.asarray(pillars_days, dtype=float) / day_count
@@ -79,11 +81,8 @@ def _interp_rate_at_maturity(
     target: maturity in years
     returns: (P,) interpolated rate at target maturity
     """
-    # numpy interp works 1D; do per path
-    out = np.empty(rates_t.shape[0], dtype=float)
-    for p in range(rates_t.shape[0]):
-        out[p] = np.interp(target, M, rates_t[p])
-    return out
+    # shared pillar grid: one gather + weighted sum over all paths
+    return SimulatedCurveInterpolator(M, target)(rates_t)
 
 
 def df_wedge_one_step(
@@ -1,13 +1,14 @@
 from __future__ import annotations
+from typing import Callable
 import numpy as np
 
 
 def pfe_profile(exposures: np.ndarray, q: float) -> np.ndarray:
     """
     exposures: (P, T) exposure paths
-    returns: (T,) PFE profile at quantile q
+    returns: (T,) PFE profile at quantile q (computed in float64 whatever the input dtype)
     """
-    return np.quantile(exposures, q, axis=0)
+    return np.quantile(np.asarray(exposures, dtype=np.float64), q, axis=0)
 
 
 def pfe_delta(expo_a: np.ndarray, expo_b: np.ndarray, q: float) -> dict:
@@ -28,3 +29,24 @@ def pfe_delta(expo_a: np.ndarray, expo_b: np.ndarray, q: float) -> dict:
         "max_abs_delta": float(np.max(np.abs(delta))),
         "max_rel_delta": float(np.max(np.abs(rel))),
     }
+
+
+def precision_pfe_delta(
+    exposure_fn: Callable[[np.dtype], np.ndarray],
+    q: float,
+    low: np.dtype = np.float32,
+    high: np.dtype = np.float64,
+) -> dict:
+    """
+    Validation mode for compact cubes: PFE of a float32 run minus PFE of the float64 run.
+
+    exposure_fn: dtype -> (P, T) exposure paths, running the same simulation and
+                 pricing (same seed) with cubes stored in that dtype
+    returns: pfe_delta(low, high) plus the dtypes compared
+    """
+    expo_low = exposure_fn(np.dtype(low))
+    expo_high = exposure_fn(np.dtype(high))
+    out = pfe_delta(expo_low, expo_high, q)
+    out["dtype_a"] = str(np.asarray(expo_low).dtype)
+    out["dtype_b"] = str(np.asarray(expo_high).dtype)
+    return out